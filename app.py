@@ -1,13 +1,16 @@
 """Application Streamlit pour MomentKeeper."""
 
 import base64
+import html
 import importlib
+import random
 import sys
+import time
 import tkinter as tk
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 from tkinter import filedialog
+from typing import Any, Callable, Optional
 
 import streamlit as st
 
@@ -19,29 +22,57 @@ if "src.moment_keeper.translations" in sys.modules:
 
 from src.moment_keeper import __version__
 from src.moment_keeper.analytics import (
+    EtatAnalytique,
     calculate_metrics,
     create_charts,
-    extract_photo_data,
     find_gaps,
     generate_insights,
     get_gallery_data,
-    get_image_with_correct_orientation,
-    get_photo_caption_with_age,
-    get_photos_by_mode,
+    get_page_by_mode,
+    html_legende_age,
 )
 from src.moment_keeper.config import (
+    ANALYTICS_CACHE,
     FILE_TYPES,
+    GALLERY_CONFIG,
     GITHUB_REPO,
+    IO_THROTTLE,
     MAX_FILES_EXPANDER,
     MAX_FILES_PREVIEW,
     MAX_IGNORED_FILES_DISPLAY,
     PAGE_CONFIG,
+    THUMBNAIL_CONFIG,
 )
 from src.moment_keeper.config_manager import ConfigManager
+from src.moment_keeper.gallery import TOUS_LES_MOIS, IndexGalerie
+from src.moment_keeper.io_scheduler import (
+    PRIORITE_ARRIERE_PLAN,
+    PRIORITE_INTERACTIVE,
+    PRIORITE_NORMALE,
+    IOScheduler,
+)
 from src.moment_keeper.organizer import OrganisateurPhotos
+from src.moment_keeper.photo_copier import PhotoCopier
+from src.moment_keeper.results_cache import CacheResultats
+from src.moment_keeper.snapshot import (
+    charger_donnees_photos,
+    empreinte_dossiers,
+    enregistrer_snapshot,
+)
 from src.moment_keeper.theme import get_css_styles
+from src.moment_keeper.thumbnails import (
+    MagasinVignettes,
+    PrechargeurVignettes,
+    url_vignette,
+)
 from src.moment_keeper.translations import Translator
 
+# Vues de l'application (libellés : clés de traduction "tab_<vue>")
+VUES = ["home", "simulation", "organization", "analytics", "insights", "gallery"]
+
+# Intervalle minimal entre deux réécritures de la grille de la galerie (s)
+DELAI_RAFRAICHISSEMENT_GRILLE = 0.5
+
 
 def selectionner_dossier():
     """Ouvre une fenêtre de sélection de dossier avec gestion d'erreur robuste."""
@@ -88,6 +119,187 @@ def selectionner_dossier():
         return f"ERROR:{str(e)}"
 
 
+@st.cache_resource
+def cache_resultats() -> CacheResultats:
+    """Cache des résultats d'analyse partagé par toutes les sessions."""
+    return CacheResultats(ANALYTICS_CACHE["budget_octets"])
+
+
+def ordonnanceur_es() -> IOScheduler:
+    """Ordonnanceur d'entrées/sorties de la session : copies et lectures de la galerie.
+
+    Propre à chaque session : les limites du mode économe et le débit mesuré
+    d'une session ne touchent pas les autres.
+    """
+    if "ordonnanceur_es" not in st.session_state:
+        st.session_state.ordonnanceur_es = IOScheduler()
+    return st.session_state.ordonnanceur_es
+
+
+@st.cache_resource
+def magasin_vignettes() -> MagasinVignettes:
+    """Magasin de vignettes de la galerie partagé par toutes les sessions."""
+    return MagasinVignettes()
+
+
+@st.cache_resource
+def prechargeur_vignettes() -> PrechargeurVignettes:
+    """Pool de génération des vignettes partagé par toutes les sessions."""
+    return PrechargeurVignettes(magasin_vignettes())
+
+
+def precharger_galerie(
+    visibles: list[Path], page_suivante: list[Path]
+) -> PrechargeurVignettes:
+    """Demande les vignettes de la page affichée, puis celles de la suivante."""
+    taille = THUMBNAIL_CONFIG["taille_galerie"]
+    prechargeur = prechargeur_vignettes()
+    ordonnanceur = ordonnanceur_es()
+    prechargeur.demander(visibles, taille, PRIORITE_INTERACTIVE, ordonnanceur)
+    prechargeur.demander(page_suivante, taille, PRIORITE_NORMALE, ordonnanceur)
+    return prechargeur
+
+
+def source_vignette(fichier: Path) -> str:
+    """Source d'une vignette : son URL statique, sinon le JPEG en base64.
+
+    Sans `server.enableStaticServing`, Streamlit ne sert pas le dossier static/ :
+    le JPEG est alors intégré à la page comme auparavant.
+    """
+    if st.get_option("server.enableStaticServing"):
+        return url_vignette(fichier)
+    img_str = base64.b64encode(fichier.read_bytes()).decode()
+    return f"data:image/jpeg;base64,{img_str}"
+
+
+def html_image_galerie(source: str, nom: str) -> str:
+    """HTML d'une image carrée de la galerie."""
+    return (
+        f'<div class="gallery-image-container"><img src="{source}" '
+        f'class="gallery-image" alt="{html.escape(nom)}" loading="lazy"></div>'
+    )
+
+
+def html_grille_galerie(images: list[str], legendes: list[str]) -> str:
+    """HTML d'une page de la galerie : une grille CSS, une cellule par photo.
+
+    Toute la page tient dans un seul élément Streamlit, quelle que soit sa
+    taille (un seul message à envoyer au navigateur par mise à jour).
+    """
+    cellules = "".join(
+        f'<figure class="gallery-cell">{image}{legende}</figure>'
+        for image, legende in zip(images, legendes)
+    )
+    return f'<div class="gallery-grid">{cellules}</div>'
+
+
+def cle_resultats(cle_projet: tuple, langue: str, empreinte: Optional[str]):
+    """Clé des résultats d'analyse, ou None si les données sont provisoires.
+
+    `empreinte` est celle des dossiers dont les données sont tirées (voir
+    obtenir_etat_analytique) : elle change dès que des fichiers sont ajoutés,
+    déplacés ou supprimés, et les résultats en cache ne sont alors plus utilisés.
+    """
+    if empreinte is None:
+        return None
+    return cle_projet + (langue, empreinte)
+
+
+def resultat_analyse(cle: Optional[tuple], nom: str, calcul):
+    """Retourne un résultat d'analyse depuis le cache partagé (calculé si absent)."""
+    return cache_resultats().obtenir(None if cle is None else cle + (nom,), calcul)
+
+
+def invalider_resultats(dossier_racine: Path) -> None:
+    """Libère les résultats en cache d'un projet après organisation ou reset."""
+    cache_resultats().invalider((str(dossier_racine),))
+
+
+def executer_avec_etat_analytique(
+    organiseur: OrganisateurPhotos, cle_projet: tuple, operation: Callable[[], Any]
+) -> Any:
+    """Exécute une opération de l'organisateur en tenant l'état analytique à jour.
+
+    L'état de la session reçoit les changements de l'opération, puis est associé
+    à l'empreinte des dossiers à la fin de celle-ci. Un état qui ne correspond
+    déjà plus aux dossiers (changements faits hors de cette session) est
+    abandonné : il sera reconstruit à la prochaine lecture.
+    """
+    etat_session = st.session_state.get("etat_analytique")
+    suivi = (
+        etat_session is not None
+        and etat_session[0] == cle_projet
+        and etat_session[2] == empreinte_dossiers(organiseur.dossier_racine)
+    )
+    if not suivi:
+        st.session_state.pop("etat_analytique", None)
+        return operation()
+
+    etat = etat_session[1]
+    organiseur.ecouteurs.append(etat.recevoir)
+    try:
+        return operation()
+    finally:
+        st.session_state.etat_analytique = (
+            cle_projet,
+            etat,
+            empreinte_dossiers(organiseur.dossier_racine),
+        )
+
+
+def obtenir_etat_analytique(
+    organiseur: OrganisateurPhotos, cle_projet: tuple
+) -> tuple[EtatAnalytique, Optional[str]]:
+    """Retourne l'état analytique du projet, mis à jour sans nouveau parcours.
+
+    L'état conservé dans la session n'est réutilisé que si les dossiers ont
+    encore l'empreinte relevée après le dernier changement qu'il a reçu ;
+    sinon (fichiers ajoutés hors de l'application, organisation depuis une
+    autre session) il est reconstruit.
+
+    Returns:
+        (état, empreinte) où empreinte est celle des dossiers dont l'état est
+        tiré, ou None si les données proviennent d'un instantané en cours de
+        rafraîchissement
+    """
+    empreinte = empreinte_dossiers(organiseur.dossier_racine)
+    etat_session = st.session_state.get("etat_analytique")
+    if etat_session and etat_session[0] == cle_projet:
+        if etat_session[2] == empreinte:
+            etat = etat_session[1]
+            if etat.appliquer():
+                # L'instantané suit l'état : aucun parcours au prochain démarrage
+                enregistrer_snapshot(organiseur, etat.df, empreinte)
+            return etat, empreinte
+        st.session_state.pop("etat_analytique", None)
+
+    df_photos, a_jour = charger_donnees_photos(organiseur)
+    etat = EtatAnalytique(organiseur, df_photos)
+    if not a_jour:
+        # Un instantané périmé n'est pas conservé : il sera relu une fois rafraîchi
+        return etat, None
+    # Empreinte relevée avant la lecture : un changement pendant celle-ci
+    # fera reconstruire l'état au prochain appel
+    st.session_state.etat_analytique = (cle_projet, etat, empreinte)
+    return etat, empreinte
+
+
+def donnees_galerie(organiseur: OrganisateurPhotos, cle_projet: tuple) -> IndexGalerie:
+    """Retourne l'index des photos de la galerie, conservé dans la session.
+
+    Les dossiers ne sont reparcourus (et l'index reconstruit) que si leur
+    empreinte (un stat par dossier) a changé depuis le dernier parcours.
+    """
+    empreinte = empreinte_dossiers(organiseur.dossier_racine)
+    galerie_session = st.session_state.get("donnees_galerie")
+    if galerie_session and galerie_session[:2] == (cle_projet, empreinte):
+        return galerie_session[2]
+
+    index = IndexGalerie(get_gallery_data(organiseur), organiseur)
+    st.session_state.donnees_galerie = (cle_projet, empreinte, index)
+    return index
+
+
 def save_configuration(config_manager: ConfigManager):
     """Sauvegarde la configuration actuelle."""
     config = {
@@ -108,6 +320,868 @@ def save_configuration(config_manager: ConfigManager):
     config_manager.save_config(config)
 
 
+def afficher_accueil(temp_tr: Translator):
+    """Vue Accueil : présentation de l'application."""
+    # 🦖 Header principal avec style T-Rex
+    st.markdown(
+        f"""
+        <div class="main-header">
+            <h1>{temp_tr.t("app_title")}</h1>
+            <p><strong>{temp_tr.t("tagline")}</strong></p>
+            <p>{temp_tr.t("subtitle")}</p>
+        </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+    # Zone d'explication de l'application
+    st.markdown(
+        f"""
+        <div style="background-color: #f0f8ff; padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;">
+            <h3 style="color: #2C3E50; margin-bottom: 0.5rem;">🤔 {temp_tr.t("welcome_title")}</h3>
+            <p style="color: #7F8C8D; margin-bottom: 0.8rem;">{temp_tr.t("welcome_description")}</p>
+            <ul style="color: #7F8C8D; margin-left: 1.5rem;">
+                <li>{temp_tr.t("welcome_feature_1")}</li>
+                <li>{temp_tr.t("welcome_feature_2")}</li>
+                <li>{temp_tr.t("welcome_feature_3")}</li>
+                <li>{temp_tr.t("welcome_feature_4")}</li>
+                <li>{temp_tr.t("welcome_feature_5")}</li>
+            </ul>
+        </div>
+
+        <div style="background-color: #e8f4f8; padding: 1.2rem; border-radius: 10px; margin-top: 1rem;">
+            <h4 style="color: #2C3E50; margin-bottom: 0.8rem;">{temp_tr.t("welcome_steps_title")}</h4>
+            <div style="color: #7F8C8D; line-height: 1.8;">
+                <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_1")}</p>
+                <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_2")}</p>
+                <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_3")}</p>
+                <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_4")}</p>
+                <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_5")}</p>
+            </div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+def afficher_simulation(
+    tr: Translator,
+    organiseur: Optional[OrganisateurPhotos],
+    cle_plan: Optional[tuple],
+):
+    """Vue Simulation : répartition prévue, sans déplacer de fichiers."""
+    st.markdown(
+        f'<div class="trex-message">{tr.t("simulation_title")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    if organiseur is None:
+        st.info(tr.t("configure_settings_first"))
+        return
+
+    type_fichiers = organiseur.type_fichiers
+    if st.button(tr.t("analyze_button")):
+        # Marquer la page comme chargée après la première interaction
+        st.session_state.page_loaded = True
+        try:
+            with st.spinner(tr.t("analyzing")):
+                # Empreinte prise avant le plan : un changement pendant le
+                # calcul invalide aussi le plan
+                empreinte = empreinte_dossiers(organiseur.dossier_racine)
+                plan = organiseur.planifier()
+                repartition, erreurs = plan.repartition, plan.conflits
+                taille_dossier_gb = plan.taille_totale_gb
+                fichiers_ignores = plan.fichiers_ignores
+            # Le plan est réutilisé par l'onglet Organisation
+            st.session_state.plan_organisation = (cle_plan, empreinte, plan)
+        except Exception as e:
+            st.error(f"Erreur lors de l'analyse : {str(e)}")
+            st.info(
+                "Vérifiez que les dossiers existent et contiennent des photos au bon format (YYYYMMDD_*.jpg)"
+            )
+            repartition = None
+            erreurs = []
+            fichiers_ignores = []
+
+        if repartition:
+            total_photos = sum(len(f) for f in repartition.values())
+
+            if type_fichiers == FILE_TYPES["both"]:
+                # Compter photos et vidéos séparément
+                total_photos_count = sum(
+                    len([f for f in fichiers if organiseur.get_file_type(f) == "photo"])
+                    for fichiers in repartition.values()
+                )
+                total_videos_count = sum(
+                    len([f for f in fichiers if organiseur.get_file_type(f) == "video"])
+                    for fichiers in repartition.values()
+                )
+                message = tr.t(
+                    "success_simulation_mixed_with_size",
+                    photos=total_photos_count,
+                    videos=total_videos_count,
+                    size=taille_dossier_gb,
+                )
+            elif "Photos" in type_fichiers:
+                message = tr.t(
+                    "success_simulation_with_size",
+                    photos=total_photos,
+                    size=taille_dossier_gb,
+                )
+            else:
+                message = tr.t(
+                    "success_simulation_with_size",
+                    photos=total_photos,
+                    size=taille_dossier_gb,
+                )
+
+            st.markdown(
+                f'<div class="trex-success">{message}</div>',
+                unsafe_allow_html=True,
+            )
+
+            # Fonction pour extraire le nombre du début du nom de dossier
+            def extract_month_number(folder_name):
+                # Extrait le premier nombre du nom du dossier (ex: "0-1months" -> 0)
+                try:
+                    return int(folder_name.split("-")[0])
+                except:
+                    return 999  # Valeur par défaut pour les dossiers non standards
+
+            for dossier, fichiers in sorted(
+                repartition.items(),
+                key=lambda x: extract_month_number(x[0]),
+            ):
+                if type_fichiers == FILE_TYPES["both"]:
+                    # Séparer photos et vidéos
+                    photos = [
+                        f for f in fichiers if organiseur.get_file_type(f) == "photo"
+                    ]
+                    videos = [
+                        f for f in fichiers if organiseur.get_file_type(f) == "video"
+                    ]
+
+                    with st.expander(
+                        f"📁 {dossier} ({len(photos)} 📸 + {len(videos)} 🎬)"
+                    ):
+                        if photos:
+                            st.write("📸 **Photos:**")
+                            for photo in photos[:MAX_FILES_EXPANDER]:
+                                st.text(f"  📸 {photo.name}")
+                            if len(photos) > MAX_FILES_EXPANDER:
+                                st.text(
+                                    f"  ... et {len(photos) - MAX_FILES_EXPANDER} autres photos"
+                                )
+
+                        if videos:
+                            st.write("🎬 **Vidéos:**")
+                            for video in videos[:MAX_FILES_EXPANDER]:
+                                st.text(f"  🎬 {video.name}")
+                            if len(videos) > MAX_FILES_EXPANDER:
+                                st.text(
+                                    f"  ... et {len(videos) - MAX_FILES_EXPANDER} autres vidéos"
+                                )
+                else:
+                    # Affichage normal pour un seul type
+                    type_emoji = "📸" if "Photos" in type_fichiers else "🎬"
+                    type_nom = (
+                        tr.t("photos_unit")
+                        if "Photos" in type_fichiers
+                        else tr.t("videos_unit")
+                    )
+
+                    with st.expander(f"📁 {dossier} ({len(fichiers)} {type_nom})"):
+                        for fichier in fichiers[:MAX_FILES_PREVIEW]:
+                            st.text(f"  {type_emoji} {fichier.name}")
+                        if len(fichiers) > MAX_FILES_PREVIEW:
+                            st.text(
+                                tr.t(
+                                    "and_more",
+                                    count=len(fichiers) - MAX_FILES_PREVIEW,
+                                )
+                            )
+        else:
+            st.info(tr.t("no_files_found"))
+
+            # Afficher des informations de débogage
+            if fichiers_ignores:
+                with st.expander(tr.t("debug_details")):
+                    st.write(
+                        f"{tr.t('birth_date_configured')}{organiseur.date_naissance.date()}"
+                    )
+                    st.write(f"{tr.t('ignored_files_count')}{len(fichiers_ignores)}")
+
+                    # Afficher quelques exemples
+                    for nom, raison in fichiers_ignores[:MAX_IGNORED_FILES_DISPLAY]:
+                        st.text(f"  - {nom}: {raison}")
+
+                    if len(fichiers_ignores) > MAX_IGNORED_FILES_DISPLAY:
+                        st.text(
+                            f"  ... et {len(fichiers_ignores) - MAX_IGNORED_FILES_DISPLAY} autres"
+                        )
+
+        if erreurs:
+            st.warning(tr.t("warnings"))
+            for erreur in erreurs:
+                st.warning(erreur)
+
+
+def afficher_organisation(
+    tr: Translator,
+    organiseur: Optional[OrganisateurPhotos],
+    cle_plan: Optional[tuple],
+):
+    """Vue Organisation : exécution du plan de rangement."""
+    st.markdown(
+        f'<div class="trex-message">{tr.t("organization_title")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    if organiseur is None:
+        st.info(tr.t("configure_settings_first"))
+        return
+
+    type_fichiers = organiseur.type_fichiers
+    st.markdown(
+        f'<div class="trex-warning">{tr.t("organization_warning")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        type_text = (
+            tr.t("photos_unit")
+            if "Photos" in type_fichiers
+            else (
+                tr.t("videos_unit") if "Vidéos" in type_fichiers else tr.t("files_unit")
+            )
+        )
+        confirmer = st.checkbox(tr.t("confirm_organize", type=type_text))
+
+    mode_copie = st.checkbox(
+        tr.t("copy_mode"), help=tr.t("copy_mode_help"), key="copy_mode"
+    )
+    mode_econome = st.checkbox(
+        tr.t("eco_mode"), help=tr.t("eco_mode_help"), key="eco_mode"
+    )
+    if mode_econome:
+        col_debit, col_ops = st.columns(2)
+        with col_debit:
+            debit_mo = st.number_input(
+                tr.t("eco_mode_bandwidth"),
+                min_value=1,
+                value=IO_THROTTLE["octets_par_seconde"] // (1024 * 1024),
+            )
+        with col_ops:
+            operations_max = st.number_input(
+                tr.t("eco_mode_iops"),
+                min_value=1,
+                value=IO_THROTTLE["operations_par_seconde"],
+            )
+        ordonnanceur_es().limiter(debit_mo * 1024 * 1024, operations_max)
+    else:
+        ordonnanceur_es().limiter(None, None)
+    # Copies et vignettes de la session partagent son ordonnanceur : en mode
+    # économe, les copies cèdent la place aux lectures de la galerie
+    organiseur.copieur = PhotoCopier(
+        ordonnanceur_es(),
+        priorite=PRIORITE_ARRIERE_PLAN if mode_econome else PRIORITE_NORMALE,
+    )
+
+    with col2:
+        if st.button(tr.t("organize_button"), disabled=not confirmer):
+            st.session_state.page_loaded = True
+            barre_progression = st.progress(0.0, text=tr.t("organizing"))
+
+            def afficher_progression(traites, total, mesures):
+                barre_progression.progress(
+                    traites / total,
+                    text=tr.t(
+                        "organize_progress",
+                        done=traites,
+                        total=total,
+                        speed=mesures["octets_par_seconde"] / (1024 * 1024),
+                        ops=mesures["operations_par_seconde"],
+                    ),
+                )
+
+            # Réutiliser le plan de la simulation s'il correspond au projet et
+            # si aucun fichier n'a été ajouté, supprimé ou déplacé depuis
+            plan_simule = st.session_state.pop("plan_organisation", None)
+            plan = None
+            if plan_simule and plan_simule[:2] == (
+                cle_plan,
+                empreinte_dossiers(organiseur.dossier_racine),
+            ):
+                plan = plan_simule[2]
+            executer = (
+                organiseur.organiser_par_copie if mode_copie else organiseur.organiser
+            )
+            nb_fichiers, erreurs = executer_avec_etat_analytique(
+                organiseur,
+                cle_plan,
+                lambda: executer(progression=afficher_progression, plan=plan),
+            )
+            invalider_resultats(organiseur.dossier_racine)
+            barre_progression.empty()
+
+            if nb_fichiers > 0:
+                if type_fichiers == FILE_TYPES["both"]:
+                    type_text = tr.t("files_unit")
+                elif "Photos" in type_fichiers:
+                    type_text = tr.t("photos_unit")
+                else:
+                    type_text = tr.t("videos_unit")
+
+                message = tr.t("success_organize", count=nb_fichiers, type=type_text)
+                st.markdown(
+                    f'<div class="trex-success">{message}</div>',
+                    unsafe_allow_html=True,
+                )
+
+            if erreurs:
+                st.error(tr.t("errors_occurred"))
+                for erreur in erreurs:
+                    st.error(erreur)
+
+
+def afficher_analytics(
+    tr: Translator,
+    organiseur: Optional[OrganisateurPhotos],
+    cle_plan: Optional[tuple],
+):
+    """Vue Analytics : métriques et graphiques de la bibliothèque."""
+    st.markdown(
+        f'<div class="trex-message">{tr.t("analytics_title")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    if organiseur is None:
+        st.info(tr.t("configure_settings_first"))
+        return
+
+    type_fichiers = organiseur.type_fichiers
+    # Extraire les données des photos (instantané si disponible)
+    with st.spinner(tr.t("calculating_stats")):
+        etat, empreinte = obtenir_etat_analytique(organiseur, cle_plan)
+        df_photos, aggregates = etat.df, etat.aggregates
+        cle = cle_resultats(cle_plan, tr.language, empreinte)
+        metrics = resultat_analyse(
+            cle,
+            "metrics",
+            lambda: calculate_metrics(df_photos, type_fichiers, aggregates),
+        )
+
+    if empreinte is None:
+        st.caption(tr.t("snapshot_refreshing"))
+
+    if df_photos.empty:
+        st.info(tr.t("no_data_analytics"))
+    else:
+        # Métriques principales en colonnes (3x2 layout)
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            if type_fichiers == FILE_TYPES["both"]:
+                st.metric(
+                    "📸 Photos" if tr.language == "fr" else "📸 Photos",
+                    metrics["total_photos"],
+                    delta=(
+                        f"{metrics['total_photos'] / metrics['total_fichiers'] * 100:.0f}% du total"
+                        if tr.language == "fr"
+                        else (
+                            f"{metrics['total_photos'] / metrics['total_fichiers'] * 100:.0f}% of total"
+                            if metrics["total_fichiers"] > 0
+                            else None
+                        )
+                    ),
+                )
+            else:
+                label = (
+                    tr.t("photos_kept")
+                    if "Photos" in type_fichiers
+                    else tr.t("videos_kept")
+                )
+                st.metric(
+                    label,
+                    metrics["total_fichiers"],
+                    delta=(
+                        tr.t("precious_memories")
+                        if metrics["total_fichiers"] > 0
+                        else None
+                    ),
+                )
+            st.metric(
+                tr.t("last_capture"),
+                (
+                    metrics["derniere_photo"].strftime("%d/%m/%Y")
+                    if metrics["derniere_photo"]
+                    else "N/A"
+                ),
+                delta=tr.t("recent") if metrics["derniere_photo"] else None,
+            )
+
+        with col2:
+            if type_fichiers == FILE_TYPES["both"]:
+                st.metric(
+                    "🎬 Vidéos" if tr.language == "fr" else "🎬 Videos",
+                    metrics["total_videos"],
+                    delta=(
+                        f"{metrics['total_videos'] / metrics['total_fichiers'] * 100:.0f}% du total"
+                        if tr.language == "fr"
+                        else (
+                            f"{metrics['total_videos'] / metrics['total_fichiers'] * 100:.0f}% of total"
+                            if metrics["total_fichiers"] > 0
+                            else None
+                        )
+                    ),
+                )
+            else:
+                st.metric(
+                    tr.t("growth_period"),
+                    f"{metrics['periode_couverte']} mois",
+                    delta=(
+                        tr.t("growing_fast")
+                        if metrics["periode_couverte"] > 6
+                        else None
+                    ),
+                )
+            st.metric(
+                tr.t("daily_record"),
+                f"{metrics['jour_record']} photos",
+                delta=(tr.t("burst_mode") if metrics["jour_record"] >= 10 else None),
+            )
+
+        with col3:
+            st.metric(
+                tr.t("average_rhythm"),
+                f"{metrics['moyenne_par_mois']:.1f}/mois",
+                delta=(
+                    tr.t("regular")
+                    if metrics["moyenne_par_mois"] >= 20
+                    else tr.t("can_do_better")
+                ),
+            )
+            st.metric(
+                tr.t("longest_gap"),
+                f"{metrics['max_gap']} jours",
+                delta=(
+                    tr.t("trex_sleeping")
+                    if metrics["max_gap"] >= 7
+                    else tr.t("well_followed")
+                ),
+            )
+
+        st.divider()
+
+        # Graphiques
+        charts = resultat_analyse(
+            cle,
+            "charts",
+            lambda: create_charts(df_photos, tr, aggregates),
+        )
+
+        if charts:
+            # Graphique en barres
+            if "barres" in charts:
+                st.plotly_chart(charts["barres"], use_container_width=True)
+
+            # Timeline et heatmap en colonnes
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if "timeline" in charts:
+                    st.plotly_chart(charts["timeline"], use_container_width=True)
+
+            with col2:
+                if "heatmap" in charts:
+                    st.plotly_chart(charts["heatmap"], use_container_width=True)
+
+            # Alertes visuelles pour les gaps
+            gaps = resultat_analyse(
+                cle,
+                "gaps",
+                lambda: find_gaps(df_photos, aggregates=aggregates),
+            )
+            if gaps:
+                st.subheader(tr.t("temporal_alerts"))
+                for gap_start, gap_end, gap_days in gaps:
+                    if gap_days >= 5:
+                        st.warning(
+                            tr.t(
+                                "gap_alert",
+                                days=gap_days,
+                                start=gap_start.strftime("%d/%m/%Y"),
+                                end=gap_end.strftime("%d/%m/%Y"),
+                            )
+                        )
+
+
+def afficher_insights(
+    tr: Translator,
+    organiseur: Optional[OrganisateurPhotos],
+    cle_plan: Optional[tuple],
+):
+    """Vue Insights : découvertes et suggestions."""
+    st.markdown(
+        f'<div class="trex-message">{tr.t("insights_title")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    if organiseur is None:
+        st.info(tr.t("configure_settings_first"))
+        return
+
+    type_fichiers = organiseur.type_fichiers
+    # État et métriques partagés avec la vue Analytics (session et cache)
+    with st.spinner(tr.t("searching_data")):
+        etat, empreinte = obtenir_etat_analytique(organiseur, cle_plan)
+        df_photos, aggregates = etat.df, etat.aggregates
+        cle = cle_resultats(cle_plan, tr.language, empreinte)
+        metrics = resultat_analyse(
+            cle,
+            "metrics",
+            lambda: calculate_metrics(df_photos, type_fichiers, aggregates),
+        )
+
+    # Messages d'insights (dépendent aussi de la date du jour)
+    insights = resultat_analyse(
+        cle,
+        f"insights_{datetime.now():%Y%m%d}",
+        lambda: generate_insights(
+            df_photos,
+            metrics,
+            organiseur.date_naissance,
+            type_fichiers,
+            tr,
+            aggregates,
+        ),
+    )
+
+    if insights:
+        st.markdown(tr.t("discoveries"))
+        for insight in insights:
+            st.markdown(
+                f'<div class="insight-bubble">{insight}</div>',
+                unsafe_allow_html=True,
+            )
+
+        st.divider()
+
+        # Section détails si il y a des données
+        if not df_photos.empty:
+            st.subheader(tr.t("detailed_analysis"))
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.write(tr.t("monthly_distribution"))
+                photos_par_mois = aggregates.photos_par_mois
+                for mois, nb in photos_par_mois.head(5).items():
+                    st.write(
+                        tr.t(
+                            "months_pattern",
+                            start=mois,
+                            end=mois + 1,
+                            count=nb,
+                        )
+                    )
+                if len(photos_par_mois) > 5:
+                    st.write(
+                        tr.t(
+                            "and_other_months",
+                            count=len(photos_par_mois) - 5,
+                        )
+                    )
+
+            with col2:
+                st.write(tr.t("favorite_days"))
+                if tr.language == "fr":
+                    jours_map = {
+                        "Monday": "Lundi",
+                        "Tuesday": "Mardi",
+                        "Wednesday": "Mercredi",
+                        "Thursday": "Jeudi",
+                        "Friday": "Vendredi",
+                        "Saturday": "Samedi",
+                        "Sunday": "Dimanche",
+                    }
+                else:
+                    jours_map = {
+                        "Monday": "Monday",
+                        "Tuesday": "Tuesday",
+                        "Wednesday": "Wednesday",
+                        "Thursday": "Thursday",
+                        "Friday": "Friday",
+                        "Saturday": "Saturday",
+                        "Sunday": "Sunday",
+                    }
+                photos_par_jour = aggregates.photos_par_jour_semaine.sort_values(
+                    ascending=False
+                )
+                for jour_en, nb in photos_par_jour.head(3).items():
+                    jour_localized = jours_map.get(jour_en, jour_en)
+                    st.write(tr.t("photos_count", day=jour_localized, count=nb))
+
+            # Suggestions d'amélioration
+            st.subheader(tr.t("suggestions"))
+
+            gaps = resultat_analyse(
+                cle,
+                "gaps_7",
+                lambda: find_gaps(df_photos, min_gap_days=7, aggregates=aggregates),
+            )
+            if gaps:
+                st.write(tr.t("not_to_miss"))
+                st.write(tr.t("think_weekday_photos"))
+                st.write(tr.t("capture_daily_moments"))
+
+            if metrics["moyenne_par_mois"] < 10:
+                st.write(tr.t("enrich_memories"))
+                st.write(tr.t("more_photos_evolution"))
+                st.write(tr.t("small_moments_matter"))
+        else:
+            st.info(tr.t("analyze_first"))
+
+
+def afficher_galerie(
+    tr: Translator,
+    organiseur: Optional[OrganisateurPhotos],
+    cle_plan: Optional[tuple],
+):
+    """Vue Galerie : sélection de photos par mois."""
+    st.markdown(
+        f'<div class="trex-message">{tr.t("gallery_title")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    if organiseur is None:
+        st.info(tr.t("configure_settings_first"))
+        return
+
+    # Obtenir les données de la galerie
+    with st.spinner(tr.t("searching_data")):
+        index = donnees_galerie(organiseur, cle_plan)
+
+    if not index.par_mois:
+        st.info(tr.t("no_photos_month"))
+        return
+
+    afficher_grille_galerie(tr, organiseur, index)
+
+
+@st.fragment
+def afficher_grille_galerie(
+    tr: Translator, organiseur: OrganisateurPhotos, index: IndexGalerie
+):
+    """Contrôles et grille de la galerie.
+
+    Fragment : changer de mois, de mode ou de nombre de photos ne réexécute que
+    cette fonction, avec l'index de galerie de la dernière exécution complète.
+    """
+    baby_name = st.session_state.baby_name
+
+    # Contrôles de l'interface
+    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
+
+    with col1:
+        # Mois disponibles, déjà triés par l'index
+        months_available = [TOUS_LES_MOIS] + index.mois_tries
+
+        selected_month = st.selectbox(tr.t("select_month"), months_available, index=0)
+
+    with col2:
+        # Sélecteur de mode d'affichage
+        view_modes = [
+            tr.t("mode_random"),
+            tr.t("mode_chronological"),
+            tr.t("mode_highlights"),
+            tr.t("mode_timeline"),
+        ]
+
+        view_mode = st.selectbox(
+            tr.t("view_mode"),
+            view_modes,
+            index=0,
+            help=tr.t("view_mode_help"),
+        )
+
+    with col3:
+        # Taille de page : la galerie se parcourt ensuite page par page
+        taille_page = st.select_slider(
+            tr.t("photos_per_page"),
+            options=GALLERY_CONFIG["tailles_page"],
+            value=GALLERY_CONFIG["taille_page"],
+        )
+
+    with col4:
+        # Nouvelle graine : les autres reruns redonnent la même sélection
+        nouvelles_photos = st.button(tr.t("refresh_gallery"), type="secondary")
+        if nouvelles_photos or "graine_galerie" not in st.session_state:
+            st.session_state.graine_galerie = random.getrandbits(32)
+
+    # Afficher le nombre de photos trouvées
+    if view_mode == tr.t("mode_timeline"):
+        # Pour le mode timeline, afficher le nombre de mois disponibles
+        if baby_name.strip():
+            message = tr.t(
+                "months_growth_available",
+                count=len(index.ages),
+                name=baby_name.strip(),
+            )
+            st.info(f"📈 {message}")
+        else:
+            message = tr.t(
+                "months_growth_available_no_name",
+                count=len(index.ages),
+            )
+            st.info(f"📈 {message}")
+    else:
+        month_photos = index.nombre_photos(selected_month)
+        if baby_name.strip():
+            message = tr.t(
+                "photos_found_with_name",
+                count=month_photos,
+                name=baby_name.strip(),
+            )
+            st.info(message)
+        else:
+            st.info(tr.t("photos_found", count=month_photos))
+
+    # Obtenir et afficher les photos selon le mode sélectionné
+    # Curseurs des pages déjà parcourues (le dernier est la page affichée),
+    # remis à zéro dès que la sélection change
+    graine = st.session_state.graine_galerie
+    cle_pagination = (view_mode, selected_month, taille_page, graine, index)
+    pagination = st.session_state.get("pagination_galerie")
+    if pagination is None or pagination[0] != cle_pagination:
+        pagination = (cle_pagination, [None])
+        st.session_state.pagination_galerie = pagination
+    curseurs = pagination[1]
+
+    selected_photos, curseur_suivant = get_page_by_mode(
+        index, view_mode, selected_month, curseurs[-1], taille_page, graine
+    )
+
+    if selected_photos:
+        magasin = magasin_vignettes()
+        taille = THUMBNAIL_CONFIG["taille_galerie"]
+        page_suivante = []
+        if curseur_suivant is not None:
+            page_suivante, _ = get_page_by_mode(
+                index, view_mode, selected_month, curseur_suivant, taille_page, graine
+            )
+        prechargeur = precharger_galerie(selected_photos, page_suivante)
+
+        # Légendes tirées de l'âge précalculé par l'index
+        legendes = [
+            html_legende_age(photo_path.name, *index.ages_photos[photo_path], tr)
+            for photo_path in selected_photos
+        ]
+
+        images = []
+        # Cellules en attente du pool (aperçu EXIF ou emplacement vide)
+        a_completer = []
+        for rang, photo_path in enumerate(selected_photos):
+            try:
+                if magasin.contient(photo_path, taille):
+                    fichier = magasin.fichier_vignette(photo_path, taille)
+                    images.append(
+                        html_image_galerie(source_vignette(fichier), photo_path.name)
+                    )
+                    continue
+                # En cours de génération : aperçu EXIF, sans décodage
+                a_completer.append(rang)
+                apercu = magasin.fichier_apercu(photo_path, ordonnanceur_es())
+                images.append(
+                    html_image_galerie(source_vignette(apercu), photo_path.name)
+                    if apercu is not None
+                    else '<div class="gallery-image-placeholder"></div>'
+                )
+            except Exception as e:
+                erreur = html.escape(
+                    f"Erreur lors du chargement de {photo_path.name}: {str(e)}"
+                )
+                images.append(
+                    '<div class="gallery-image-placeholder"></div>'
+                    f'<div class="photo-caption">⚠️ {erreur}</div>'
+                )
+
+        # Toute la page dans un seul élément, réécrit quand des vignettes arrivent
+        grille = st.empty()
+        grille.markdown(html_grille_galerie(images, legendes), unsafe_allow_html=True)
+
+        # Navigation entre les pages (les clics ne réexécutent que le fragment)
+        col_precedente, col_page, col_suivante = st.columns([1, 2, 1])
+        with col_precedente:
+            st.button(
+                tr.t("previous_page"),
+                on_click=curseurs.pop,
+                disabled=len(curseurs) == 1,
+                key="page_precedente",
+                use_container_width=True,
+            )
+        with col_page:
+            numero_page = tr.t("gallery_page", page=len(curseurs))
+            st.markdown(
+                f"<div style='text-align: center;'>{numero_page}</div>",
+                unsafe_allow_html=True,
+            )
+        with col_suivante:
+            st.button(
+                tr.t("next_page"),
+                on_click=curseurs.append,
+                args=(curseur_suivant,),
+                disabled=curseur_suivant is None,
+                key="page_suivante",
+                use_container_width=True,
+            )
+
+        # La grille est déjà visible : compléter les cellules au fil du pool,
+        # en la réécrivant au plus toutes les DELAI_RAFRAICHISSEMENT_GRILLE s
+        dernier_rendu = time.monotonic()
+        a_reecrire = False
+        for rang in a_completer:
+            photo_path = selected_photos[rang]
+            try:
+                vignette = prechargeur.fichier_vignette(
+                    photo_path, taille, ordonnanceur_es()
+                )
+            except OSError as e:
+                print(f"Erreur lors de la génération de la vignette {photo_path}: {e}")
+                continue
+            images[rang] = html_image_galerie(
+                source_vignette(vignette), photo_path.name
+            )
+            a_reecrire = True
+            if time.monotonic() - dernier_rendu >= DELAI_RAFRAICHISSEMENT_GRILLE:
+                grille.markdown(
+                    html_grille_galerie(images, legendes), unsafe_allow_html=True
+                )
+                dernier_rendu = time.monotonic()
+                a_reecrire = False
+        if a_reecrire:
+            grille.markdown(
+                html_grille_galerie(images, legendes), unsafe_allow_html=True
+            )
+    else:
+        st.warning(tr.t("no_photos_month"))
+
+    # Compteurs du magasin, partagé par toutes les sessions
+    stats = magasin_vignettes().statistiques()
+    st.caption(
+        tr.t(
+            "thumbnail_cache_stats",
+            count=stats["vignettes"],
+            size=stats["taille"] / 1024**2,
+            budget=stats["budget"] / 1024**2,
+            hits=stats["succes"],
+            misses=stats["defauts"],
+            evictions=stats["evictions"],
+        )
+    )
+
+
 def main():
     # 🦖 Configuration T-Rex Pastel
     st.set_page_config(**PAGE_CONFIG)
@@ -356,7 +1430,18 @@ def main():
                     datetime.combine(date_naissance, datetime.min.time()),
                     type_fichiers,
                 )
-                nb_fichiers, erreurs = organiseur.reinitialiser()
+                nb_fichiers, erreurs = executer_avec_etat_analytique(
+                    organiseur,
+                    (
+                        str(Path(dossier_racine)),
+                        sous_dossier_photos,
+                        date_naissance,
+                        type_fichiers,
+                    ),
+                    organiseur.reinitialiser,
+                )
+                invalider_resultats(organiseur.dossier_racine)
+                st.session_state.pop("plan_organisation", None)
 
                 if nb_fichiers > 0:
                     st.success(tr.t("files_reset", count=nb_fichiers))
@@ -475,60 +1560,56 @@ def main():
                     save_configuration(config_manager)
                     st.rerun()
 
-    # Toujours afficher tous les onglets
-    tab_list = [
-        tr.t("tab_home"),
-        tr.t("tab_simulation"),
-        tr.t("tab_organization"),
-        tr.t("tab_analytics"),
-        tr.t("tab_insights"),
-        tr.t("tab_gallery"),
-    ]
-
-    tabs = st.tabs(tab_list)
-
-    # Onglet Accueil
-    with tabs[0]:
-        # 🦖 Header principal avec style T-Rex
-        st.markdown(
-            f"""
-            <div class="main-header">
-                <h1>{temp_tr.t("app_title")}</h1>
-                <p><strong>{temp_tr.t("tagline")}</strong></p>
-                <p>{temp_tr.t("subtitle")}</p>
-            </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    # Navigation : seule la vue active est exécutée à chaque rerun
+    vue = st.radio(
+        tr.t("navigation"),
+        VUES,
+        format_func=lambda v: tr.t(f"tab_{v}"),
+        horizontal=True,
+        key="vue_active",
+        label_visibility="collapsed",
+    )
 
-        # Zone d'explication de l'application
-        st.markdown(
-            f"""
-            <div style="background-color: #f0f8ff; padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem;">
-                <h3 style="color: #2C3E50; margin-bottom: 0.5rem;">🤔 {temp_tr.t("welcome_title")}</h3>
-                <p style="color: #7F8C8D; margin-bottom: 0.8rem;">{temp_tr.t("welcome_description")}</p>
-                <ul style="color: #7F8C8D; margin-left: 1.5rem;">
-                    <li>{temp_tr.t("welcome_feature_1")}</li>
-                    <li>{temp_tr.t("welcome_feature_2")}</li>
-                    <li>{temp_tr.t("welcome_feature_3")}</li>
-                    <li>{temp_tr.t("welcome_feature_4")}</li>
-                    <li>{temp_tr.t("welcome_feature_5")}</li>
-                </ul>
-            </div>
+    # Organisateur du projet, None tant que la configuration est incomplète
+    organiseur = None
+    cle_plan = None
 
-            <div style="background-color: #e8f4f8; padding: 1.2rem; border-radius: 10px; margin-top: 1rem;">
-                <h4 style="color: #2C3E50; margin-bottom: 0.8rem;">{temp_tr.t("welcome_steps_title")}</h4>
-                <div style="color: #7F8C8D; line-height: 1.8;">
-                    <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_1")}</p>
-                    <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_2")}</p>
-                    <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_3")}</p>
-                    <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_4")}</p>
-                    <p style="margin: 0.3rem 0;">{temp_tr.t("welcome_step_5")}</p>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    # Vérifier si la configuration est complète
+    config_complete = (
+        dossier_racine
+        and Path(dossier_racine).exists()
+        and (Path(dossier_racine) / sous_dossier_photos).exists()
+        and type_fichiers is not None
+    )
+
+    if config_complete:
+        # Valider que les chemins existent avant de créer l'organisateur
+        try:
+            chemin_racine = Path(dossier_racine)
+            chemin_photos = chemin_racine / sous_dossier_photos
+
+            if not chemin_racine.exists():
+                st.error(f"Le dossier racine n'existe pas : {dossier_racine}")
+            elif not chemin_photos.exists():
+                st.error(f"Le dossier source n'existe pas : {chemin_photos}")
+            else:
+                organiseur = OrganisateurPhotos(
+                    chemin_racine,
+                    sous_dossier_photos,
+                    datetime.combine(date_naissance, datetime.min.time()),
+                    type_fichiers,
+                )
+                cle_plan = (
+                    str(chemin_racine),
+                    sous_dossier_photos,
+                    date_naissance,
+                    type_fichiers,
+                )
+        except Exception as e:
+            st.error(f"Erreur lors de la validation des chemins : {str(e)}")
+
+    if vue == "home":
+        afficher_accueil(temp_tr)
 
         if not dossier_racine:
             st.info(tr.t("configure_root"))
@@ -544,714 +1625,16 @@ def main():
             )
         elif type_fichiers is None:
             st.error(tr.t("select_file_type"))
-
-        # Vérifier si la configuration est complète
-        config_complete = (
-            dossier_racine
-            and Path(dossier_racine).exists()
-            and (Path(dossier_racine) / sous_dossier_photos).exists()
-            and type_fichiers is not None
-        )
-
-        if config_complete:
-            # Valider que les chemins existent avant de créer l'organisateur
-            try:
-                chemin_racine = Path(dossier_racine)
-                chemin_photos = chemin_racine / sous_dossier_photos
-
-                if not chemin_racine.exists():
-                    st.error(f"Le dossier racine n'existe pas : {dossier_racine}")
-                    config_complete = False
-                elif not chemin_photos.exists():
-                    st.error(f"Le dossier source n'existe pas : {chemin_photos}")
-                    config_complete = False
-                else:
-                    organiseur = OrganisateurPhotos(
-                        chemin_racine,
-                        sous_dossier_photos,
-                        datetime.combine(date_naissance, datetime.min.time()),
-                        type_fichiers,
-                    )
-            except Exception as e:
-                st.error(f"Erreur lors de la validation des chemins : {str(e)}")
-                config_complete = False
-
-        with tabs[1]:
-            st.markdown(
-                f'<div class="trex-message">{tr.t("simulation_title")}</div>',
-                unsafe_allow_html=True,
-            )
-
-            if not config_complete:
-                st.info(tr.t("configure_settings_first"))
-            else:
-                if st.button(tr.t("analyze_button")):
-                    # Marquer la page comme chargée après la première interaction
-                    st.session_state.page_loaded = True
-                    try:
-                        with st.spinner(tr.t("analyzing")):
-                            repartition, erreurs = organiseur.simuler_organisation()
-                            taille_dossier_gb = (
-                                organiseur.calculer_taille_fichiers_organises(
-                                    repartition
-                                )
-                                if repartition
-                                else 0
-                            )
-                    except Exception as e:
-                        st.error(f"Erreur lors de l'analyse : {str(e)}")
-                        st.info(
-                            "Vérifiez que les dossiers existent et contiennent des photos au bon format (YYYYMMDD_*.jpg)"
-                        )
-                        repartition = None
-                        erreurs = []
-
-                    if repartition:
-                        total_photos = sum(len(f) for f in repartition.values())
-
-                        if type_fichiers == FILE_TYPES["both"]:
-                            # Compter photos et vidéos séparément
-                            total_photos_count = sum(
-                                len(
-                                    [
-                                        f
-                                        for f in fichiers
-                                        if organiseur.get_file_type(f) == "photo"
-                                    ]
-                                )
-                                for fichiers in repartition.values()
-                            )
-                            total_videos_count = sum(
-                                len(
-                                    [
-                                        f
-                                        for f in fichiers
-                                        if organiseur.get_file_type(f) == "video"
-                                    ]
-                                )
-                                for fichiers in repartition.values()
-                            )
-                            message = tr.t(
-                                "success_simulation_mixed_with_size",
-                                photos=total_photos_count,
-                                videos=total_videos_count,
-                                size=taille_dossier_gb,
-                            )
-                        elif "Photos" in type_fichiers:
-                            message = tr.t(
-                                "success_simulation_with_size",
-                                photos=total_photos,
-                                size=taille_dossier_gb,
-                            )
-                        else:
-                            message = tr.t(
-                                "success_simulation_with_size",
-                                photos=total_photos,
-                                size=taille_dossier_gb,
-                            )
-
-                        st.markdown(
-                            f'<div class="trex-success">{message}</div>',
-                            unsafe_allow_html=True,
-                        )
-
-                        # Fonction pour extraire le nombre du début du nom de dossier
-                        def extract_month_number(folder_name):
-                            # Extrait le premier nombre du nom du dossier (ex: "0-1months" -> 0)
-                            try:
-                                return int(folder_name.split("-")[0])
-                            except:
-                                return 999  # Valeur par défaut pour les dossiers non standards
-
-                        for dossier, fichiers in sorted(
-                            repartition.items(),
-                            key=lambda x: extract_month_number(x[0]),
-                        ):
-                            if type_fichiers == FILE_TYPES["both"]:
-                                # Séparer photos et vidéos
-                                photos = [
-                                    f
-                                    for f in fichiers
-                                    if organiseur.get_file_type(f) == "photo"
-                                ]
-                                videos = [
-                                    f
-                                    for f in fichiers
-                                    if organiseur.get_file_type(f) == "video"
-                                ]
-
-                                with st.expander(
-                                    f"📁 {dossier} ({len(photos)} 📸 + {len(videos)} 🎬)"
-                                ):
-                                    if photos:
-                                        st.write("📸 **Photos:**")
-                                        for photo in photos[:MAX_FILES_EXPANDER]:
-                                            st.text(f"  📸 {photo.name}")
-                                        if len(photos) > MAX_FILES_EXPANDER:
-                                            st.text(
-                                                f"  ... et {len(photos) - MAX_FILES_EXPANDER} autres photos"
-                                            )
-
-                                    if videos:
-                                        st.write("🎬 **Vidéos:**")
-                                        for video in videos[:MAX_FILES_EXPANDER]:
-                                            st.text(f"  🎬 {video.name}")
-                                        if len(videos) > MAX_FILES_EXPANDER:
-                                            st.text(
-                                                f"  ... et {len(videos) - MAX_FILES_EXPANDER} autres vidéos"
-                                            )
-                            else:
-                                # Affichage normal pour un seul type
-                                type_emoji = "📸" if "Photos" in type_fichiers else "🎬"
-                                type_nom = (
-                                    tr.t("photos_unit")
-                                    if "Photos" in type_fichiers
-                                    else tr.t("videos_unit")
-                                )
-
-                                with st.expander(
-                                    f"📁 {dossier} ({len(fichiers)} {type_nom})"
-                                ):
-                                    for fichier in fichiers[:MAX_FILES_PREVIEW]:
-                                        st.text(f"  {type_emoji} {fichier.name}")
-                                    if len(fichiers) > MAX_FILES_PREVIEW:
-                                        st.text(
-                                            tr.t(
-                                                "and_more",
-                                                count=len(fichiers) - MAX_FILES_PREVIEW,
-                                            )
-                                        )
-                    else:
-                        st.info(tr.t("no_files_found"))
-
-                        # Afficher des informations de débogage
-                        if (
-                            hasattr(organiseur, "_fichiers_ignores")
-                            and organiseur._fichiers_ignores
-                        ):
-                            with st.expander(tr.t("debug_details")):
-                                st.write(
-                                    f"{tr.t('birth_date_configured')}{date_naissance}"
-                                )
-                                st.write(
-                                    f"{tr.t('ignored_files_count')}{len(organiseur._fichiers_ignores)}"
-                                )
-
-                                # Afficher quelques exemples
-                                for nom, raison in organiseur._fichiers_ignores[
-                                    :MAX_IGNORED_FILES_DISPLAY
-                                ]:
-                                    st.text(f"  - {nom}: {raison}")
-
-                                if (
-                                    len(organiseur._fichiers_ignores)
-                                    > MAX_IGNORED_FILES_DISPLAY
-                                ):
-                                    st.text(
-                                        f"  ... et {len(organiseur._fichiers_ignores) - MAX_IGNORED_FILES_DISPLAY} autres"
-                                    )
-
-                    if erreurs:
-                        st.warning(tr.t("warnings"))
-                        for erreur in erreurs:
-                            st.warning(erreur)
-
-        with tabs[2]:
-            st.markdown(
-                f'<div class="trex-message">{tr.t("organization_title")}</div>',
-                unsafe_allow_html=True,
-            )
-
-            if not config_complete:
-                st.info(tr.t("configure_settings_first"))
-            else:
-                st.markdown(
-                    f'<div class="trex-warning">{tr.t("organization_warning")}</div>',
-                    unsafe_allow_html=True,
-                )
-
-                col1, col2 = st.columns(2)
-                with col1:
-                    type_text = (
-                        tr.t("photos_unit")
-                        if "Photos" in type_fichiers
-                        else (
-                            tr.t("videos_unit")
-                            if "Vidéos" in type_fichiers
-                            else tr.t("files_unit")
-                        )
-                    )
-                    confirmer = st.checkbox(tr.t("confirm_organize", type=type_text))
-
-                with col2:
-                    if st.button(tr.t("organize_button"), disabled=not confirmer):
-                        st.session_state.page_loaded = True
-                        with st.spinner(tr.t("organizing")):
-                            nb_fichiers, erreurs = organiseur.organiser()
-
-                        if nb_fichiers > 0:
-                            if type_fichiers == FILE_TYPES["both"]:
-                                type_text = tr.t("files_unit")
-                            elif "Photos" in type_fichiers:
-                                type_text = tr.t("photos_unit")
-                            else:
-                                type_text = tr.t("videos_unit")
-
-                            message = tr.t(
-                                "success_organize", count=nb_fichiers, type=type_text
-                            )
-                            st.markdown(
-                                f'<div class="trex-success">{message}</div>',
-                                unsafe_allow_html=True,
-                            )
-
-                        if erreurs:
-                            st.error(tr.t("errors_occurred"))
-                            for erreur in erreurs:
-                                st.error(erreur)
-
-        with tabs[3]:
-            st.markdown(
-                f'<div class="trex-message">{tr.t("analytics_title")}</div>',
-                unsafe_allow_html=True,
-            )
-
-            if not config_complete:
-                st.info(tr.t("configure_settings_first"))
-            else:
-                # Extraire les données des photos
-                with st.spinner(tr.t("calculating_stats")):
-                    df_photos = extract_photo_data(organiseur)
-                    metrics = calculate_metrics(df_photos, type_fichiers)
-
-                if df_photos.empty:
-                    st.info(tr.t("no_data_analytics"))
-                else:
-                    # Métriques principales en colonnes (3x2 layout)
-                    col1, col2, col3 = st.columns(3)
-
-                    with col1:
-                        if type_fichiers == FILE_TYPES["both"]:
-                            st.metric(
-                                "📸 Photos" if tr.language == "fr" else "📸 Photos",
-                                metrics["total_photos"],
-                                delta=(
-                                    f"{metrics['total_photos'] / metrics['total_fichiers'] * 100:.0f}% du total"
-                                    if tr.language == "fr"
-                                    else (
-                                        f"{metrics['total_photos'] / metrics['total_fichiers'] * 100:.0f}% of total"
-                                        if metrics["total_fichiers"] > 0
-                                        else None
-                                    )
-                                ),
-                            )
-                        else:
-                            label = (
-                                tr.t("photos_kept")
-                                if "Photos" in type_fichiers
-                                else tr.t("videos_kept")
-                            )
-                            st.metric(
-                                label,
-                                metrics["total_fichiers"],
-                                delta=(
-                                    tr.t("precious_memories")
-                                    if metrics["total_fichiers"] > 0
-                                    else None
-                                ),
-                            )
-                        st.metric(
-                            tr.t("last_capture"),
-                            (
-                                metrics["derniere_photo"].strftime("%d/%m/%Y")
-                                if metrics["derniere_photo"]
-                                else "N/A"
-                            ),
-                            delta=tr.t("recent") if metrics["derniere_photo"] else None,
-                        )
-
-                    with col2:
-                        if type_fichiers == FILE_TYPES["both"]:
-                            st.metric(
-                                "🎬 Vidéos" if tr.language == "fr" else "🎬 Videos",
-                                metrics["total_videos"],
-                                delta=(
-                                    f"{metrics['total_videos'] / metrics['total_fichiers'] * 100:.0f}% du total"
-                                    if tr.language == "fr"
-                                    else (
-                                        f"{metrics['total_videos'] / metrics['total_fichiers'] * 100:.0f}% of total"
-                                        if metrics["total_fichiers"] > 0
-                                        else None
-                                    )
-                                ),
-                            )
-                        else:
-                            st.metric(
-                                tr.t("growth_period"),
-                                f"{metrics['periode_couverte']} mois",
-                                delta=(
-                                    tr.t("growing_fast")
-                                    if metrics["periode_couverte"] > 6
-                                    else None
-                                ),
-                            )
-                        st.metric(
-                            tr.t("daily_record"),
-                            f"{metrics['jour_record']} photos",
-                            delta=(
-                                tr.t("burst_mode")
-                                if metrics["jour_record"] >= 10
-                                else None
-                            ),
-                        )
-
-                    with col3:
-                        st.metric(
-                            tr.t("average_rhythm"),
-                            f"{metrics['moyenne_par_mois']:.1f}/mois",
-                            delta=(
-                                tr.t("regular")
-                                if metrics["moyenne_par_mois"] >= 20
-                                else tr.t("can_do_better")
-                            ),
-                        )
-                        st.metric(
-                            tr.t("longest_gap"),
-                            f"{metrics['max_gap']} jours",
-                            delta=(
-                                tr.t("trex_sleeping")
-                                if metrics["max_gap"] >= 7
-                                else tr.t("well_followed")
-                            ),
-                        )
-
-                    st.divider()
-
-                    # Graphiques
-                    charts = create_charts(df_photos, tr)
-
-                    if charts:
-                        # Graphique en barres
-                        if "barres" in charts:
-                            st.plotly_chart(charts["barres"], use_container_width=True)
-
-                        # Timeline et heatmap en colonnes
-                        col1, col2 = st.columns(2)
-
-                        with col1:
-                            if "timeline" in charts:
-                                st.plotly_chart(
-                                    charts["timeline"], use_container_width=True
-                                )
-
-                        with col2:
-                            if "heatmap" in charts:
-                                st.plotly_chart(
-                                    charts["heatmap"], use_container_width=True
-                                )
-
-                        # Alertes visuelles pour les gaps
-                        gaps = find_gaps(df_photos)
-                        if gaps:
-                            st.subheader(tr.t("temporal_alerts"))
-                            for gap_start, gap_end, gap_days in gaps:
-                                if gap_days >= 5:
-                                    st.warning(
-                                        tr.t(
-                                            "gap_alert",
-                                            days=gap_days,
-                                            start=gap_start.strftime("%d/%m/%Y"),
-                                            end=gap_end.strftime("%d/%m/%Y"),
-                                        )
-                                    )
-
-        with tabs[4]:
-            st.markdown(
-                f'<div class="trex-message">{tr.t("insights_title")}</div>',
-                unsafe_allow_html=True,
-            )
-
-            if not config_complete:
-                st.info(tr.t("configure_settings_first"))
-            else:
-                # Réutiliser les données déjà extraites si possible
-                if "df_photos" not in locals():
-                    with st.spinner(tr.t("searching_data")):
-                        df_photos = extract_photo_data(organiseur)
-                        metrics = calculate_metrics(df_photos, type_fichiers)
-
-                # Messages d'insights
-                insights = generate_insights(
-                    df_photos, metrics, organiseur.date_naissance, type_fichiers, tr
-                )
-
-                if insights:
-                    st.markdown(tr.t("discoveries"))
-                    for insight in insights:
-                        st.markdown(
-                            f'<div class="insight-bubble">{insight}</div>',
-                            unsafe_allow_html=True,
-                        )
-
-                    st.divider()
-
-                    # Section détails si il y a des données
-                    if not df_photos.empty:
-                        st.subheader(tr.t("detailed_analysis"))
-
-                        col1, col2 = st.columns(2)
-
-                        with col1:
-                            st.write(tr.t("monthly_distribution"))
-                            photos_par_mois = df_photos.groupby("age_mois").size()
-                            for mois, nb in photos_par_mois.head(5).items():
-                                st.write(
-                                    tr.t(
-                                        "months_pattern",
-                                        start=mois,
-                                        end=mois + 1,
-                                        count=nb,
-                                    )
-                                )
-                            if len(photos_par_mois) > 5:
-                                st.write(
-                                    tr.t(
-                                        "and_other_months",
-                                        count=len(photos_par_mois) - 5,
-                                    )
-                                )
-
-                        with col2:
-                            st.write(tr.t("favorite_days"))
-                            if tr.language == "fr":
-                                jours_map = {
-                                    "Monday": "Lundi",
-                                    "Tuesday": "Mardi",
-                                    "Wednesday": "Mercredi",
-                                    "Thursday": "Jeudi",
-                                    "Friday": "Vendredi",
-                                    "Saturday": "Samedi",
-                                    "Sunday": "Dimanche",
-                                }
-                            else:
-                                jours_map = {
-                                    "Monday": "Monday",
-                                    "Tuesday": "Tuesday",
-                                    "Wednesday": "Wednesday",
-                                    "Thursday": "Thursday",
-                                    "Friday": "Friday",
-                                    "Saturday": "Saturday",
-                                    "Sunday": "Sunday",
-                                }
-                            photos_par_jour = (
-                                df_photos.groupby("jour_semaine")
-                                .size()
-                                .sort_values(ascending=False)
-                            )
-                            for jour_en, nb in photos_par_jour.head(3).items():
-                                jour_localized = jours_map.get(jour_en, jour_en)
-                                st.write(
-                                    tr.t("photos_count", day=jour_localized, count=nb)
-                                )
-
-                        # Suggestions d'amélioration
-                        st.subheader(tr.t("suggestions"))
-
-                        gaps = find_gaps(df_photos, min_gap_days=7)
-                        if gaps:
-                            st.write(tr.t("not_to_miss"))
-                            st.write(tr.t("think_weekday_photos"))
-                            st.write(tr.t("capture_daily_moments"))
-
-                        if metrics["moyenne_par_mois"] < 10:
-                            st.write(tr.t("enrich_memories"))
-                            st.write(tr.t("more_photos_evolution"))
-                            st.write(tr.t("small_moments_matter"))
-                    else:
-                        st.info(tr.t("analyze_first"))
-
-        with tabs[5]:
-            st.markdown(
-                f'<div class="trex-message">{tr.t("gallery_title")}</div>',
-                unsafe_allow_html=True,
-            )
-
-            if not config_complete:
-                st.info(tr.t("configure_settings_first"))
-            else:
-                # Obtenir les données de la galerie
-                with st.spinner(tr.t("searching_data")):
-                    gallery_data = get_gallery_data(organiseur)
-
-                if not gallery_data:
-                    st.info(tr.t("no_photos_month"))
-                else:
-                    # Contrôles de l'interface
-                    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-
-                    with col1:
-                        # Fonction pour extraire le nombre du début du nom de dossier
-                        def extract_month_number(folder_name):
-                            try:
-                                return int(folder_name.split("-")[0])
-                            except:
-                                return 999  # Pour "Photos non triées" et autres
-
-                        # Trier les mois disponibles
-                        months_available = ["Tous les mois"] + sorted(
-                            gallery_data.keys(), key=extract_month_number
-                        )
-
-                        selected_month = st.selectbox(
-                            tr.t("select_month"), months_available, index=0
-                        )
-
-                    with col2:
-                        # Sélecteur de mode d'affichage
-                        view_modes = [
-                            tr.t("mode_random"),
-                            tr.t("mode_chronological"),
-                            tr.t("mode_highlights"),
-                            tr.t("mode_timeline"),
-                        ]
-
-                        view_mode = st.selectbox(
-                            tr.t("view_mode"),
-                            view_modes,
-                            index=0,
-                            help=tr.t("view_mode_help"),
-                        )
-
-                    with col3:
-                        # Calculer l'âge actuel du bébé pour définir le max
-                        age_actuel_mois = organiseur.calculer_age_mois(datetime.now())
-                        max_photos = max(
-                            6, age_actuel_mois
-                        )  # Minimum 6 pour les très jeunes bébés
-
-                        num_photos = st.slider(
-                            tr.t("photos_to_show"),
-                            min_value=1,
-                            max_value=max_photos,
-                            value=min(6, max_photos),
-                            step=1,
-                        )
-
-                    with col4:
-                        if st.button(tr.t("refresh_gallery"), type="secondary"):
-                            st.rerun()
-
-                    # Afficher le nombre de photos trouvées
-                    if view_mode == tr.t("mode_timeline"):
-                        # Pour le mode timeline, afficher le nombre de mois disponibles
-                        monthly_folders = {
-                            k: v
-                            for k, v in gallery_data.items()
-                            if k != "Photos non triées" and "-" in k
-                        }
-                        if baby_name.strip():
-                            message = tr.t(
-                                "months_growth_available",
-                                count=len(monthly_folders),
-                                name=baby_name.strip(),
-                            )
-                            st.info(f"📈 {message}")
-                        else:
-                            message = tr.t(
-                                "months_growth_available_no_name",
-                                count=len(monthly_folders),
-                            )
-                            st.info(f"📈 {message}")
-                    elif selected_month == "Tous les mois":
-                        total_photos = sum(
-                            len(photos) for photos in gallery_data.values()
-                        )
-                        if baby_name.strip():
-                            message = tr.t(
-                                "photos_found_with_name",
-                                count=total_photos,
-                                name=baby_name.strip(),
-                            )
-                            st.info(message)
-                        else:
-                            st.info(tr.t("photos_found", count=total_photos))
-                    else:
-                        month_photos = len(gallery_data.get(selected_month, []))
-                        if baby_name.strip():
-                            message = tr.t(
-                                "photos_found_with_name",
-                                count=month_photos,
-                                name=baby_name.strip(),
-                            )
-                            st.info(message)
-                        else:
-                            st.info(tr.t("photos_found", count=month_photos))
-
-                    # Obtenir et afficher les photos selon le mode sélectionné
-                    selected_photos = get_photos_by_mode(
-                        gallery_data, organiseur, view_mode, selected_month, num_photos
-                    )
-
-                    if selected_photos:
-                        # Afficher les photos in une grille
-                        cols_per_row = 3
-                        rows = [
-                            selected_photos[i : i + cols_per_row]
-                            for i in range(0, len(selected_photos), cols_per_row)
-                        ]
-
-                        for row in rows:
-                            cols = st.columns(cols_per_row)
-                            for idx, photo_path in enumerate(row):
-                                with cols[idx]:
-                                    try:
-                                        # Charger l'image avec l'orientation EXIF corrigée
-                                        image = get_image_with_correct_orientation(
-                                            str(photo_path)
-                                        )
-
-                                        # Convertir l'image PIL en base64 pour l'intégrer dans le HTML
-                                        buffered = BytesIO()
-                                        image.save(buffered, format="JPEG", quality=85)
-                                        img_str = base64.b64encode(
-                                            buffered.getvalue()
-                                        ).decode()
-
-                                        # Créer le HTML pour l'image avec le style carré
-                                        image_html = f"""
-                                        <div class="gallery-image-container">
-                                            <img src="data:image/jpeg;base64,{img_str}"
-                                                 class="gallery-image"
-                                                 alt="{photo_path.name}"
-                                                 loading="lazy">
-                                        </div>
-                                        """
-                                        st.markdown(image_html, unsafe_allow_html=True)
-
-                                        # Afficher la légende personnalisée avec badge d'âge
-                                        caption_html = get_photo_caption_with_age(
-                                            photo_path, organiseur, tr
-                                        )
-                                        st.markdown(
-                                            caption_html, unsafe_allow_html=True
-                                        )
-                                    except Exception as e:
-                                        st.error(
-                                            f"Erreur lors du chargement de {photo_path.name}: {str(e)}"
-                                        )
-
-                            # Remplir les colonnes vides s'il y en a moins que cols_per_row
-                            for idx in range(len(row), cols_per_row):
-                                with cols[idx]:
-                                    st.empty()
-
-                            # Ajouter un espace entre les rangées
-                            st.markdown(
-                                "<div style='margin-bottom: 1rem;'></div>",
-                                unsafe_allow_html=True,
-                            )
-                    else:
-                        st.warning(tr.t("no_photos_month"))
+    elif vue == "simulation":
+        afficher_simulation(tr, organiseur, cle_plan)
+    elif vue == "organization":
+        afficher_organisation(tr, organiseur, cle_plan)
+    elif vue == "analytics":
+        afficher_analytics(tr, organiseur, cle_plan)
+    elif vue == "insights":
+        afficher_insights(tr, organiseur, cle_plan)
+    elif vue == "gallery":
+        afficher_galerie(tr, organiseur, cle_plan)
 
     # 🦖 Footer T-Rex avec personnalité
     st.markdown(
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark du calcul des onglets Analytics et Insights sur de gros DataFrames."""
+
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.moment_keeper.analytics import (  # noqa: E402
+    SCHEMA_DONNEES_PHOTOS,
+    PhotoAggregates,
+    calculate_metrics,
+    create_charts,
+    find_gaps,
+    generate_insights,
+)
+from src.moment_keeper.translations import Translator  # noqa: E402
+
+BIRTH_DATE = datetime(2020, 1, 1)
+TYPE_FICHIERS = "📸🎬 Photos et Vidéos"
+
+
+def create_test_dataframe(row_count: int, days: int = 2000) -> pd.DataFrame:
+    """Crée un DataFrame d'analyse synthétique réparti sur `days` jours."""
+    rng = np.random.default_rng(42)
+    dates = pd.to_datetime(BIRTH_DATE) + pd.to_timedelta(
+        np.sort(rng.integers(0, days, row_count)), unit="D"
+    )
+    age_mois = (dates.year - BIRTH_DATE.year) * 12 + (dates.month - BIRTH_DATE.month)
+
+    return pd.DataFrame(
+        {
+            "fichier": [f"{i}.jpg" for i in range(row_count)],
+            "type": rng.choice(["photo", "video"], row_count),
+            "date": dates,
+            "age_mois": age_mois,
+            "dossier": [f"{m}-{m + 1}months" for m in age_mois],
+            "jour_semaine": dates.day_name(),
+            "semaine": dates.isocalendar().week.to_numpy(),
+            "annee": dates.year,
+        }
+    ).astype(SCHEMA_DONNEES_PHOTOS)
+
+
+def render_analytics_insights(
+    df: pd.DataFrame, tr: Translator, aggregates: PhotoAggregates = None
+) -> None:
+    """Reproduit les calculs des onglets Analytics et Insights de l'app."""
+    if aggregates is None:
+        aggregates = PhotoAggregates(df, BIRTH_DATE)
+    metrics = calculate_metrics(df, TYPE_FICHIERS, aggregates)
+    create_charts(df, tr, aggregates)
+    find_gaps(df, aggregates=aggregates)
+    generate_insights(df, metrics, BIRTH_DATE, TYPE_FICHIERS, tr, aggregates)
+    find_gaps(df, min_gap_days=7, aggregates=aggregates)
+
+
+def measure_incremental_updates(
+    aggregates: PhotoAggregates, count: int = 1000
+) -> float:
+    """Mesure le coût moyen d'un ajout suivi d'un retrait, en microsecondes."""
+    date = BIRTH_DATE + timedelta(days=100)
+    start = time.perf_counter()
+    for _ in range(count):
+        aggregates.ajouter(date, 3, "photo")
+        aggregates.retirer(date, 3, "photo")
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def run_benchmarks():
+    """Lance le benchmark pour différentes tailles.
+
+    La construction des agrégats est proportionnelle au nombre de fichiers ;
+    les analyses travaillent ensuite sur le tableau de comptages quotidiens et
+    doivent rester stables quand le nombre de fichiers augmente.
+    """
+    warnings.simplefilter("ignore")
+    tr = Translator("fr")
+    test_sizes = [10_000, 100_000, 500_000, 1_000_000]
+
+    print("Benchmark Analytics + Insights MomentKeeper\n")
+    print("RESUME DES PERFORMANCES")
+    print("=" * 72)
+    print(
+        f"{'lignes':>9} | {'total':>9} | {'agrégats':>9} | "
+        f"{'analyses':>9} | {'ajout+retrait':>13}"
+    )
+
+    for size in test_sizes:
+        df = create_test_dataframe(size)
+
+        start = time.perf_counter()
+        render_analytics_insights(df, tr)
+        total = time.perf_counter() - start
+
+        start = time.perf_counter()
+        aggregates = PhotoAggregates(df, BIRTH_DATE)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        render_analytics_insights(df, tr, aggregates)
+        queries = time.perf_counter() - start
+
+        update = measure_incremental_updates(aggregates)
+        print(
+            f"{size:>9} | {total * 1000:>7.1f}ms | {build * 1000:>7.1f}ms | "
+            f"{queries * 1000:>7.1f}ms | {update:>11.1f}µs"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark de la construction du DataFrame d'analyse : ligne par ligne vs colonnes.
+
+Usage :
+    python scripts/benchmark_extraction.py
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.moment_keeper.analytics import (  # noqa: E402
+    SCHEMA_DONNEES_PHOTOS,
+    construire_donnees_photos,
+)
+from src.moment_keeper.organizer import OrganisateurPhotos  # noqa: E402
+
+BIRTH_DATE = datetime(2020, 1, 15)
+EXTENSIONS = [".jpg", ".JPG", ".heic", ".mp4", ".mov", ".txt", ""]
+
+
+def create_file_names(count: int) -> tuple[list[str], list[str]]:
+    """Crée des noms de fichiers variés, y compris invalides ou hors période."""
+    rng = random.Random(42)
+    noms, dossiers = [], []
+    for i in range(count):
+        date = BIRTH_DATE + timedelta(days=rng.randrange(-60, 2000))
+        tirage = rng.random()
+        if tirage < 0.03:
+            prefixe = f"IMG{i:05d}"  # pas de date
+        elif tirage < 0.04:
+            prefixe = f"{date:%Y}1399"  # date invalide
+        else:
+            prefixe = f"{date:%Y%m%d}"
+        noms.append(f"{prefixe}_{i:07d}{rng.choice(EXTENSIONS)}")
+        dossiers.append(rng.choice(["photos", f"{i % 60}-{i % 60 + 1}months"]))
+    return noms, dossiers
+
+
+def build_rowwise(
+    organiseur: OrganisateurPhotos, noms: list[str], dossiers: list[str]
+) -> pd.DataFrame:
+    """Construction de référence, un dictionnaire par fichier (types par défaut)."""
+    photos_data = []
+    for nom, dossier in zip(noms, dossiers):
+        fichier = Path(nom)
+        if fichier.suffix.lower() in organiseur.extensions_actives:
+            date_photo = organiseur.extraire_date_nom_fichier(nom)
+            if date_photo and date_photo >= organiseur.date_naissance:
+                photos_data.append(
+                    {
+                        "fichier": nom,
+                        "type": organiseur.get_file_type(fichier),
+                        "date": date_photo,
+                        "age_mois": organiseur.calculer_age_mois(date_photo),
+                        "dossier": dossier,
+                        "jour_semaine": date_photo.strftime("%A"),
+                        "semaine": date_photo.isocalendar()[1],
+                        "annee": date_photo.year,
+                    }
+                )
+    return pd.DataFrame(photos_data)
+
+
+def run_benchmarks():
+    """Lance le benchmark pour différentes tailles et vérifie l'équivalence."""
+    organiseur = OrganisateurPhotos(Path("."), "photos", BIRTH_DATE)
+    test_sizes = [10_000, 100_000, 1_000_000]
+
+    print("Benchmark de construction du DataFrame d'analyse MomentKeeper\n")
+    print("RESUME DES PERFORMANCES")
+    print("=" * 60)
+
+    for size in test_sizes:
+        noms, dossiers = create_file_names(size)
+
+        start = time.perf_counter()
+        reference = build_rowwise(organiseur, noms, dossiers)
+        rowwise_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resultat = construire_donnees_photos(
+            noms, dossiers, organiseur.date_naissance, organiseur.extensions_actives
+        )
+        vectorized_time = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(resultat, reference.astype(SCHEMA_DONNEES_PHOTOS))
+        print(
+            f"{size:>9} fichiers | ligne par ligne {rowwise_time * 1000:>8.1f} ms | "
+            f"colonnes {vectorized_time * 1000:>7.1f} ms | "
+            f"x{rowwise_time / vectorized_time:.1f}"
+        )
+
+    print("\nDataFrames identiques pour toutes les tailles.")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
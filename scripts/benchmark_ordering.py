@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark de l'ordre des déplacements : aléatoire vs trié par localité.
+
+Usage :
+    python scripts/benchmark_ordering.py [nb_fichiers] [dossier_de_travail]
+
+Lancer sur le disque cible (HDD USB, NAS) pour des mesures représentatives :
+sur SSD ou tmpfs l'écart est faible puisqu'il n'y a pas de temps de seek.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.moment_keeper.organizer import OrganisateurPhotos  # noqa: E402
+
+BIRTH_DATE = datetime(2023, 1, 1)
+
+
+def create_test_files(temp_dir: Path, count: int) -> None:
+    """Crée des fichiers répartis sur deux ans, dans un ordre de noms mélangé."""
+    photos_dir = temp_dir / "photos"
+    photos_dir.mkdir(exist_ok=True)
+
+    rng = random.Random(42)
+    indices = list(range(count))
+    rng.shuffle(indices)
+
+    for i in indices:
+        file_date = BIRTH_DATE + timedelta(days=rng.randrange(730))
+        filename = f"{file_date:%Y%m%d}_bench_{i:06d}.jpg"
+        # Tailles variées pour que les fichiers occupent des extents distincts
+        (photos_dir / filename).write_bytes(b"x" * rng.randrange(4_000, 64_000))
+
+
+def sync_disk() -> None:
+    """Force l'écriture des métadonnées pour inclure le coût disque réel."""
+    if hasattr(os, "sync"):
+        os.sync()
+
+
+def run_moves(organizer: OrganisateurPhotos, deplacements: list) -> float:
+    """Exécute une liste de déplacements et retourne la durée en secondes."""
+    for _, dossier_cible in deplacements:
+        dossier_cible.mkdir(exist_ok=True)
+
+    start = time.perf_counter()
+    for fichier, dossier_cible in deplacements:
+        organizer.copieur.deplacer_fichier(fichier, dossier_cible)
+    sync_disk()
+    return time.perf_counter() - start
+
+
+def measure_ordering(file_count: int, work_dir: Path = None) -> dict:
+    """Compare l'ordre aléatoire et l'ordre trié par localité."""
+    with tempfile.TemporaryDirectory(dir=work_dir) as temp_dir:
+        temp_path = Path(temp_dir)
+        print(f"Création de {file_count} fichiers de test...")
+        create_test_files(temp_path, file_count)
+        sync_disk()
+
+        organizer = OrganisateurPhotos(
+            dossier_racine=temp_path,
+            sous_dossier_photos="photos",
+            date_naissance=BIRTH_DATE,
+        )
+
+        # 1. Ordre aléatoire (équivalent au parcours brut d'iterdir())
+        repartition = organizer.analyser_photos()
+        deplacements = [
+            (fichier, temp_path / nom_dossier)
+            for nom_dossier, fichiers in repartition.items()
+            for fichier in fichiers
+        ]
+        random.Random(0).shuffle(deplacements)
+        random_time = run_moves(organizer, deplacements)
+        organizer.reinitialiser()
+        sync_disk()
+
+        # 2. Ordre trié par dossier de destination puis par emplacement physique
+        start_plan = time.perf_counter()
+        deplacements = organizer.planifier().deplacements
+        plan_time = time.perf_counter() - start_plan
+        sorted_time = run_moves(organizer, deplacements)
+
+        return {
+            "file_count": file_count,
+            "random_time": random_time,
+            "sorted_time": sorted_time,
+            "plan_time": plan_time,
+        }
+
+
+def run_benchmarks():
+    """Lance le benchmark pour la taille demandée."""
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    work_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    print("Benchmark de l'ordre des deplacements MomentKeeper\n")
+    result = measure_ordering(file_count, work_dir)
+
+    print("\nRESUME")
+    print("=" * 50)
+    print(f"   Fichiers:              {result['file_count']}")
+    print(f"   Ordre aleatoire:       {result['random_time']:.2f}s")
+    print(
+        f"   Ordre trie (localite): {result['sorted_time']:.2f}s "
+        f"(+ {result['plan_time']:.2f}s de planification)"
+    )
+    if result["sorted_time"] > 0:
+        print(
+            f"   Gain:                  x{result['random_time'] / result['sorted_time']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmarks()
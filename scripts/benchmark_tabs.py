@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Benchmark du temps de rerun de l'application, vue par vue.
+
+Usage :
+    python scripts/benchmark_tabs.py [nb_photos] [nb_reruns]
+
+Le script crée un projet temporaire (petites photos JPEG réparties sur deux
+ans), lance l'application avec `streamlit.testing` puis mesure le temps moyen
+d'un rerun pour chaque vue. Seule la vue active est exécutée : le coût propre
+de chaque vue (rerun moins celui de l'accueil) n'est payé que lorsqu'elle est
+affichée, alors qu'avec des onglets chaque rerun payait la somme de tous.
+
+Vignettes et instantanés sont rangés dans le dossier temporaire : le benchmark
+n'écrit rien dans static/ ni dans data/user-config.
+"""
+
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from PIL import Image
+from streamlit.testing.v1 import AppTest
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import VUES  # noqa: E402
+from src.moment_keeper.config import SNAPSHOT_CONFIG, THUMBNAIL_CONFIG  # noqa: E402
+
+APP_PATH = Path(__file__).parent.parent / "app.py"
+BIRTH_DATE = date(2023, 1, 15)
+
+
+def create_test_photos(photos_dir: Path, count: int) -> None:
+    """Crée des photos JPEG datées (une image source copiée sous plusieurs noms)."""
+    photos_dir.mkdir(parents=True, exist_ok=True)
+    modele = photos_dir / "modele.jpg"
+    Image.new("RGB", (640, 480), (200, 150, 100)).save(modele, quality=85)
+
+    rng = random.Random(42)
+    for i in range(count):
+        jour = BIRTH_DATE + timedelta(days=rng.randrange(0, 730))
+        shutil.copyfile(modele, photos_dir / f"{jour:%Y%m%d}_photo_{i:06d}.jpg")
+    modele.unlink()
+
+
+def isoler_caches(dossier: Path) -> dict[str, str]:
+    """Dirige vignettes et instantanés vers un dossier temporaire.
+
+    Les sous-dossiers configurés sont joints au dossier du projet : un chemin
+    absolu prend leur place. L'application tourne dans ce processus
+    (`streamlit.testing`) et lit donc ces mêmes dictionnaires.
+
+    Returns:
+        Sous-dossiers d'origine, à rétablir avec `restaurer_caches`
+    """
+    origine = {
+        "vignettes": THUMBNAIL_CONFIG["sous_dossier"],
+        "instantanes": SNAPSHOT_CONFIG["sous_dossier"],
+    }
+    THUMBNAIL_CONFIG["sous_dossier"] = str(dossier / "thumbnails")
+    SNAPSHOT_CONFIG["sous_dossier"] = str(dossier / "snapshots")
+    return origine
+
+
+def restaurer_caches(origine: dict[str, str]) -> None:
+    """Rétablit les sous-dossiers de vignettes et d'instantanés."""
+    THUMBNAIL_CONFIG["sous_dossier"] = origine["vignettes"]
+    SNAPSHOT_CONFIG["sous_dossier"] = origine["instantanes"]
+
+
+def new_app(racine: Path) -> AppTest:
+    """Prépare une session configurée sur le projet de test."""
+    at = AppTest.from_file(str(APP_PATH), default_timeout=300)
+    at.session_state["dossier_path"] = str(racine)
+    at.session_state["sous_dossier_photos"] = "photos"
+    at.session_state["date_naissance"] = BIRTH_DATE
+    at.session_state["config_loaded"] = True
+    return at
+
+
+def time_view(at: AppTest, vue: str, reruns: int) -> tuple[float, float]:
+    """Affiche une vue puis mesure ses reruns.
+
+    Returns:
+        (premier affichage, rerun moyen) en secondes
+    """
+    start = time.perf_counter()
+    at.radio(key="vue_active").set_value(vue).run()
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"Vue {vue}: {at.exception[0].message}")
+
+    start = time.perf_counter()
+    for _ in range(reruns):
+        at.run()
+    return first, (time.perf_counter() - start) / reruns
+
+
+def mesurer_vues(racine: Path, photo_count: int, reruns: int) -> None:
+    """Affiche chaque vue et imprime le temps de ses reruns."""
+    at = new_app(racine)
+    at.run()
+
+    print(f"Benchmark des reruns par vue MomentKeeper ({photo_count} photos)\n")
+    print(
+        f"{'vue':<14} | {'1er affichage':>14} | {'rerun':>9} | {'coût de la vue':>14}"
+    )
+    print("=" * 62)
+    reruns_par_vue = {}
+    for vue in VUES:
+        first, rerun = time_view(at, vue, reruns)
+        reruns_par_vue[vue] = rerun
+        cout = rerun - reruns_par_vue[VUES[0]]
+        print(
+            f"{vue:<14} | {first * 1000:>11.0f} ms | {rerun * 1000:>6.0f} ms | "
+            f"{cout * 1000:>11.0f} ms"
+        )
+
+    # Avec st.tabs, chaque rerun exécutait l'accueil et toutes les autres vues
+    base = reruns_par_vue[VUES[0]]
+    toutes = base + sum(max(0.0, r - base) for r in reruns_par_vue.values())
+    print("-" * 62)
+    print(
+        f"Rerun si toutes les vues sont exécutées (estimation) : {toutes * 1000:.0f} ms"
+    )
+    print(
+        f"Rerun de la vue active : {base * 1000:.0f} à "
+        f"{max(reruns_par_vue.values()) * 1000:.0f} ms"
+    )
+
+
+def run_benchmark():
+    """Mesure chaque vue sur un projet temporaire."""
+    photo_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        racine = Path(temp_dir) / "projet"
+        create_test_photos(racine / "photos", photo_count)
+        origine = isoler_caches(Path(temp_dir) / "caches")
+        try:
+            mesurer_vues(racine, photo_count, reruns)
+        finally:
+            restaurer_caches(origine)
+
+
+if __name__ == "__main__":
+    run_benchmark()
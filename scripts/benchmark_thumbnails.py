@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Microbenchmark de la génération des vignettes : décodage complet vs draft.
+
+Usage :
+    python scripts/benchmark_thumbnails.py [dossier_photos] [taille]
+
+Pour chaque photo (par défaut data/test/photos), la vignette est générée de
+deux façons, chacune dans un processus neuf pour mesurer son pic mémoire :
+- décodage complet à la résolution native, rotation EXIF puis réduction
+  (ancienne méthode de la galerie) ;
+- `creer_vignette` : orientation lue dans l'en-tête, décodage JPEG réduit
+  par `draft` (échelle DCT 1/2, 1/4 ou 1/8) puis réduction rapide.
+
+Le gain est maximal sur les JPEG séquentiels (appareils photo, téléphones) ;
+un JPEG progressif doit encore lire tous ses coefficients avant l'IDCT réduite.
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.moment_keeper.thumbnails import (  # noqa: E402
+    creer_vignette,
+    extraire_vignette_exif,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+REPETITIONS = 3
+
+
+def full_decode_thumbnail(chemin: Path, taille: int) -> bytes:
+    """Ancienne méthode : image entière décodée et tournée avant réduction."""
+    image = ImageOps.exif_transpose(Image.open(chemin))
+    echelle = min(1.0, taille / min(image.size))
+    image = image.resize(
+        (round(image.width * echelle), round(image.height * echelle)),
+        Image.Resampling.LANCZOS,
+    )
+    tampon = BytesIO()
+    image.convert("RGB").save(tampon, format="JPEG", quality=85)
+    return tampon.getvalue()
+
+
+def peak_memory_kb() -> int:
+    """Pic de mémoire résidente du processus (Ko sous Linux), 0 si inconnu."""
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(methode: str, chemin: Path, taille: int) -> tuple[float, int, tuple]:
+    """Génère une vignette dans le processus courant (neuf).
+
+    Returns:
+        (durée moyenne en s, pic mémoire ajouté en Ko, taille de la vignette)
+    """
+    generer = creer_vignette if methode == "draft" else full_decode_thumbnail
+    avant = peak_memory_kb()
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        donnees = generer(chemin, taille)
+    duree = (time.perf_counter() - start) / REPETITIONS
+    return duree, peak_memory_kb() - avant, Image.open(BytesIO(donnees)).size
+
+
+def run_in_fresh_process(methode: str, chemin: Path, taille: int):
+    """Mesure une méthode dans un processus dédié (pic mémoire isolé)."""
+    with ProcessPoolExecutor(max_workers=1) as executeur:
+        return executeur.submit(measure, methode, chemin, taille).result()
+
+
+def run_benchmark():
+    """Compare les deux méthodes sur chaque photo du dossier."""
+    dossier = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("data/test/photos")
+    taille = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    photos = sorted(p for p in dossier.iterdir() if p.suffix.lower() == ".jpg")
+
+    print(f"Microbenchmark des vignettes MomentKeeper (côté court {taille} px)\n")
+    print(f"{'photo':<28} | {'Mpx':>5} | {'complet':>16} | {'draft':>16} | {'gain':>5}")
+    print("=" * 82)
+    total_complet = total_draft = 0.0
+    for photo in photos:
+        with Image.open(photo) as image:
+            megapixels = image.width * image.height / 1e6
+
+        complet, memoire_complet, _ = run_in_fresh_process("complet", photo, taille)
+        draft, memoire_draft, _ = run_in_fresh_process("draft", photo, taille)
+        total_complet += complet
+        total_draft += draft
+        print(
+            f"{photo.name[:28]:<28} | {megapixels:>5.1f} | "
+            f"{complet * 1000:>5.0f} ms {memoire_complet / 1024:>4.0f} Mo | "
+            f"{draft * 1000:>5.0f} ms {memoire_draft / 1024:>4.0f} Mo | "
+            f"x{complet / draft:.1f}"
+        )
+
+    print("-" * 82)
+    print(
+        f"Total : décodage complet {total_complet * 1000:.0f} ms, "
+        f"draft {total_draft * 1000:.0f} ms (x{total_complet / total_draft:.1f})"
+    )
+
+    # Aperçus tirés de la vignette EXIF intégrée (lecture de l'en-tête seulement)
+    start = time.perf_counter()
+    apercus = [extraire_vignette_exif(photo) for photo in photos]
+    duree = time.perf_counter() - start
+    disponibles = [apercu for apercu in apercus if apercu is not None]
+    print(
+        f"Vignettes EXIF intégrées : {len(disponibles)}/{len(photos)} photos, "
+        f"{duree / len(photos) * 1000:.1f} ms par photo"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Rapport mémoire du DataFrame d'analyse : types par défaut vs schéma compact.
+
+Usage :
+    python scripts/memory_report.py [nb_fichiers]
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark_extraction import BIRTH_DATE, create_file_names  # noqa: E402
+
+from src.moment_keeper.analytics import construire_donnees_photos  # noqa: E402
+from src.moment_keeper.organizer import OrganisateurPhotos  # noqa: E402
+
+# Types obtenus avant le schéma compact (chaînes Python et int64)
+SCHEMA_PAR_DEFAUT = {
+    "fichier": "object",
+    "type": "object",
+    "date": "datetime64[ns]",
+    "age_mois": "int64",
+    "dossier": "object",
+    "jour_semaine": "object",
+    "semaine": "int64",
+    "annee": "int64",
+}
+
+
+def memory_by_column(df: pd.DataFrame) -> pd.Series:
+    """Mémoire occupée par colonne en Mo (chaînes comprises)."""
+    return df.memory_usage(deep=True, index=False) / (1024 * 1024)
+
+
+def run_report():
+    """Compare la mémoire des deux schémas colonne par colonne."""
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    organiseur = OrganisateurPhotos(Path("."), "photos", BIRTH_DATE)
+    noms, dossiers = create_file_names(file_count)
+
+    compact = construire_donnees_photos(
+        noms, dossiers, organiseur.date_naissance, organiseur.extensions_actives
+    )
+    par_defaut = compact.astype(SCHEMA_PAR_DEFAUT)
+
+    avant = memory_by_column(par_defaut)
+    apres = memory_by_column(compact)
+
+    print(f"Rapport mémoire MomentKeeper ({len(compact)} lignes)\n")
+    print(f"{'colonne':<14} | {'type':<14} | {'avant':>10} | {'après':>10}")
+    print("=" * 58)
+    for colonne in compact.columns:
+        print(
+            f"{colonne:<14} | {str(compact[colonne].dtype):<14} | "
+            f"{avant[colonne]:>7.1f} Mo | {apres[colonne]:>7.1f} Mo"
+        )
+    print("-" * 58)
+    print(
+        f"{'total':<14} | {'':<14} | {avant.sum():>7.1f} Mo | {apres.sum():>7.1f} Mo"
+        f"  (x{avant.sum() / apres.sum():.1f})"
+    )
+
+
+if __name__ == "__main__":
+    run_report()
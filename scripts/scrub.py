@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Vérification incrémentale de l'intégrité des dossiers mensuels.
+
+Usage :
+    python scripts/scrub.py <dossier_principal> [budget_GB] [debit_MB_s]
+
+À planifier (cron, planificateur de tâches) une fois par nuit : chaque
+exécution relit une tranche limitée de la bibliothèque, en commençant par les
+fichiers vérifiés il y a le plus longtemps.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.moment_keeper.config import SCRUB_CONFIG  # noqa: E402
+from src.moment_keeper.io_scheduler import IOScheduler  # noqa: E402
+from src.moment_keeper.scrub import scrub  # noqa: E402
+
+
+def main() -> int:
+    """Lance une passe de scrub et affiche le rapport."""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 2
+
+    dossier_racine = Path(sys.argv[1])
+    budget = (
+        int(float(sys.argv[2]) * 1024**3)
+        if len(sys.argv) > 2
+        else SCRUB_CONFIG["budget_octets"]
+    )
+    debit = (
+        float(sys.argv[3]) * 1024 * 1024
+        if len(sys.argv) > 3
+        else SCRUB_CONFIG["octets_par_seconde"]
+    )
+
+    print(f"Scrub de {dossier_racine} (budget {budget / 1024**3:.1f} GB)")
+    rapport = scrub(dossier_racine, budget, IOScheduler(debit))
+
+    print("\nRAPPORT")
+    print("=" * 50)
+    print(f"   Fichiers verifies:       {rapport.verifies}")
+    print(f"   Nouveaux fichiers:       {rapport.nouveaux}")
+    print(f"   Fichiers modifies:       {rapport.modifies}")
+    print(f"   Donnees relues:          {rapport.octets_lus / 1024**3:.2f} GB")
+    print(f"   Restants (prochaine fois): {rapport.restants}")
+
+    for cle in rapport.manquants:
+        print(f"   MANQUANT  {cle}")
+    for cle in rapport.corrompus:
+        print(f"   CORROMPU  {cle}")
+
+    return 1 if rapport.corrompus else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
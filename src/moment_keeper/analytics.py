@@ -1,57 +1,615 @@
 """Module d'analyse et de statistiques pour MomentKeeper."""
 
+import html
+import os
 import random
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import streamlit as st
 from PIL import Image, ImageOps
 
 from .config import CHART_CONFIG, INSIGHTS_THRESHOLDS
-from .organizer import OrganisateurPhotos
+from .gallery import Curseur, IndexGalerie
+from .organizer import (
+    EXTENSIONS_PHOTOS,
+    EXTENSIONS_VIDEOS,
+    ChangementFichier,
+    OrganisateurPhotos,
+)
 from .theme import BAR_CHART_GRADIENT, COLORS, HEATMAP_COLORSCALE
 from .translations import Translator
 
+JOURS_SEMAINE = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+
+# Schéma compact du DataFrame d'analyse (une ligne par fichier) : catégories
+# pour les colonnes répétitives, entiers courts, dates à la seconde
+SCHEMA_DONNEES_PHOTOS = {
+    "fichier": "object",
+    "type": pd.CategoricalDtype(["photo", "video", "unknown"]),
+    "date": "datetime64[s]",
+    "age_mois": "int16",
+    "dossier": "category",
+    "jour_semaine": pd.CategoricalDtype(JOURS_SEMAINE, ordered=True),
+    "semaine": "int8",
+    "annee": "int16",
+}
+
+# Extension finale précédée d'au moins un caractère, comme Path.suffix
+MOTIF_EXTENSION = r"(?s)^.+\.([^.]+)$"
+
+
+def donnees_photos_vides() -> pd.DataFrame:
+    """Retourne un DataFrame d'analyse vide, typé selon le schéma."""
+    return pd.DataFrame(
+        {
+            colonne: pd.Series(dtype=type_)
+            for colonne, type_ in SCHEMA_DONNEES_PHOTOS.items()
+        }
+    )
+
+
+def lister_fichiers_projet(dossier_racine: Path) -> tuple[list[str], list[str]]:
+    """Liste les fichiers de tous les dossiers du projet (source + dossiers mensuels).
+
+    Returns:
+        Noms des fichiers et nom du dossier de chacun, dans l'ordre du parcours
+    """
+    noms, dossiers = [], []
+    for dossier in os.scandir(dossier_racine):
+        if dossier.is_dir():
+            for fichier in os.scandir(dossier.path):
+                if fichier.is_file():
+                    noms.append(fichier.name)
+                    dossiers.append(dossier.name)
+    return noms, dossiers
+
+
+def construire_donnees_photos(
+    noms: list[str],
+    dossiers: list[str],
+    date_naissance: datetime,
+    extensions_actives: set[str],
+) -> pd.DataFrame:
+    """Construit le DataFrame d'analyse colonne par colonne.
+
+    Même règles que l'extraction fichier par fichier : date YYYYMMDD avant le
+    premier "_", photos antérieures à la naissance ignorées, âge en mois
+    calendaires. Le jour de la semaine est en anglais quelle que soit la locale.
+    Les colonnes sont créées directement avec les types de SCHEMA_DONNEES_PHOTOS.
+    """
+    if not noms:
+        return donnees_photos_vides()
+
+    noms = pd.Series(noms, dtype=object)
+    dossiers = pd.Series(dossiers, dtype=object)
+
+    # Extension au sens de Path.suffix : au moins un caractère avant le point
+    # (".jpg" seul n'a pas d'extension)
+    extensions = "." + noms.str.extract(MOTIF_EXTENSION, expand=False).str.lower()
+    garder = extensions.isin(extensions_actives)
+
+    # Date YYYYMMDD avant le premier "_" : les 9 premiers caractères suffisent,
+    # vérifiés sur leurs points de code sans boucle Python
+    debuts = np.array(noms, dtype="U9")
+    codes = debuts.view(np.uint32).reshape(len(debuts), 9)
+    format_valide = ((codes[:, :8] >= ord("0")) & (codes[:, :8] <= ord("9"))).all(
+        axis=1
+    ) & (codes[:, 8] == ord("_"))
+    dates = pd.Series(pd.NaT, index=noms.index, dtype="datetime64[ns]")
+    dates[format_valide] = pd.to_datetime(
+        debuts[format_valide].astype("U8"), format="%Y%m%d", errors="coerce"
+    )
+    garder &= dates.notna() & (dates >= pd.Timestamp(date_naissance))
+
+    if not garder.any():
+        return donnees_photos_vides()
+
+    dates = dates[garder].reset_index(drop=True).astype("datetime64[s]")
+    extensions = extensions[garder].reset_index(drop=True)
+
+    # Âge en mois calendaires, diminué si le jour anniversaire n'est pas atteint
+    age_mois = (dates.dt.year - date_naissance.year) * 12 + (
+        dates.dt.month - date_naissance.month
+    )
+    age_mois -= (dates.dt.day < date_naissance.day).astype(int)
+
+    return pd.DataFrame(
+        {
+            "fichier": noms[garder].reset_index(drop=True),
+            "type": pd.Categorical.from_codes(
+                np.select(
+                    [
+                        extensions.isin(EXTENSIONS_PHOTOS),
+                        extensions.isin(EXTENSIONS_VIDEOS),
+                    ],
+                    [0, 1],
+                    2,
+                ),
+                dtype=SCHEMA_DONNEES_PHOTOS["type"],
+            ),
+            "date": dates,
+            "age_mois": age_mois.clip(lower=0).astype("int16"),
+            "dossier": dossiers[garder].reset_index(drop=True).astype("category"),
+            "jour_semaine": pd.Categorical.from_codes(
+                dates.dt.dayofweek, dtype=SCHEMA_DONNEES_PHOTOS["jour_semaine"]
+            ),
+            "semaine": dates.dt.isocalendar().week.astype("int8"),
+            "annee": dates.dt.year.astype("int16"),
+        }
+    )
+
 
 def extract_photo_data(organiseur: OrganisateurPhotos) -> pd.DataFrame:
     """Extrait les données des photos pour l'analyse."""
-    photos_data = []
+    noms, dossiers = lister_fichiers_projet(organiseur.dossier_racine)
+    return construire_donnees_photos(
+        noms, dossiers, organiseur.date_naissance, organiseur.extensions_actives
+    )
 
-    # Parcourir tous les dossiers du projet (source + dossiers mensuels)
-    for dossier in organiseur.dossier_racine.iterdir():
-        if dossier.is_dir():
-            for fichier in dossier.iterdir():
-                if (
-                    fichier.is_file()
-                    and fichier.suffix.lower() in organiseur.extensions_actives
-                ):
-                    # Réutiliser la méthode existante pour extraire la date
-                    date_photo = organiseur.extraire_date_nom_fichier(fichier.name)
 
-                    if date_photo and date_photo >= organiseur.date_naissance:
-                        # Réutiliser la méthode existante pour calculer l'âge
-                        age_mois = organiseur.calculer_age_mois(date_photo)
-
-                        photos_data.append(
-                            {
-                                "fichier": fichier.name,
-                                "type": organiseur.get_file_type(fichier),
-                                "date": date_photo,
-                                "age_mois": age_mois,
-                                "dossier": dossier.name,
-                                "jour_semaine": date_photo.strftime("%A"),
-                                "semaine": date_photo.isocalendar()[1],
-                                "annee": date_photo.year,
-                            }
-                        )
+class PhotoAggregates:
+    """Comptages par jour, par mois d'âge et par type partagés par les analyses.
+
+    La bibliothèque est représentée par un tableau dense de comptages quotidiens
+    (int32) indexé par le nombre de jours depuis l'origine : la date de naissance
+    si elle est fournie, sinon le jour de la première photo. Écarts, jour record
+    et fenêtres glissantes se calculent directement sur ce tableau, dont la
+    taille dépend de la durée couverte et non du nombre de fichiers.
+
+    L'ajout ou le retrait d'un fichier est en O(1) (amorti). Les séries pandas
+    exposées sont dérivées à la demande et gardées en cache jusqu'à la
+    modification suivante ; `version` est incrémenté à chaque modification.
+    """
 
-    return pd.DataFrame(photos_data)
+    def __init__(self, df: pd.DataFrame, date_naissance: datetime = None):
+        self.version = 0
+        self._derives = {}
+        self.origine = (
+            np.datetime64(pd.Timestamp(date_naissance).normalize(), "D")
+            if date_naissance is not None
+            else None
+        )
 
+        if df.empty:
+            self.comptes_jours = np.zeros(0, dtype=np.int32)
+            self.comptes_mois = np.zeros(0, dtype=np.int32)
+            self.comptes_types = {}
+            return
+
+        jours = df["date"].to_numpy().astype("datetime64[D]")
+        premier_jour = jours.min()
+        if self.origine is None or premier_jour < self.origine:
+            self.origine = premier_jour
+
+        self.comptes_jours = np.bincount(
+            (jours - self.origine).astype(np.int64)
+        ).astype(np.int32)
+        self.comptes_mois = np.bincount(df["age_mois"].to_numpy()).astype(np.int32)
+        self.comptes_types = (
+            {
+                type_: int(nombre)
+                for type_, nombre in df["type"].value_counts().items()
+                if nombre
+            }
+            if "type" in df.columns
+            else {}
+        )
 
-def calculate_metrics(df: pd.DataFrame, type_fichiers: str = None) -> dict:
+    # Mises à jour incrémentales
+
+    def ajouter(
+        self, date: datetime, age_mois: int, type_fichier: str = None, nombre: int = 1
+    ) -> None:
+        """Compte `nombre` fichiers supplémentaires pris le jour `date`."""
+        indice = self._indice_jour(date, etendre=True)
+        self.comptes_jours[indice] += nombre
+        self.comptes_mois = self._etendre(self.comptes_mois, age_mois + 1)
+        self.comptes_mois[age_mois] += nombre
+        if type_fichier is not None:
+            self.comptes_types[type_fichier] = (
+                self.comptes_types.get(type_fichier, 0) + nombre
+            )
+        self._modifie()
+
+    def retirer(
+        self, date: datetime, age_mois: int, type_fichier: str = None, nombre: int = 1
+    ) -> None:
+        """Retire `nombre` fichiers pris le jour `date` des comptages."""
+        indice = self._indice_jour(date)
+        if (
+            indice is None
+            or self.comptes_jours[indice] < nombre
+            or age_mois >= len(self.comptes_mois)
+            or self.comptes_mois[age_mois] < nombre
+        ):
+            raise ValueError(f"Aucun fichier à retirer le {date:%Y-%m-%d}")
+
+        self.comptes_jours[indice] -= nombre
+        self.comptes_mois[age_mois] -= nombre
+        if type_fichier is not None and type_fichier in self.comptes_types:
+            self.comptes_types[type_fichier] -= nombre
+            if self.comptes_types[type_fichier] <= 0:
+                del self.comptes_types[type_fichier]
+        self._modifie()
+
+    def _indice_jour(self, date: datetime, etendre: bool = False):
+        """Retourne l'indice du jour `date`, en agrandissant le tableau si besoin."""
+        jour = np.datetime64(pd.Timestamp(date).normalize(), "D")
+        if self.origine is None:
+            self.origine = jour
+
+        indice = int((jour - self.origine).astype(np.int64))
+        if indice < 0:
+            if not etendre:
+                return None
+            # Jour antérieur à l'origine : on décale (rare, coût en O(jours))
+            self.comptes_jours = np.concatenate(
+                [np.zeros(-indice, dtype=np.int32), self.comptes_jours]
+            )
+            self.origine = jour
+            return 0
+        if indice >= len(self.comptes_jours):
+            if not etendre:
+                return None
+            self.comptes_jours = self._etendre(self.comptes_jours, indice + 1)
+        return indice
+
+    @staticmethod
+    def _etendre(tableau: np.ndarray, taille: int) -> np.ndarray:
+        """Agrandit un tableau de comptages par doublement de capacité."""
+        if taille <= len(tableau):
+            return tableau
+        agrandi = np.zeros(max(taille, 2 * len(tableau)), dtype=tableau.dtype)
+        agrandi[: len(tableau)] = tableau
+        return agrandi
+
+    def _modifie(self) -> None:
+        self.version += 1
+        self._derives.clear()
+
+    def _derive(self, cle: str, calcul):
+        """Retourne une valeur dérivée, calculée une fois par version."""
+        if cle not in self._derives:
+            self._derives[cle] = calcul()
+        return self._derives[cle]
+
+    # Requêtes sur le tableau dense
+
+    @property
+    def total(self) -> int:
+        """Nombre total de fichiers comptés."""
+        return int(self._cumul[-1]) if len(self._cumul) else 0
+
+    @property
+    def jours_actifs(self) -> np.ndarray:
+        """Indices (jours depuis l'origine) des jours ayant au moins une photo."""
+        return self._derive("jours_actifs", lambda: np.flatnonzero(self.comptes_jours))
+
+    @property
+    def _cumul(self) -> np.ndarray:
+        return self._derive(
+            "cumul", lambda: np.cumsum(self.comptes_jours, dtype=np.int64)
+        )
+
+    def date_du_jour(self, indice: int) -> pd.Timestamp:
+        """Convertit un indice du tableau en date."""
+        return pd.Timestamp(self.origine + np.timedelta64(int(indice), "D"))
+
+    @property
+    def derniere_date(self) -> pd.Timestamp:
+        """Date de la dernière photo, ou None si la bibliothèque est vide."""
+        jours = self.jours_actifs
+        return self.date_du_jour(jours[-1]) if len(jours) else None
+
+    def jour_record(self) -> tuple:
+        """Retourne (date, nombre) du jour le plus photographié."""
+        if not len(self.jours_actifs):
+            return None, 0
+        indice = int(np.argmax(self.comptes_jours))
+        return self.date_du_jour(indice), int(self.comptes_jours[indice])
+
+    def ecarts(self) -> np.ndarray:
+        """Écarts en jours entre jours actifs consécutifs."""
+        return self._derive("ecarts", lambda: np.diff(self.jours_actifs))
+
+    def compter_entre(self, debut: datetime = None, fin: datetime = None) -> int:
+        """Nombre de fichiers pris entre `debut` (inclus) et `fin` (exclu).
+
+        Les bornes sont arrondies au jour suivant lorsqu'elles comportent une
+        heure, comme une comparaison avec des dates à minuit. Le calcul utilise
+        les sommes cumulées : O(1) quel que soit l'intervalle.
+        """
+        if self.origine is None or not len(self.comptes_jours):
+            return 0
+        cumul = self._cumul
+
+        def borne(date, defaut):
+            if date is None:
+                return defaut
+            ecart = (pd.Timestamp(date) - pd.Timestamp(self.origine)) / pd.Timedelta(
+                days=1
+            )
+            return int(min(max(np.ceil(ecart), 0), len(cumul)))
+
+        i_debut = borne(debut, 0)
+        i_fin = borne(fin, len(cumul))
+        if i_fin <= i_debut:
+            return 0
+        return int(cumul[i_fin - 1] - (cumul[i_debut - 1] if i_debut else 0))
+
+    # Séries dérivées
+
+    @property
+    def dates_uniques(self) -> pd.DatetimeIndex:
+        """Jours ayant au moins une photo, triés."""
+        return self._derive(
+            "dates_uniques",
+            lambda: pd.DatetimeIndex(
+                (
+                    self.origine + self.jours_actifs.astype("timedelta64[D]")
+                    if self.origine is not None
+                    else []
+                ),
+                name="date",
+            ),
+        )
+
+    @property
+    def photos_par_jour(self) -> pd.Series:
+        """Nombre de photos par jour actif."""
+        return self._derive(
+            "photos_par_jour",
+            lambda: pd.Series(
+                self.comptes_jours[self.jours_actifs].astype(np.int64),
+                index=self.dates_uniques,
+            ),
+        )
+
+    @property
+    def photos_par_mois(self) -> pd.Series:
+        """Nombre de photos par mois d'âge (mois sans photo exclus)."""
+
+        def calcul():
+            mois = np.flatnonzero(self.comptes_mois)
+            return pd.Series(
+                self.comptes_mois[mois].astype(np.int64),
+                index=pd.Index(mois, name="age_mois"),
+            )
+
+        return self._derive("photos_par_mois", calcul)
+
+    @property
+    def photos_par_jour_semaine(self) -> pd.Series:
+        """Nombre de photos par jour de la semaine (noms anglais, ordre alphabétique)."""
+
+        def calcul():
+            jours = self.jours_actifs
+            if not len(jours):
+                return pd.Series(dtype="int64")
+            # 1970-01-01 était un jeudi (3 avec lundi = 0)
+            premier = (self.origine.astype(np.int64) + 3) % 7
+            comptes = np.bincount(
+                (jours + premier) % 7,
+                weights=self.comptes_jours[jours],
+                minlength=7,
+            ).astype(np.int64)
+            serie = pd.Series(comptes, index=JOURS_SEMAINE)
+            return serie[serie > 0].sort_index()
+
+        return self._derive("photos_par_jour_semaine", calcul)
+
+    @property
+    def photos_par_semaine(self) -> pd.Series:
+        """Nombre de photos par semaine ISO ("AAAA-Wss")."""
+        return self._derive(
+            "photos_par_semaine",
+            lambda: self.photos_par_jour.groupby(
+                self.dates_uniques.strftime("%G-W%V")
+            ).sum(),
+        )
+
+
+class EtatAnalytique:
+    """DataFrame d'analyse et agrégats tenus à jour par les événements de l'organisateur.
+
+    L'organisateur signale chaque fichier déplacé, copié ou supprimé (`recevoir`
+    est branché sur `OrganisateurPhotos.ecouteurs`). Les changements sont mis
+    en attente puis appliqués par lot lors de l'appel suivant à `appliquer` :
+    un déplacement change le dossier de la ligne concernée, une copie ajoute
+    une ligne et incrémente les compteurs, une suppression retire la ligne.
+    Aucun parcours de la bibliothèque.
+    """
+
+    def __init__(self, organiseur: OrganisateurPhotos, df: pd.DataFrame = None):
+        self.organiseur = organiseur
+        self.df = extract_photo_data(organiseur) if df is None else df
+        self.aggregates = PhotoAggregates(self.df, organiseur.date_naissance)
+        self.version = 0
+        self._en_attente: list[ChangementFichier] = []
+        self._verrou = threading.Lock()
+        # (dossier, fichier) -> étiquette de ligne dans self.df
+        self._positions = {
+            cle: etiquette
+            for etiquette, cle in zip(
+                self.df.index, zip(self.df["dossier"], self.df["fichier"])
+            )
+        }
+
+    def recevoir(self, changement: ChangementFichier) -> None:
+        """Met en attente un changement signalé par l'organisateur."""
+        with self._verrou:
+            self._en_attente.append(changement)
+
+    def _cle(self, chemin: Path):
+        """Clé (dossier, fichier) d'un chemin, ou None s'il n'est pas analysé."""
+        if chemin.parent.parent != self.organiseur.dossier_racine:
+            return None
+        return chemin.parent.name, chemin.name
+
+    def appliquer(self) -> bool:
+        """Applique les changements en attente.
+
+        Returns:
+            True si le DataFrame ou les agrégats ont changé
+        """
+        with self._verrou:
+            changements, self._en_attente = self._en_attente, []
+        if not changements:
+            return False
+
+        nouveaux_dossiers = {}  # étiquette -> nouveau dossier
+        a_supprimer = []
+        a_ajouter = {}  # clé -> None (ordre d'arrivée conservé)
+
+        for changement in changements:
+            cle_source = self._cle(changement.source)
+            if changement.action == "supprime":
+                if cle_source in a_ajouter:
+                    del a_ajouter[cle_source]
+                elif cle_source in self._positions:
+                    a_supprimer.append(self._positions.pop(cle_source))
+                continue
+
+            cle_destination = self._cle(changement.destination)
+            if cle_destination is None:
+                continue
+
+            if changement.action == "copie":
+                if cle_destination not in self._positions:
+                    a_ajouter[cle_destination] = None
+                continue
+
+            # Déplacement
+            if cle_source in a_ajouter:
+                del a_ajouter[cle_source]
+                a_ajouter[cle_destination] = None
+                continue
+            etiquette = self._positions.pop(cle_source, None)
+            if cle_destination in self._positions:
+                if etiquette is not None:
+                    a_supprimer.append(etiquette)
+            elif etiquette is not None:
+                self._positions[cle_destination] = etiquette
+                nouveaux_dossiers[etiquette] = cle_destination[0]
+            else:
+                # Fichier venu d'un dossier non analysé
+                a_ajouter[cle_destination] = None
+
+        self._supprimer_lignes(a_supprimer)
+        self._changer_dossiers(nouveaux_dossiers)
+        self._ajouter_lignes(list(a_ajouter))
+        self.version += 1
+        return True
+
+    def _supprimer_lignes(self, etiquettes: list) -> None:
+        if not etiquettes:
+            return
+        supprimees = self.df.loc[etiquettes]
+        for ligne in supprimees.itertuples(index=False):
+            self.aggregates.retirer(ligne.date, ligne.age_mois, ligne.type)
+        self.df = self.df.drop(index=etiquettes)
+
+    def _changer_dossiers(self, nouveaux_dossiers: dict) -> None:
+        if not nouveaux_dossiers:
+            return
+        dossiers = self.df["dossier"]
+        manquants = set(nouveaux_dossiers.values()) - set(dossiers.cat.categories)
+        if manquants:
+            self.df["dossier"] = dossiers.cat.add_categories(sorted(manquants))
+        self.df.loc[list(nouveaux_dossiers), "dossier"] = list(
+            nouveaux_dossiers.values()
+        )
+
+    def _ajouter_lignes(self, cles: list) -> None:
+        if not cles:
+            return
+        dossiers, noms = zip(*cles)
+        nouvelles = construire_donnees_photos(
+            list(noms),
+            list(dossiers),
+            self.organiseur.date_naissance,
+            self.organiseur.extensions_actives,
+        )
+        if nouvelles.empty:
+            return
+
+        debut = self.df.index.max() + 1 if len(self.df) else 0
+        nouvelles.index = pd.RangeIndex(debut, debut + len(nouvelles))
+
+        # Même catégories de dossiers des deux côtés pour que la concaténation
+        # reste catégorielle
+        categories = self.df["dossier"].cat.categories.union(
+            nouvelles["dossier"].cat.categories
+        )
+        self.df["dossier"] = self.df["dossier"].cat.set_categories(categories)
+        nouvelles["dossier"] = nouvelles["dossier"].cat.set_categories(categories)
+        self.df = pd.concat([self.df, nouvelles])
+
+        for etiquette, ligne in zip(nouvelles.index, nouvelles.itertuples(index=False)):
+            self._positions[(ligne.dossier, ligne.fichier)] = etiquette
+            self.aggregates.ajouter(ligne.date, ligne.age_mois, ligne.type)
+
+    def verifier_coherence(self) -> list[str]:
+        """Compare l'état incrémental à un recalcul complet.
+
+        Returns:
+            Liste des différences (vide si l'état est cohérent)
+        """
+        self.appliquer()
+        reference = extract_photo_data(self.organiseur)
+        aggregates_reference = PhotoAggregates(
+            reference, self.organiseur.date_naissance
+        )
+        differences = []
+
+        def lignes(df: pd.DataFrame) -> pd.DataFrame:
+            return (
+                df.astype(str)
+                .sort_values(["dossier", "fichier"])
+                .reset_index(drop=True)
+            )
+
+        if not lignes(self.df).equals(lignes(reference)):
+            differences.append(
+                f"DataFrame : {len(self.df)} lignes incrémentales, "
+                f"{len(reference)} après recalcul"
+            )
+
+        for attribut in [
+            "photos_par_jour",
+            "photos_par_mois",
+            "photos_par_jour_semaine",
+            "photos_par_semaine",
+        ]:
+            if not getattr(self.aggregates, attribut).equals(
+                getattr(aggregates_reference, attribut)
+            ):
+                differences.append(f"Agrégat {attribut} différent")
+
+        if self.aggregates.comptes_types != aggregates_reference.comptes_types:
+            differences.append("Comptes par type différents")
+
+        return differences
+
+
+def calculate_metrics(
+    df: pd.DataFrame, type_fichiers: str = None, aggregates: PhotoAggregates = None
+) -> dict:
     """Calcule toutes les métriques pour l'onglet Analytics."""
     if df.empty:
         return {
@@ -64,13 +622,16 @@ def calculate_metrics(df: pd.DataFrame, type_fichiers: str = None) -> dict:
             "max_gap": 0,
         }
 
+    if aggregates is None:
+        aggregates = PhotoAggregates(df)
+
     # Métriques de base avec distinction photo/vidéo si nécessaire
     if type_fichiers == "📸🎬 Photos et Vidéos" and "type" in df.columns:
-        total_photos = len(df[df["type"] == "photo"])
-        total_videos = len(df[df["type"] == "video"])
+        total_photos = aggregates.comptes_types.get("photo", 0)
+        total_videos = aggregates.comptes_types.get("video", 0)
         total_fichiers = total_photos + total_videos
     else:
-        total_fichiers = len(df)
+        total_fichiers = aggregates.total
         total_photos = (
             total_fichiers if type_fichiers and "Photos" in type_fichiers else 0
         )
@@ -78,23 +639,18 @@ def calculate_metrics(df: pd.DataFrame, type_fichiers: str = None) -> dict:
             total_fichiers if type_fichiers and "Vidéos" in type_fichiers else 0
         )
 
-    periode_couverte = df["age_mois"].max() + 1 if not df.empty else 0
+    periode_couverte = aggregates.photos_par_mois.index.max() + 1
     moyenne_par_mois = total_fichiers / periode_couverte if periode_couverte > 0 else 0
 
     # Date de la dernière photo
-    derniere_photo = df["date"].max()
+    derniere_photo = aggregates.derniere_date
 
     # Jour record
-    photos_par_jour = df.groupby(df["date"].dt.date).size()
-    jour_record = photos_par_jour.max() if not photos_par_jour.empty else 0
+    _, jour_record = aggregates.jour_record()
 
     # Plus long gap
-    dates_uniques = sorted(df["date"].dt.date.unique())
-    max_gap = 0
-    if len(dates_uniques) > 1:
-        for i in range(1, len(dates_uniques)):
-            gap = (dates_uniques[i] - dates_uniques[i - 1]).days
-            max_gap = max(max_gap, gap)
+    ecarts = aggregates.ecarts()
+    max_gap = int(ecarts.max()) if len(ecarts) else 0
 
     return {
         "total_photos": total_photos,
@@ -109,7 +665,7 @@ def calculate_metrics(df: pd.DataFrame, type_fichiers: str = None) -> dict:
 
 
 def find_gaps(
-    df: pd.DataFrame, min_gap_days: int = None
+    df: pd.DataFrame, min_gap_days: int = None, aggregates: PhotoAggregates = None
 ) -> list[tuple[datetime, datetime, int]]:
     """Trouve les gaps temporels dans les photos."""
     if min_gap_days is None:
@@ -118,15 +674,20 @@ def find_gaps(
     if df.empty:
         return []
 
-    dates_uniques = sorted(df["date"].dt.date.unique())
-    gaps = []
+    if aggregates is None:
+        aggregates = PhotoAggregates(df)
 
-    for i in range(1, len(dates_uniques)):
-        gap_days = (dates_uniques[i] - dates_uniques[i - 1]).days
-        if gap_days >= min_gap_days:
-            gaps.append((dates_uniques[i - 1], dates_uniques[i], gap_days))
+    jours = aggregates.jours_actifs
+    ecarts = aggregates.ecarts()
 
-    return gaps
+    return [
+        (
+            aggregates.date_du_jour(jours[i]),
+            aggregates.date_du_jour(jours[i + 1]),
+            int(ecarts[i]),
+        )
+        for i in np.flatnonzero(ecarts >= min_gap_days)
+    ]
 
 
 def age_to_month_name(
@@ -171,7 +732,10 @@ def age_to_month_name(
 
 
 def detect_special_moments(
-    df: pd.DataFrame, jour_record_existant: int, tr: Translator
+    df: pd.DataFrame,
+    jour_record_existant: int,
+    tr: Translator,
+    aggregates: PhotoAggregates = None,
 ) -> list[str]:
     """Détecte les moments spéciaux basés sur les pics de photos."""
     special_insights = []
@@ -179,32 +743,34 @@ def detect_special_moments(
     if df.empty:
         return special_insights
 
-    # Analyser les pics de photos par jour
-    photos_par_jour = df.groupby(df["date"].dt.date).size()
-    moyenne_quotidienne = photos_par_jour.mean()
+    if aggregates is None:
+        aggregates = PhotoAggregates(df)
+
+    # Analyser les pics de photos par jour (moyenne sur les jours actifs)
+    comptes = aggregates.comptes_jours
+    moyenne_quotidienne = aggregates.total / len(aggregates.jours_actifs)
     seuil_pic = max(
         moyenne_quotidienne * INSIGHTS_THRESHOLDS["special_event_multiplier"],
         INSIGHTS_THRESHOLDS["special_event_min"],
     )
 
-    pics = photos_par_jour[photos_par_jour >= seuil_pic]
+    jours_pics = np.flatnonzero(comptes >= seuil_pic)
 
-    if len(pics) > 1:  # Plusieurs événements spéciaux détectés
+    if len(jours_pics) > 1:  # Plusieurs événements spéciaux détectés
         # Afficher quelques dates d'exemple (max 3)
-        dates_exemples = sorted(pics.index)[:3]
+        dates_exemples = [aggregates.date_du_jour(j) for j in jours_pics[:3]]
         dates_str = ", ".join([d.strftime("%d/%m") for d in dates_exemples])
-        if len(pics) > 3:
+        if len(jours_pics) > 3:
             dates_str += "..."
 
         special_insights.append(
-            f"🎉 {len(pics)} événements spéciaux détectés ({dates_str})"
+            f"🎉 {len(jours_pics)} événements spéciaux détectés ({dates_str})"
             if tr.language == "fr"
-            else f"🎉 {len(pics)} special events detected ({dates_str})"
+            else f"🎉 {len(jours_pics)} special events detected ({dates_str})"
         )
 
         # Suggestions d'événements selon les pics
-        pic_max = pics.max()
-        date_pic_max = pics.idxmax()
+        date_pic_max, pic_max = aggregates.jour_record()
 
         if pic_max >= INSIGHTS_THRESHOLDS["major_event_threshold"]:
             special_insights.append(
@@ -219,27 +785,27 @@ def detect_special_moments(
                 else f"🎈 Great day on {date_pic_max.strftime('%d/%m/%Y')} - Family outing? First birthday?"
             )
 
-    # Détection de séries de photos
-    dates_pics = sorted(pics.index)
-    if len(dates_pics) >= 2:
-        for i in range(1, len(dates_pics)):
-            if (dates_pics[i] - dates_pics[i - 1]).days <= INSIGHTS_THRESHOLDS[
-                "intensive_period_gap"
-            ]:
-                date_debut = dates_pics[i - 1]
-                date_fin = dates_pics[i]
-                special_insights.append(
-                    f"🏖️ Période intensive {date_debut.strftime('%d/%m')} - {date_fin.strftime('%d/%m')} - Vacances ou événement ?"
-                    if tr.language == "fr"
-                    else f"🏖️ Intensive period {date_debut.strftime('%d/%m')} - {date_fin.strftime('%d/%m')} - Vacation or event?"
-                )
-                break
+    # Détection de séries de photos : deux pics rapprochés
+    rapproches = np.flatnonzero(
+        np.diff(jours_pics) <= INSIGHTS_THRESHOLDS["intensive_period_gap"]
+    )
+    if len(rapproches):
+        date_debut = aggregates.date_du_jour(jours_pics[rapproches[0]])
+        date_fin = aggregates.date_du_jour(jours_pics[rapproches[0] + 1])
+        special_insights.append(
+            f"🏖️ Période intensive {date_debut.strftime('%d/%m')} - {date_fin.strftime('%d/%m')} - Vacances ou événement ?"
+            if tr.language == "fr"
+            else f"🏖️ Intensive period {date_debut.strftime('%d/%m')} - {date_fin.strftime('%d/%m')} - Vacation or event?"
+        )
 
     return special_insights
 
 
 def generate_temporal_comparisons(
-    df: pd.DataFrame, date_naissance: datetime, tr: Translator
+    df: pd.DataFrame,
+    date_naissance: datetime,
+    tr: Translator,
+    aggregates: PhotoAggregates = None,
 ) -> list[str]:
     """Génère des comparaisons temporelles."""
     comparisons = []
@@ -247,8 +813,11 @@ def generate_temporal_comparisons(
     if df.empty:
         return comparisons
 
+    if aggregates is None:
+        aggregates = PhotoAggregates(df)
+
     # 1. Comparaisons mois par mois
-    photos_par_mois = df.groupby("age_mois").size()
+    photos_par_mois = aggregates.photos_par_mois
 
     if len(photos_par_mois) >= 2:
         # Évolution entre premier et dernier mois
@@ -300,8 +869,10 @@ def generate_temporal_comparisons(
                     )
 
     # 2. Comparaison week-end vs semaine
-    photos_weekends = df[df["jour_semaine"].isin(["Saturday", "Sunday"])].shape[0]
-    photos_semaine = df[~df["jour_semaine"].isin(["Saturday", "Sunday"])].shape[0]
+    photos_par_jour_semaine = aggregates.photos_par_jour_semaine
+    est_weekend = photos_par_jour_semaine.index.isin(["Saturday", "Sunday"])
+    photos_weekends = photos_par_jour_semaine[est_weekend].sum()
+    photos_semaine = photos_par_jour_semaine[~est_weekend].sum()
 
     if photos_weekends > 0 and photos_semaine > 0:
         # Ratio par jour
@@ -342,6 +913,7 @@ def generate_insights(
     date_naissance: datetime,
     type_fichiers: str = None,
     tr: Translator = None,
+    aggregates: PhotoAggregates = None,
 ) -> list[str]:
     """Génère les messages d'insights contextuels."""
     insights = []
@@ -355,6 +927,9 @@ def generate_insights(
     if not tr:
         tr = Translator("fr")
 
+    if aggregates is None:
+        aggregates = PhotoAggregates(df)
+
     # Messages encourageants adaptés au type
     if type_fichiers == "📸🎬 Photos et Vidéos":
         total = metrics.get("total_fichiers", 0)
@@ -399,7 +974,7 @@ def generate_insights(
             )
 
     # Analyse des mois les plus photographiés
-    photos_par_mois = df.groupby("age_mois").size()
+    photos_par_mois = aggregates.photos_par_mois
     if not photos_par_mois.empty:
         mois_champion = photos_par_mois.idxmax()
         nb_photos_champion = photos_par_mois.max()
@@ -418,7 +993,7 @@ def generate_insights(
         )
 
     # Analyse des jours de la semaine
-    photos_par_jour_semaine = df.groupby("jour_semaine").size()
+    photos_par_jour_semaine = aggregates.photos_par_jour_semaine
     if not photos_par_jour_semaine.empty:
         jour_favori = photos_par_jour_semaine.idxmax()
         if jour_favori in ["Saturday", "Sunday"]:
@@ -429,8 +1004,7 @@ def generate_insights(
     # Record de photos en une journée
     if metrics["jour_record"] >= INSIGHTS_THRESHOLDS["burst_mode_threshold"]:
         # Trouver la date du record
-        photos_par_jour = df.groupby(df["date"].dt.date).size()
-        date_record = photos_par_jour.idxmax()
+        date_record, _ = aggregates.jour_record()
 
         insights.append(
             tr.t(
@@ -441,8 +1015,7 @@ def generate_insights(
         )
     elif metrics["jour_record"] >= INSIGHTS_THRESHOLDS["productive_day_threshold"]:
         # Trouver la date du record
-        photos_par_jour = df.groupby(df["date"].dt.date).size()
-        date_record = photos_par_jour.idxmax()
+        date_record, _ = aggregates.jour_record()
 
         insights.append(
             tr.t(
@@ -453,7 +1026,7 @@ def generate_insights(
         )
 
     # Analyse des gaps
-    gaps = find_gaps(df)
+    gaps = find_gaps(df, aggregates=aggregates)
     if gaps:
         gap_le_plus_long = max(gaps, key=lambda x: x[2])
         if gap_le_plus_long[2] >= INSIGHTS_THRESHOLDS["very_long_gap"]:
@@ -468,13 +1041,12 @@ def generate_insights(
 
     # Régularité récente
     if not df.empty:
-        photos_recentes = df[
-            df["date"]
-            >= (datetime.now() - timedelta(days=INSIGHTS_THRESHOLDS["recent_days"]))
-        ]
-        if len(photos_recentes) == 0:
+        photos_recentes = aggregates.compter_entre(
+            datetime.now() - timedelta(days=INSIGHTS_THRESHOLDS["recent_days"])
+        )
+        if photos_recentes == 0:
             insights.append(tr.t("think_recent_photos"))
-        elif len(photos_recentes) >= INSIGHTS_THRESHOLDS["recent_active_threshold"]:
+        elif photos_recentes >= INSIGHTS_THRESHOLDS["recent_active_threshold"]:
             insights.append(tr.t("very_active_month"))
 
     # Projection future
@@ -483,25 +1055,58 @@ def generate_insights(
         insights.append(tr.t("yearly_projection", count=int(projection_annuelle)))
 
     # Détection de moments spéciaux
-    special_moments = detect_special_moments(df, metrics["jour_record"], tr)
+    special_moments = detect_special_moments(df, metrics["jour_record"], tr, aggregates)
     insights.extend(special_moments)
 
     # Comparaisons temporelles
-    temporal_comparisons = generate_temporal_comparisons(df, date_naissance, tr)
+    temporal_comparisons = generate_temporal_comparisons(
+        df, date_naissance, tr, aggregates
+    )
     insights.extend(temporal_comparisons)
 
     return insights
 
 
-def create_charts(df: pd.DataFrame, tr: Translator) -> dict:
-    """Crée tous les graphiques pour l'onglet Analytics."""
-    charts = {}
+def reduire_serie(serie: pd.Series, points_max: int) -> pd.Series:
+    """Regroupe une série en au plus `points_max` points.
+
+    Les entrées consécutives sont moyennées par paquets de taille fixe ; chaque
+    paquet garde l'étiquette de sa première entrée.
+    """
+    if len(serie) <= points_max:
+        return serie
+    pas = -(-len(serie) // points_max)
+    reduite = serie.groupby(np.arange(len(serie)) // pas).mean().round(1)
+    reduite.index = serie.index[::pas]
+    return reduite
 
+
+def create_charts(
+    df: pd.DataFrame, tr: Translator, aggregates: PhotoAggregates = None
+) -> dict:
+    """Crée tous les graphiques pour l'onglet Analytics.
+
+    Les figures ne dépendent que des agrégats : elles sont gardées en cache par
+    version des agrégats et par langue.
+    """
     if df.empty:
-        return charts
+        return {}
+
+    if aggregates is None:
+        aggregates = PhotoAggregates(df)
+
+    return aggregates._derive(
+        ("graphiques", tr.language), lambda: _construire_graphiques(tr, aggregates)
+    )
+
+
+def _construire_graphiques(tr: Translator, aggregates: PhotoAggregates) -> dict:
+    charts = {}
 
     # 1. Graphique en barres : Photos par mois d'âge
-    photos_par_mois = df.groupby("age_mois").size().reset_index(name="nb_photos")
+    photos_par_mois = aggregates.photos_par_mois.rename_axis("age_mois").reset_index(
+        name="nb_photos"
+    )
     fig_barres = px.bar(
         photos_par_mois,
         x="age_mois",
@@ -538,10 +1143,20 @@ def create_charts(df: pd.DataFrame, tr: Translator) -> dict:
     )
     charts["barres"] = fig_barres
 
-    # 2. Timeline : Évolution hebdomadaire
-    df["semaine_annee"] = df["date"].dt.strftime("%Y-W%U")
+    # 2. Timeline : Évolution hebdomadaire (réduite au budget de points)
+    if len(aggregates.photos_par_semaine) > CHART_CONFIG["points_max"]:
+        # Chaque point moyenne plusieurs semaines consécutives
+        titre_photos = (
+            "Photos par semaine (moyenne)"
+            if tr.language == "fr"
+            else "Photos per week (average)"
+        )
+    else:
+        titre_photos = "Nombre de photos" if tr.language == "fr" else "Number of photos"
     photos_par_semaine = (
-        df.groupby("semaine_annee").size().reset_index(name="nb_photos")
+        reduire_serie(aggregates.photos_par_semaine, CHART_CONFIG["points_max"])
+        .rename_axis("semaine_annee")
+        .reset_index(name="nb_photos")
     )
 
     fig_timeline = px.line(
@@ -555,11 +1170,13 @@ def create_charts(df: pd.DataFrame, tr: Translator) -> dict:
         ),
         labels={
             "semaine_annee": "Semaine" if tr.language == "fr" else "Week",
-            "nb_photos": (
-                "Nombre de photos" if tr.language == "fr" else "Number of photos"
-            ),
+            "nb_photos": titre_photos,
         },
         color_discrete_sequence=[COLORS["chart_purple"]],
+        # Scattergl pour les longues séries : rendu GPU côté navigateur
+        render_mode=(
+            "webgl" if len(photos_par_semaine) > CHART_CONFIG["seuil_webgl"] else "svg"
+        ),
     )
     fig_timeline.update_layout(
         font=dict(family="Poppins, sans-serif", color=COLORS["text_dark"]),
@@ -572,7 +1189,7 @@ def create_charts(df: pd.DataFrame, tr: Translator) -> dict:
         gridcolor=COLORS["primary"],
     )
     fig_timeline.update_yaxes(
-        title="Nombre de photos" if tr.language == "fr" else "Number of photos",
+        title=titre_photos,
         gridcolor=COLORS["primary"],
     )
     fig_timeline.update_traces(
@@ -619,8 +1236,8 @@ def create_charts(df: pd.DataFrame, tr: Translator) -> dict:
             "Sunday",
         ]
 
-    photos_par_jour = (
-        df.groupby("jour_semaine").size().reindex(jours_ordre, fill_value=0)
+    photos_par_jour = aggregates.photos_par_jour_semaine.reindex(
+        jours_ordre, fill_value=0
     )
 
     fig_heatmap = go.Figure(
@@ -686,184 +1303,47 @@ def get_gallery_data(organiseur: OrganisateurPhotos) -> dict[str, list[Path]]:
 
 
 def get_photos_by_mode(
-    gallery_data: dict[str, list[Path]],
-    organiseur: OrganisateurPhotos,
+    index: IndexGalerie,
     mode: str,
     selected_month: str,
     num_photos: int = 6,
+    graine: Optional[int] = None,
 ) -> list[Path]:
-    """Obtient les photos selon le mode sélectionné."""
-    if mode == "🎲 Aléatoire" or mode == "🎲 Random":
-        return get_random_photos_for_month(gallery_data, selected_month, num_photos)
-    elif mode == "⏰ Chronologique" or mode == "⏰ Chronological":
-        return get_chronological_photos(
-            gallery_data, organiseur, selected_month, num_photos
-        )
-    elif mode == "📸 Moments forts" or mode == "📸 Highlights":
-        return get_highlight_photos(
-            gallery_data, organiseur, selected_month, num_photos
-        )
-    elif mode == "📈 Timeline croissance" or mode == "📈 Growth timeline":
-        return get_timeline_photos(gallery_data, organiseur, num_photos)
-    else:
-        return get_random_photos_for_month(gallery_data, selected_month, num_photos)
+    """Obtient les photos selon le mode sélectionné (première page)."""
+    photos, _ = get_page_by_mode(index, mode, selected_month, None, num_photos, graine)
+    return photos
 
 
-def get_random_photos_for_month(
-    gallery_data: dict[str, list[Path]], selected_month: str, num_photos: int = 6
-) -> list[Path]:
-    """Obtient un échantillon aléatoire de photos pour un mois donné."""
-    if selected_month == "Tous les mois":
-        # Mélanger toutes les photos de tous les mois
-        all_photos = []
-        for photos in gallery_data.values():
-            all_photos.extend(photos)
-        return (
-            random.sample(all_photos, min(num_photos, len(all_photos)))
-            if all_photos
-            else []
-        )
-
-    photos = gallery_data.get(selected_month, [])
-    return random.sample(photos, min(num_photos, len(photos))) if photos else []
-
-
-def get_chronological_photos(
-    gallery_data: dict[str, list[Path]],
-    organiseur: OrganisateurPhotos,
-    selected_month: str,
-    num_photos: int = 6,
-) -> list[Path]:
-    """Obtient les photos triées chronologiquement (plus récent → plus ancien)."""
-    if selected_month == "Tous les mois":
-        # Collecter toutes les photos avec leur date
-        all_photos_with_dates = []
-        for photos in gallery_data.values():
-            for photo in photos:
-                date_photo = organiseur.extraire_date_nom_fichier(photo.name)
-                if date_photo:
-                    all_photos_with_dates.append((photo, date_photo))
-
-        # Trier par date décroissante (plus récent en premier)
-        all_photos_with_dates.sort(key=lambda x: x[1], reverse=True)
-        return [photo for photo, _ in all_photos_with_dates[:num_photos]]
-
-    # Pour un mois spécifique
-    photos = gallery_data.get(selected_month, [])
-    photos_with_dates = []
-    for photo in photos:
-        date_photo = organiseur.extraire_date_nom_fichier(photo.name)
-        if date_photo:
-            photos_with_dates.append((photo, date_photo))
-
-    # Trier par date décroissante
-    photos_with_dates.sort(key=lambda x: x[1], reverse=True)
-    return [photo for photo, _ in photos_with_dates[:num_photos]]
-
-
-def get_highlight_photos(
-    gallery_data: dict[str, list[Path]],
-    organiseur: OrganisateurPhotos,
+def get_page_by_mode(
+    index: IndexGalerie,
+    mode: str,
     selected_month: str,
-    num_photos: int = 6,
-) -> list[Path]:
-    """Obtient les photos des journées avec le plus de photos (moments forts)."""
-    if selected_month == "Tous les mois":
-        # Collecter toutes les photos avec leur date
-        all_photos_with_dates = []
-        for photos in gallery_data.values():
-            for photo in photos:
-                date_photo = organiseur.extraire_date_nom_fichier(photo.name)
-                if date_photo:
-                    all_photos_with_dates.append((photo, date_photo.date()))
-    else:
-        # Pour un mois spécifique
-        photos = gallery_data.get(selected_month, [])
-        all_photos_with_dates = []
-        for photo in photos:
-            date_photo = organiseur.extraire_date_nom_fichier(photo.name)
-            if date_photo:
-                all_photos_with_dates.append((photo, date_photo.date()))
-
-    if not all_photos_with_dates:
-        return []
-
-    # Grouper par jour et compter les photos
-    from collections import defaultdict
-
-    photos_par_jour = defaultdict(list)
-    for photo, date in all_photos_with_dates:
-        photos_par_jour[date].append(photo)
-
-    # Trier les jours par nombre de photos (moments forts)
-    jours_tries = sorted(photos_par_jour.items(), key=lambda x: len(x[1]), reverse=True)
-
-    # Sélectionner des photos des jours les plus actifs
-    selected_photos = []
-    for _, photos_du_jour in jours_tries:
-        if len(selected_photos) >= num_photos:
-            break
-        # Prendre une photo aléatoire de ce jour fort
-        selected_photos.append(random.choice(photos_du_jour))
-
-    return selected_photos[:num_photos]
-
-
-def get_timeline_photos(
-    gallery_data: dict[str, list[Path]],
-    organiseur: OrganisateurPhotos,
-    num_photos: int = 6,
-) -> list[Path]:
-    """Obtient une photo aléatoire par mois pour montrer la timeline de croissance."""
-    # D'abord essayer avec les dossiers mensuels organisés
-    monthly_folders = {
-        k: v for k, v in gallery_data.items() if k != "Photos non triées" and "-" in k
-    }
-
-    if monthly_folders:
-        # Si on a des dossiers mensuels, utiliser la logique existante
-        # Fonction pour extraire le nombre du début du nom de dossier
-        def extract_month_number(folder_name):
-            try:
-                return int(folder_name.split("-")[0])
-            except:
-                return 999
-
-        # Trier les mois par ordre chronologique
-        sorted_months = sorted(monthly_folders.keys(), key=extract_month_number)
-
-        # Prendre une photo aléatoire par mois (limité par num_photos)
-        timeline_photos = []
-        for month in sorted_months[:num_photos]:
-            month_photos = monthly_folders[month]
-            if month_photos:
-                timeline_photos.append(random.choice(month_photos))
-
-        return timeline_photos
+    curseur: Optional[Curseur],
+    taille_page: int = 6,
+    graine: Optional[int] = None,
+) -> tuple[list[Path], Optional[Curseur]]:
+    """Obtient une page de photos selon le mode sélectionné.
 
-    # Si pas de dossiers mensuels, créer une timeline à partir des photos non triées
-    elif "Photos non triées" in gallery_data:
-        all_photos = gallery_data["Photos non triées"]
+    Les tirages aléatoires dépendent de `graine` : une même graine redonne les
+    mêmes pages (None : tirage différent à chaque appel).
 
-        # Grouper les photos par mois d'âge
-        photos_by_month = {}
-        for photo in all_photos:
-            date_photo = organiseur.extraire_date_nom_fichier(photo.name)
-            if date_photo:
-                age_mois = organiseur.calculer_age_mois(date_photo)
-                if age_mois not in photos_by_month:
-                    photos_by_month[age_mois] = []
-                photos_by_month[age_mois].append(photo)
-
-        # Prendre une photo par mois dans l'ordre chronologique
-        timeline_photos = []
-        for month in sorted(photos_by_month.keys())[:num_photos]:
-            if photos_by_month[month]:
-                timeline_photos.append(random.choice(photos_by_month[month]))
+    Args:
+        curseur: Curseur renvoyé pour la page précédente (None : première page)
 
-        return timeline_photos
+    Returns:
+        (photos de la page, curseur de la page suivante ou None)
+    """
+    if graine is None:
+        graine = random.getrandbits(32)
 
-    return []
+    if mode == "⏰ Chronologique" or mode == "⏰ Chronological":
+        return index.page_chronologique(selected_month, curseur, taille_page)
+    elif mode == "📸 Moments forts" or mode == "📸 Highlights":
+        return index.page_moments_forts(selected_month, curseur, taille_page, graine)
+    elif mode == "📈 Timeline croissance" or mode == "📈 Growth timeline":
+        return index.page_timeline(curseur, taille_page, graine)
+    else:  # 🎲 Aléatoire
+        return index.page_aleatoire(selected_month, curseur, taille_page, graine)
 
 
 def get_photo_caption_with_age(
@@ -876,33 +1356,35 @@ def get_photo_caption_with_age(
     if not date_photo or date_photo < organiseur.date_naissance:
         return photo_path.name
 
-    # Calculer l'âge en mois
     age_mois = organiseur.calculer_age_mois(date_photo)
+    age_jours = (date_photo.date() - organiseur.date_naissance.date()).days
+    return html_legende_age(photo_path.name, age_mois, age_jours, tr)
+
+
+def html_legende_age(nom: str, age_mois: int, age_jours: int, tr) -> str:
+    """Légende HTML d'une photo (sur une ligne) avec son badge d'âge.
 
-    # Créer le badge d'âge
+    Les photos de moins d'un mois affichent leur âge en jours.
+    """
     if age_mois < 1:
-        # Pour les photos de moins d'1 mois, afficher en jours
-        age_jours = (date_photo.date() - organiseur.date_naissance.date()).days
         age_text = tr.t("age_days", age=age_jours)
     else:
         age_text = tr.t("age_months", age=age_mois)
 
-    # Créer la légende HTML avec badge
-    caption_html = f"""
-    <div class="photo-caption">
-        <span>{photo_path.name}</span>
-        <span class="age-badge">🦖 {age_text}</span>
-    </div>
-    """
-
-    return caption_html
+    return (
+        f'<div class="photo-caption"><span>{html.escape(nom)}</span>'
+        f'<span class="age-badge">🦖 {age_text}</span></div>'
+    )
 
 
-@st.cache_data
 def get_image_with_correct_orientation(image_path: str) -> Image.Image:
     """
     Charge une image en appliquant automatiquement la rotation EXIF.
 
+    L'image décodée n'est pas mise en cache (plusieurs dizaines de Mo pour une
+    grande photo) : pour un affichage répété, passer par le magasin de
+    vignettes (thumbnails.MagasinVignettes), compressé et borné en octets.
+
     Args:
         image_path: Chemin vers l'image
 
@@ -910,14 +1392,10 @@ def get_image_with_correct_orientation(image_path: str) -> Image.Image:
         Image PIL avec l'orientation corrigée
     """
     try:
-        # Ouvrir l'image
-        image = Image.open(image_path)
-
-        # Appliquer la rotation EXIF automatiquement
-        # ImageOps.exif_transpose gère tous les cas d'orientation EXIF
-        image = ImageOps.exif_transpose(image)
-
-        return image
+        # ImageOps.exif_transpose gère tous les cas d'orientation EXIF et
+        # renvoie une copie : le fichier peut être refermé aussitôt
+        with Image.open(image_path) as image:
+            return ImageOps.exif_transpose(image)
     except Exception as e:
         # En cas d'erreur, retourner l'image sans transformation
         print(f"Erreur lors du chargement de l'image {image_path}: {e}")
@@ -0,0 +1,117 @@
+"""Empreintes de contenu et manifeste d'intégrité des fichiers organisés."""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import INTEGRITY_CONFIG
+from .io_scheduler import PRIORITE_NORMALE, IOScheduler
+
+
+def nouveau_hacheur():
+    """Retourne un objet de hachage pour l'algorithme configuré."""
+    return hashlib.new(INTEGRITY_CONFIG["algorithme"])
+
+
+def hacher_fichier(
+    chemin: Path,
+    ordonnanceur: Optional[IOScheduler] = None,
+    priorite: int = PRIORITE_NORMALE,
+) -> str:
+    """Calcule l'empreinte d'un fichier en le lisant par blocs.
+
+    Args:
+        chemin: Fichier à hacher
+        ordonnanceur: Ordonnanceur optionnel pour limiter le débit de lecture
+        priorite: Priorité des lectures auprès de l'ordonnanceur
+
+    Returns:
+        Empreinte hexadécimale
+    """
+    hacheur = nouveau_hacheur()
+    taille_bloc = INTEGRITY_CONFIG["taille_bloc"]
+
+    with open(chemin, "rb") as f:
+        while bloc := f.read(taille_bloc):
+            if ordonnanceur is not None:
+                ordonnanceur.acquerir(octets=len(bloc), priorite=priorite)
+                ordonnanceur.enregistrer(octets=len(bloc))
+            hacheur.update(bloc)
+
+    return hacheur.hexdigest()
+
+
+def liberer_cache_page(fd: int) -> None:
+    """Demande au noyau d'oublier les pages d'un fichier en cache.
+
+    Une relecture ultérieure vient alors réellement du disque, ce qui permet de
+    vérifier ce qui a été écrit et non la copie en mémoire.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+class Manifeste:
+    """Manifeste JSON des empreintes, stocké à la racine du dossier organisé."""
+
+    def __init__(self, dossier_racine: Path):
+        """Initialise le manifeste.
+
+        Args:
+            dossier_racine: Dossier principal contenant les dossiers mensuels
+        """
+        self.dossier_racine = Path(dossier_racine)
+        self.chemin = self.dossier_racine / INTEGRITY_CONFIG["manifeste"]
+        self.fichiers: dict[str, dict[str, Any]] = {}
+        self.charger()
+
+    def charger(self) -> None:
+        """Charge le manifeste existant s'il y en a un."""
+        if not self.chemin.exists():
+            return
+
+        try:
+            with open(self.chemin, encoding="utf-8") as f:
+                contenu = json.load(f)
+            if contenu.get("algorithme") == INTEGRITY_CONFIG["algorithme"]:
+                self.fichiers = contenu.get("fichiers", {})
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors du chargement du manifeste: {e}")
+
+    def sauvegarder(self) -> None:
+        """Écrit le manifeste de façon atomique (fichier temporaire + remplacement)."""
+        contenu = {
+            "version": 1,
+            "algorithme": INTEGRITY_CONFIG["algorithme"],
+            "fichiers": self.fichiers,
+        }
+        temporaire = self.chemin.with_suffix(".tmp")
+        with open(temporaire, "w", encoding="utf-8") as f:
+            json.dump(contenu, f, indent=1, ensure_ascii=False)
+        os.replace(temporaire, self.chemin)
+
+    def cle(self, chemin: Path) -> str:
+        """Retourne la clé d'un fichier (chemin relatif à la racine)."""
+        return Path(chemin).relative_to(self.dossier_racine).as_posix()
+
+    def deplacer(self, source: Path, destination: Optional[Path]) -> None:
+        """Reporte l'entrée d'un fichier déplacé (retirée si destination=None)."""
+        entree = self.fichiers.pop(self.cle(source), None)
+        if entree is not None and destination is not None:
+            self.fichiers[self.cle(destination)] = entree
+
+    def enregistrer(self, chemin: Path, empreinte: str) -> None:
+        """Enregistre l'empreinte vérifiée d'un fichier."""
+        stat = Path(chemin).stat()
+        self.fichiers[self.cle(chemin)] = {
+            "empreinte": empreinte,
+            "taille": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "verifie_le": datetime.now().isoformat(timespec="seconds"),
+        }
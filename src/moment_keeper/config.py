@@ -58,6 +58,59 @@ INSIGHTS_THRESHOLDS = {
     "contrast_ratio_min": 2,
 }
 
+# Limitation des entrées/sorties (mode économe pour NAS partagé)
+IO_THROTTLE = {
+    "octets_par_seconde": 20 * 1024 * 1024,
+    "operations_par_seconde": 50,
+    "taille_bloc": 1024 * 1024,
+}
+
+# Vérification d'intégrité (copie vérifiée et manifeste des empreintes)
+INTEGRITY_CONFIG = {
+    "algorithme": "sha256",
+    "taille_bloc": 1024 * 1024,
+    "workers_verification": 4,
+    "tentatives_max": 3,
+    "manifeste": ".momentkeeper_manifest.json",
+}
+
+# Vérification périodique (scrub) : ~2 TB relus en une semaine d'exécutions
+SCRUB_CONFIG = {
+    "budget_octets": 300 * 1024**3,
+    "octets_par_seconde": 30 * 1024 * 1024,
+    "sauvegarde_tous_les": 50,
+}
+
+# Instantanés Feather du DataFrame d'analyse (dans data/user-config)
+SNAPSHOT_CONFIG = {
+    "sous_dossier": "snapshots",
+    "compression": "uncompressed",  # requis pour une lecture sans copie
+}
+
+# Cache des résultats d'analyse partagé entre sessions et reruns
+ANALYTICS_CACHE = {
+    "budget_octets": 256 * 1024 * 1024,
+}
+
+# Vignettes de la galerie (dans static/), côté court en pixels
+THUMBNAIL_CONFIG = {
+    "sous_dossier": "thumbnails",
+    "tailles": (120, 400, 800),
+    "taille_galerie": 400,
+    # Variante où sont rangés les aperçus tirés de la vignette EXIF intégrée
+    "taille_apercu": 120,
+    "qualite": 85,
+    "budget_octets": 512 * 1024 * 1024,
+    # Processus de génération en arrière-plan (None : un par cœur)
+    "workers_prechargement": None,
+}
+
+# Pagination de la galerie (la page suivante est préchargée)
+GALLERY_CONFIG = {
+    "tailles_page": (6, 12, 24, 48, 96),
+    "taille_page": 6,
+}
+
 # Configuration des graphiques
 CHART_CONFIG = {
     "height_heatmap": 200,
@@ -66,6 +119,10 @@ CHART_CONFIG = {
     "line_width": 4,
     "marker_size": 8,
     "marker_line_width": 2,
+    # Au-delà de ce nombre de points, les courbes sont rendues en WebGL
+    "seuil_webgl": 300,
+    # Nombre maximal de points envoyés au navigateur par courbe
+    "points_max": 600,
 }
 
 # Configuration GitHub
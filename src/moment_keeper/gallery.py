@@ -0,0 +1,267 @@
+"""Index de la galerie, construit une fois par version des données.
+
+Les modes d'affichage (chronologique, moments forts, timeline) ont besoin de
+dates extraites des noms de fichiers, de tris et de regroupements. L'index les
+prépare en une passe sur les photos : chaque mode n'a ensuite plus qu'à lire
+les `k` premiers éléments d'une liste déjà ordonnée.
+
+La galerie se parcourt par pages : chaque mode renvoie une page et le curseur
+de la suivante, pour un coût proportionnel à la taille de la page et non à
+celle du mois. Pour "Tous les mois", aucune liste fusionnée n'est construite :
+les plus récentes sont tirées des listes par mois (fusion par tas), et l'ordre
+aléatoire tire des positions globales retrouvées dans leur mois. Les tirages
+dépendent d'une graine : une même graine redonne la même sélection d'un rerun
+à l'autre.
+"""
+
+import heapq
+import itertools
+import random
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .organizer import OrganisateurPhotos
+
+TOUS_LES_MOIS = "Tous les mois"
+PHOTOS_NON_TRIEES = "Photos non triées"
+
+# Position d'une page : un rang par liste parcourue (une seule, sauf pour la
+# fusion chronologique de tous les mois)
+Curseur = tuple[int, ...]
+
+
+def numero_mois(nom_dossier: str) -> int:
+    """Extrait le nombre au début d'un nom de dossier (999 si absent)."""
+    try:
+        return int(nom_dossier.split("-")[0])
+    except ValueError:
+        return 999  # Pour "Photos non triées" et autres
+
+
+def jours_par_nombre(photos: Iterable[Path], dates: dict[Path, datetime]) -> list:
+    """Regroupe des photos par jour, du jour le plus fourni au moins fourni."""
+    photos_par_jour = defaultdict(list)
+    for photo in photos:
+        photos_par_jour[dates[photo].date()].append(photo)
+    return sorted(photos_par_jour.values(), key=len, reverse=True)
+
+
+def suite_depuis(liste: list[Path], debut: int, rang: int) -> Iterator:
+    """Parcourt une liste à partir d'une position, sans la copier."""
+    for i in range(debut, len(liste)):
+        yield rang, liste[i]
+
+
+# Tours du réseau de Feistel : quatre suffisent à bien mêler les positions
+TOURS_FEISTEL = 4
+MASQUE_64 = (1 << 64) - 1
+
+
+def position_melangee(position: int, total: int, cles: list[int]) -> int:
+    """Image d'une position par une permutation pseudo-aléatoire de range(total).
+
+    Réseau de Feistel sur deux moitiés de bits (une bijection sur la plus
+    petite puissance de 4 couvrant `total`), puis « cycle walking » : une image
+    hors de range(total) est permutée de nouveau jusqu'à y revenir, ce qui
+    reste une bijection. Le domaine faisant moins de 4 fois `total`, il faut
+    en moyenne moins de 4 passes.
+    """
+    moitie = ((total - 1).bit_length() + 1) // 2
+    masque = (1 << moitie) - 1
+    while True:
+        gauche, droite = position >> moitie, position & masque
+        for cle in cles:
+            melange = ((droite ^ cle) * 0x9E3779B97F4A7C15) & MASQUE_64
+            melange ^= melange >> 29
+            gauche, droite = droite, gauche ^ (melange & masque)
+        position = (gauche << moitie) | droite
+        if position < total:
+            return position
+
+
+class IndexGalerie:
+    """Photos de la galerie ordonnées pour chaque mode d'affichage.
+
+    - `par_mois` : photos de chaque dossier, de la plus récente à la plus
+      ancienne ;
+    - `jours_forts` : par dossier (et pour TOUS_LES_MOIS), les photos groupées
+      par jour, du jour le plus fourni au moins fourni ;
+    - `ages` : une liste de photos par mois d'âge, dans l'ordre chronologique
+      (dossiers mensuels, ou à défaut photos non triées groupées par âge) ;
+    - `ages_photos` : l'âge (mois, jours) à la date de chaque photo, pour que
+      les légendes d'une page n'aient aucune date à recalculer.
+    """
+
+    def __init__(
+        self, gallery_data: dict[str, list[Path]], organiseur: OrganisateurPhotos
+    ):
+        """Construit l'index (une extraction de date par photo).
+
+        Args:
+            gallery_data: Photos par dossier (voir get_gallery_data)
+            organiseur: Organisateur du projet (dates et âges)
+        """
+        self.dates: dict[Path, datetime] = {}
+        # Âge à la date de chaque photo (mois, jours), pour les légendes
+        self.ages_photos: dict[Path, tuple[int, int]] = {}
+        naissance = organiseur.date_naissance.date()
+        for photos in gallery_data.values():
+            for photo in photos:
+                date_photo = organiseur.extraire_date_nom_fichier(photo.name)
+                if date_photo:
+                    self.dates[photo] = date_photo
+                    self.ages_photos[photo] = (
+                        organiseur.calculer_age_mois(date_photo),
+                        (date_photo.date() - naissance).days,
+                    )
+
+        def plus_recentes(photos):
+            datees = [photo for photo in photos if photo in self.dates]
+            return sorted(datees, key=self.dates.__getitem__, reverse=True)
+
+        self.mois_tries = sorted(gallery_data, key=numero_mois)
+        self.par_mois = {
+            mois: plus_recentes(gallery_data[mois]) for mois in gallery_data
+        }
+        # Effectifs cumulés : une position globale se retrouve par bisection
+        self._listes = list(self.par_mois.values())
+        self.cumuls = list(itertools.accumulate(len(photos) for photos in self._listes))
+
+        self.jours_forts = {
+            mois: jours_par_nombre(photos, self.dates)
+            for mois, photos in self.par_mois.items()
+        }
+        self.jours_forts[TOUS_LES_MOIS] = jours_par_nombre(
+            itertools.chain.from_iterable(self.par_mois.values()), self.dates
+        )
+
+        # Timeline : dossiers mensuels organisés, sinon âge des photos non triées
+        dossiers_mensuels = [
+            mois
+            for mois in self.mois_tries
+            if mois != PHOTOS_NON_TRIEES and "-" in mois
+        ]
+        if dossiers_mensuels:
+            self.ages = [gallery_data[mois] for mois in dossiers_mensuels]
+        else:
+            photos_par_age = defaultdict(list)
+            for photo in gallery_data.get(PHOTOS_NON_TRIEES, []):
+                if photo in self.ages_photos:
+                    photos_par_age[self.ages_photos[photo][0]].append(photo)
+            self.ages = [photos_par_age[age] for age in sorted(photos_par_age)]
+        self.ages = [photos for photos in self.ages if photos]
+
+    def nombre_photos(self, mois: str) -> int:
+        """Nombre de photos d'un dossier (ou de tous)."""
+        if mois == TOUS_LES_MOIS:
+            return self.cumuls[-1] if self.cumuls else 0
+        return len(self.par_mois.get(mois, []))
+
+    def photo_a(self, mois: str, position: int) -> Path:
+        """Photo à une position d'un dossier (ou de tous, mois après mois)."""
+        if mois != TOUS_LES_MOIS:
+            return self.par_mois[mois][position]
+        rang = bisect_right(self.cumuls, position)
+        debut = self.cumuls[rang - 1] if rang else 0
+        return self._listes[rang][position - debut]
+
+    def page_chronologique(
+        self, mois: str, curseur: Optional[Curseur], taille: int
+    ) -> tuple[list[Path], Optional[Curseur]]:
+        """Page de photos de la plus récente à la plus ancienne.
+
+        Pour tous les mois, le curseur retient la position atteinte dans chaque
+        mois : les listes déjà triées sont fusionnées par un tas à partir de
+        ces positions, et la fusion s'arrête après `taille` photos. O(k log m).
+
+        Returns:
+            (photos de la page, curseur de la page suivante ou None)
+        """
+        if mois != TOUS_LES_MOIS:
+            return self._page_liste(self.par_mois.get(mois, []), curseur, taille)
+
+        listes = self._listes
+        positions = list(curseur or [0] * len(listes))
+        suites = [
+            suite_depuis(liste, debut, rang)
+            for rang, (liste, debut) in enumerate(zip(listes, positions))
+        ]
+        fusion = heapq.merge(
+            *suites, key=lambda entree: self.dates[entree[1]], reverse=True
+        )
+        photos = []
+        for rang, photo in itertools.islice(fusion, taille):
+            positions[rang] += 1
+            photos.append(photo)
+        restantes = sum(positions) < self.nombre_photos(TOUS_LES_MOIS)
+        return photos, tuple(positions) if restantes else None
+
+    def page_aleatoire(
+        self, mois: str, curseur: Optional[Curseur], taille: int, graine: int
+    ) -> tuple[list[Path], Optional[Curseur]]:
+        """Page d'un ordre aléatoire fixé par la graine (sans remise).
+
+        L'ordre est une permutation pseudo-aléatoire des positions, calculée
+        position par position (voir `position_melangee`) : aucun état n'est
+        conservé d'une page à l'autre, le curseur n'est que la position atteinte,
+        et le coût d'une page ne dépend que de sa taille. Les pages d'une même
+        graine ne se recoupent pas. Pour tous les mois, chaque photo a la même
+        probabilité et aucune liste fusionnée n'est construite.
+        """
+        total = self.nombre_photos(mois)
+        debut = curseur[0] if curseur else 0
+        fin = min(total, debut + taille)
+        generateur = random.Random(f"{graine}:{total}")
+        cles = [generateur.getrandbits(64) for _ in range(TOURS_FEISTEL)]
+        photos = [
+            self.photo_a(mois, position_melangee(i, total, cles))
+            for i in range(debut, fin)
+        ]
+        return photos, (fin,) if fin < total else None
+
+    def page_moments_forts(
+        self, mois: str, curseur: Optional[Curseur], taille: int, graine: int
+    ) -> tuple[list[Path], Optional[Curseur]]:
+        """Page d'une photo par jour, des jours les plus fournis aux moins fournis."""
+        return self._page_par_groupe(
+            self.jours_forts.get(mois, []), curseur, taille, graine
+        )
+
+    def page_timeline(
+        self, curseur: Optional[Curseur], taille: int, graine: int
+    ) -> tuple[list[Path], Optional[Curseur]]:
+        """Page d'une photo par mois d'âge, dans l'ordre chronologique."""
+        return self._page_par_groupe(self.ages, curseur, taille, graine)
+
+    @staticmethod
+    def _page_liste(
+        photos: list[Path], curseur: Optional[Curseur], taille: int
+    ) -> tuple[list[Path], Optional[Curseur]]:
+        """Page d'une liste déjà ordonnée."""
+        debut = curseur[0] if curseur else 0
+        fin = debut + taille
+        return photos[debut:fin], (fin,) if fin < len(photos) else None
+
+    @staticmethod
+    def _page_par_groupe(
+        groupes: list[list[Path]],
+        curseur: Optional[Curseur],
+        taille: int,
+        graine: int,
+    ) -> tuple[list[Path], Optional[Curseur]]:
+        """Page d'une photo tirée dans chaque groupe (jour ou mois d'âge).
+
+        Le tirage de chaque groupe ne dépend que de la graine et de son rang :
+        revenir sur une page redonne les mêmes photos.
+        """
+        debut = curseur[0] if curseur else 0
+        fin = debut + taille
+        photos = [
+            random.Random(f"{graine}:{rang}").choice(groupes[rang])
+            for rang in range(debut, min(fin, len(groupes)))
+        ]
+        return photos, (fin,) if fin < len(groupes) else None
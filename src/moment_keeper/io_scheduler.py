@@ -0,0 +1,168 @@
+"""Ordonnanceur d'entrées/sorties avec limitation de débit (token bucket)."""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+# Niveaux de priorité : plus la valeur est grande, plus l'opération cède la place
+PRIORITE_INTERACTIVE = 0
+PRIORITE_NORMALE = 1
+PRIORITE_ARRIERE_PLAN = 2
+
+# Chaque priorité soumise à attente a son propre seau, au débit configuré.
+# Une opération consomme les jetons de sa priorité et ceux des priorités
+# inférieures : seule, une priorité dispose de tout le débit, mais elle cède la
+# place dès qu'une priorité supérieure lit ou écrit, et l'ensemble ne dépasse
+# jamais le débit configuré. Les opérations interactives n'attendent jamais.
+PRIORITES_LIMITEES = (PRIORITE_NORMALE, PRIORITE_ARRIERE_PLAN)
+
+
+class TokenBucket:
+    """Seau à jetons : débit moyen borné avec une rafale d'une seconde."""
+
+    def __init__(self, debit: float, capacite: Optional[float] = None):
+        self.debit = float(debit)
+        self.capacite = float(capacite) if capacite is not None else self.debit
+        self.jetons = self.capacite
+        self._derniere_maj = time.monotonic()
+
+    def consommer(self, quantite: float) -> float:
+        """Consomme des jetons et retourne l'attente nécessaire en secondes.
+
+        Le seau peut passer en négatif : une demande plus grande que la capacité
+        est acceptée et l'attente correspond au temps de remboursement.
+        """
+        maintenant = time.monotonic()
+        self.jetons = min(
+            self.capacite,
+            self.jetons + (maintenant - self._derniere_maj) * self.debit,
+        )
+        self._derniere_maj = maintenant
+        self.jetons -= quantite
+
+        if self.jetons >= 0:
+            return 0.0
+        return -self.jetons / self.debit
+
+
+class IOScheduler:
+    """Limite le débit (octets/s) et le nombre d'opérations par seconde."""
+
+    def __init__(
+        self,
+        octets_par_seconde: Optional[float] = None,
+        operations_par_seconde: Optional[float] = None,
+        fenetre_mesure: float = 2.0,
+    ):
+        """Initialise l'ordonnanceur.
+
+        Args:
+            octets_par_seconde: Débit maximal en octets/s (None = illimité)
+            operations_par_seconde: Opérations fichier max par seconde (None = illimité)
+            fenetre_mesure: Durée de la fenêtre glissante de mesure du débit (s)
+        """
+        self.fenetre_mesure = fenetre_mesure
+        self._verrou = threading.Lock()
+        self._historique = deque()  # (instant, octets, operations)
+        self._debut_mesure = None
+        self._limites: Optional[tuple] = None
+        # priorité -> (seau des octets, seau des opérations)
+        self._seaux: dict[int, tuple] = {}
+        self.limiter(octets_par_seconde, operations_par_seconde)
+
+    def limiter(
+        self,
+        octets_par_seconde: Optional[float] = None,
+        operations_par_seconde: Optional[float] = None,
+    ) -> None:
+        """Change les limites de débit (None = illimité).
+
+        Les seaux ne sont recréés que si les limites changent : un même
+        ordonnanceur peut être partagé et reconfiguré à chaque rerun.
+        """
+        limites = (octets_par_seconde or None, operations_par_seconde or None)
+        with self._verrou:
+            if limites == self._limites:
+                return
+            self._limites = limites
+            self._seaux = {
+                priorite: (
+                    TokenBucket(octets_par_seconde) if octets_par_seconde else None,
+                    (
+                        TokenBucket(operations_par_seconde)
+                        if operations_par_seconde
+                        else None
+                    ),
+                )
+                for priorite in PRIORITES_LIMITEES
+            }
+
+    @property
+    def est_limite(self) -> bool:
+        """Indique si au moins une limite de débit est configurée."""
+        return any(self._limites)
+
+    def acquerir(
+        self, octets: int = 0, operations: int = 0, priorite: int = PRIORITE_NORMALE
+    ) -> float:
+        """Attend l'autorisation d'effectuer une entrée/sortie.
+
+        Les jetons sont pris dans le seau de la priorité et dans ceux des
+        priorités inférieures ; seule l'attente du seau de la priorité compte.
+
+        Returns:
+            Durée d'attente effective en secondes
+        """
+        with self._verrou:
+            attente = 0.0
+            for niveau, (seau_octets, seau_operations) in self._seaux.items():
+                if niveau < priorite:
+                    continue
+                attente_niveau = 0.0
+                if seau_octets and octets:
+                    attente_niveau = seau_octets.consommer(octets)
+                if seau_operations and operations:
+                    attente_niveau = max(
+                        attente_niveau, seau_operations.consommer(operations)
+                    )
+                if niveau == priorite:
+                    attente = attente_niveau
+
+        if attente <= 0:
+            return 0.0
+        time.sleep(attente)
+        return attente
+
+    def enregistrer(self, octets: int = 0, operations: int = 0) -> None:
+        """Enregistre une entrée/sortie effectuée pour la mesure du débit."""
+        maintenant = time.monotonic()
+        with self._verrou:
+            if self._debut_mesure is None:
+                self._debut_mesure = maintenant
+            self._historique.append((maintenant, octets, operations))
+            self._purger(maintenant)
+
+    def mesures(self) -> dict[str, float]:
+        """Retourne le débit mesuré sur la fenêtre glissante."""
+        maintenant = time.monotonic()
+        with self._verrou:
+            self._purger(maintenant)
+            if not self._historique:
+                return {"octets_par_seconde": 0.0, "operations_par_seconde": 0.0}
+
+            # Fenêtre complète, ou durée écoulée depuis la première mesure
+            duree = max(min(self.fenetre_mesure, maintenant - self._debut_mesure), 0.1)
+            octets = sum(entree[1] for entree in self._historique)
+            operations = sum(entree[2] for entree in self._historique)
+
+        return {
+            "octets_par_seconde": octets / duree,
+            "operations_par_seconde": operations / duree,
+        }
+
+    def _purger(self, maintenant: float) -> None:
+        """Retire les mesures sorties de la fenêtre glissante."""
+        limite = maintenant - self.fenetre_mesure
+        while self._historique and self._historique[0][0] < limite:
+            self._historique.popleft()
@@ -1,16 +1,71 @@
 """Module principal pour l'organisation des photos."""
 
+import os
+import shutil
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from .photo_copier import PhotoCopier
+from .checksums import Manifeste, hacher_fichier
+from .config import INTEGRITY_CONFIG
+from .photo_copier import PhotoCopier, cle_localite
 
 # Extensions supportées
 EXTENSIONS_PHOTOS = {".jpg", ".jpeg", ".png", ".heic", ".webp"}
 EXTENSIONS_VIDEOS = {".mp4", ".mov", ".avi", ".mkv", ".m4v", ".3gp", ".wmv"}
 
 
+@dataclass
+class PlanOrganisation:
+    """Plan d'organisation calculé une seule fois à partir du scan du dossier source."""
+
+    repartition: dict[str, list[Path]]
+    dossiers_a_creer: list[Path]
+    deplacements: list[tuple[Path, Path]]
+    conflits: list[str]
+    taille_totale: int  # octets
+    espace_libre: Optional[int] = None  # octets disponibles sur la destination
+    fichiers_ignores: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def taille_totale_gb(self) -> float:
+        """Taille totale des fichiers à organiser en GB."""
+        return self.taille_totale / (1024 * 1024 * 1024)
+
+    def espace_suffisant(self) -> bool:
+        """Indique si la destination peut accueillir une copie de tous les fichiers."""
+        return self.espace_libre is None or self.espace_libre >= self.taille_totale
+
+
+@dataclass
+class ChangementFichier:
+    """Fichier déplacé ou copié par l'organisateur, signalé aux écouteurs."""
+
+    action: str  # "deplace", "copie" ou "supprime" (source supprimée)
+    source: Path
+    destination: Path
+
+
+def espace_libre_disque(dossier: Path) -> Optional[int]:
+    """Retourne l'espace disponible en octets pour un dossier."""
+    try:
+        if hasattr(os, "statvfs"):
+            stats = os.statvfs(dossier)
+            return stats.f_bavail * stats.f_frsize
+        return shutil.disk_usage(dossier).free
+    except OSError:
+        return None
+
+
+def est_dossier_mensuel(nom_dossier: str) -> bool:
+    """Indique si un dossier est un dossier mensuel (ex: "0-1months")."""
+    return "-" in nom_dossier and "month" in nom_dossier
+
+
 class OrganisateurPhotos:
     """Organisateur principal des photos par mois."""
 
@@ -20,13 +75,23 @@ class OrganisateurPhotos:
         sous_dossier_photos: str,
         date_naissance: datetime,
         type_fichiers: str = "📸🎬 Photos et Vidéos",
+        copieur: Optional[PhotoCopier] = None,
     ):
         self.dossier_racine = Path(dossier_racine)
         self.dossier_source = self.dossier_racine / sous_dossier_photos
         self.date_naissance = date_naissance
-        self.copieur = PhotoCopier()
+        self.copieur = copieur if copieur is not None else PhotoCopier()
         self.type_fichiers = type_fichiers
         self.extensions_actives = self._get_extensions_actives()
+        # Rappels appelés pour chaque fichier déplacé ou copié avec succès
+        self.ecouteurs: list[Callable[[ChangementFichier], None]] = []
+
+    def _notifier(self, action: str, source: Path, destination: Path) -> None:
+        """Signale un changement de fichier aux écouteurs."""
+        if self.ecouteurs:
+            changement = ChangementFichier(action, source, destination)
+            for ecouteur in self.ecouteurs:
+                ecouteur(changement)
 
     def extraire_date_nom_fichier(self, nom_fichier: str) -> Optional[datetime]:
         """Extrait la date du nom de fichier au format YYYYMMDD."""
@@ -102,59 +167,291 @@ class OrganisateurPhotos:
 
         return repartition
 
-    def simuler_organisation(self) -> tuple[dict[str, list[Path]], list[str]]:
-        """Simule l'organisation sans déplacer les fichiers."""
+    def planifier(self) -> PlanOrganisation:
+        """Scanne le dossier source une fois et construit le plan d'organisation.
+
+        Les déplacements sont groupés par dossier de destination (dans l'ordre des
+        mois), puis triés par emplacement physique des fichiers sources pour
+        limiter les déplacements de tête sur les disques rotatifs.
+        """
         repartition = self.analyser_photos()
-        erreurs = []
+        dossiers_a_creer = []
+        deplacements = []
+        conflits = []
+        taille_totale = 0
 
-        for nom_dossier, fichiers in repartition.items():
+        for nom_dossier in sorted(repartition, key=self._numero_mois):
             dossier_cible = self.dossier_racine / nom_dossier
-            for fichier in fichiers:
-                fichier_cible = dossier_cible / fichier.name
-                if fichier_cible.exists():
-                    erreurs.append(f"Le fichier {fichier_cible} existe déjà")
 
-        return repartition, erreurs
+            # Un seul listage par dossier de destination pour détecter les conflits
+            if dossier_cible.is_dir():
+                existants = {f.name for f in dossier_cible.iterdir()}
+            else:
+                dossiers_a_creer.append(dossier_cible)
+                existants = set()
 
-    def organiser(self) -> tuple[int, list[str]]:
-        """Organise réellement les photos."""
-        repartition = self.analyser_photos()
+            fichiers = []
+            for fichier in repartition[nom_dossier]:
+                if fichier.name in existants:
+                    conflits.append(
+                        f"Le fichier {dossier_cible / fichier.name} existe déjà"
+                    )
+                    continue
+                stat = fichier.stat()
+                taille_totale += stat.st_size
+                fichiers.append((cle_localite(fichier, stat.st_ino), fichier))
+
+            fichiers.sort(key=lambda x: x[0])
+            deplacements.extend((fichier, dossier_cible) for _, fichier in fichiers)
+
+        return PlanOrganisation(
+            repartition=repartition,
+            dossiers_a_creer=dossiers_a_creer,
+            deplacements=deplacements,
+            conflits=conflits,
+            taille_totale=taille_totale,
+            espace_libre=espace_libre_disque(self.dossier_racine),
+            fichiers_ignores=self._fichiers_ignores,
+        )
+
+    def simuler_organisation(self) -> tuple[dict[str, list[Path]], list[str]]:
+        """Simule l'organisation sans déplacer les fichiers."""
+        plan = self.planifier()
+        return plan.repartition, plan.conflits
+
+    @staticmethod
+    def _numero_mois(nom_dossier: str) -> int:
+        """Extrait le numéro de mois du nom de dossier (ex: "0-1months" -> 0)."""
+        try:
+            return int(nom_dossier.split("-")[0])
+        except ValueError:
+            return 999
+
+    def organiser(
+        self,
+        progression: Optional[Callable[[int, int, dict], None]] = None,
+        plan: Optional[PlanOrganisation] = None,
+    ) -> tuple[int, list[str]]:
+        """Organise réellement les photos.
+
+        Args:
+            progression: Rappel optionnel appelé après chaque fichier avec
+                (fichiers traités, total, débit mesuré par l'ordonnanceur)
+            plan: Plan déjà calculé (ex: par la simulation), recalculé sinon
+        """
+        if plan is None:
+            plan = self.planifier()
         compteur = 0
-        erreurs = []
+        erreurs = list(plan.conflits)
 
-        for nom_dossier, fichiers in repartition.items():
-            dossier_cible = self.dossier_racine / nom_dossier
-            dossier_cible.mkdir(exist_ok=True)
+        # Tous les dossiers sont créés d'avance : aucune vérification par fichier
+        for dossier_cible in plan.dossiers_a_creer:
+            dossier_cible.mkdir(parents=True, exist_ok=True)
 
-            for fichier in fichiers:
+        total = len(plan.deplacements)
+        with self._suivre_manifeste():
+            for i, (fichier, dossier_cible) in enumerate(plan.deplacements, start=1):
                 try:
-                    self.copieur.deplacer_fichier(fichier, dossier_cible)
+                    destination = self.copieur.deplacer_fichier(
+                        fichier, dossier_cible, creer_dossier=False
+                    )
+                    self._notifier("deplace", fichier, destination)
                     compteur += 1
                 except Exception as e:
                     erreurs.append(f"Erreur pour {fichier.name}: {str(e)}")
 
+                if progression:
+                    progression(i, total, self.copieur.ordonnanceur.mesures())
+
+        return compteur, erreurs
+
+    def organiser_par_copie(
+        self,
+        progression: Optional[Callable[[int, int, dict], None]] = None,
+        plan: Optional[PlanOrganisation] = None,
+    ) -> tuple[int, list[str]]:
+        """Organise en copiant les fichiers, puis vérifie chaque copie.
+
+        L'empreinte de la source est calculée pendant la copie (une seule
+        lecture). Les copies sont relues en parallèle par un pool de workers et
+        comparées à cette empreinte ; une copie invalide est refaite seule.
+        Les empreintes vérifiées sont enregistrées dans le manifeste.
+
+        Args:
+            progression: Rappel optionnel appelé après chaque copie avec
+                (fichiers copiés, total, débit mesuré par l'ordonnanceur)
+            plan: Plan déjà calculé (ex: par la simulation), recalculé sinon
+        """
+        if plan is None:
+            plan = self.planifier()
+
+        if not plan.espace_suffisant():
+            return 0, [
+                f"Espace disque insuffisant : {plan.taille_totale_gb:.2f} GB "
+                f"requis, {plan.espace_libre / (1024 ** 3):.2f} GB disponibles"
+            ]
+
+        compteur = 0
+        erreurs = list(plan.conflits)
+        manifeste = Manifeste(self.dossier_racine)
+
+        for dossier_cible in plan.dossiers_a_creer:
+            dossier_cible.mkdir(parents=True, exist_ok=True)
+
+        def copier(fichier: Path, dossier_cible: Path):
+            destination, empreinte = self.copieur.copier_avec_empreinte(
+                fichier, dossier_cible, creer_dossier=False
+            )
+            return fichier, destination, empreinte
+
+        total = len(plan.deplacements)
+        with ThreadPoolExecutor(
+            max_workers=INTEGRITY_CONFIG["workers_verification"]
+        ) as pool:
+            # verification -> (source, destination, empreinte attendue, tentative)
+            en_attente = {}
+
+            for i, (fichier, dossier_cible) in enumerate(plan.deplacements, start=1):
+                try:
+                    fichier, destination, empreinte = copier(fichier, dossier_cible)
+                    verification = pool.submit(hacher_fichier, destination)
+                    en_attente[verification] = (fichier, destination, empreinte, 1)
+                except Exception as e:
+                    erreurs.append(f"Erreur pour {fichier.name}: {str(e)}")
+
+                if progression:
+                    progression(i, total, self.copieur.ordonnanceur.mesures())
+
+            while en_attente:
+                terminees, _ = wait(en_attente, return_when=FIRST_COMPLETED)
+                for verification in terminees:
+                    fichier, destination, empreinte, tentative = en_attente.pop(
+                        verification
+                    )
+                    try:
+                        if verification.result() == empreinte:
+                            manifeste.enregistrer(destination, empreinte)
+                            self._notifier("copie", fichier, destination)
+                            compteur += 1
+                            continue
+
+                        if tentative >= INTEGRITY_CONFIG["tentatives_max"]:
+                            # La copie corrompue ne doit pas rester dans le mois
+                            destination.unlink(missing_ok=True)
+                            erreurs.append(
+                                f"Erreur pour {fichier.name}: copie corrompue "
+                                f"après {tentative} tentatives"
+                            )
+                            continue
+
+                        # Seul ce fichier est recopié puis revérifié
+                        destination.unlink()
+                        fichier, destination, empreinte = copier(
+                            fichier, destination.parent
+                        )
+                        nouvelle_verification = pool.submit(hacher_fichier, destination)
+                        en_attente[nouvelle_verification] = (
+                            fichier,
+                            destination,
+                            empreinte,
+                            tentative + 1,
+                        )
+                    except Exception as e:
+                        # Copie non vérifiée (relecture ou recopie en échec)
+                        destination.unlink(missing_ok=True)
+                        erreurs.append(f"Erreur pour {fichier.name}: {str(e)}")
+
+        manifeste.sauvegarder()
         return compteur, erreurs
 
     def reinitialiser(self) -> tuple[int, list[str]]:
-        """Remet tous les fichiers à la racine."""
+        """Remet tous les fichiers à la racine.
+
+        Après une organisation par copie, les originaux sont encore dans le
+        dossier source : une copie dont l'original correspond toujours à
+        l'empreinte vérifiée du manifeste est simplement supprimée (avec son
+        entrée), au lieu d'être déplacée sur l'original.
+        """
         compteur = 0
         erreurs = []
 
-        for dossier in self.dossier_racine.iterdir():
-            if dossier.is_dir() and "-" in dossier.name and "month" in dossier.name:
+        with self._suivre_manifeste() as manifeste:
+            for dossier in self.dossier_racine.iterdir():
+                if not (dossier.is_dir() and est_dossier_mensuel(dossier.name)):
+                    continue
                 for fichier in dossier.iterdir():
-                    if fichier.is_file():
-                        try:
-                            self.copieur.deplacer_fichier(fichier, self.dossier_source)
-                            compteur += 1
-                        except Exception as e:
-                            erreurs.append(f"Erreur pour {fichier.name}: {str(e)}")
+                    if not fichier.is_file():
+                        continue
+                    original = self.dossier_source / fichier.name
+                    try:
+                        if original.exists():
+                            self._supprimer_copie(fichier, original, manifeste)
+                            self._notifier("supprime", fichier, original)
+                        else:
+                            destination = self.copieur.deplacer_fichier(
+                                fichier, self.dossier_source
+                            )
+                            self._notifier("deplace", fichier, destination)
+                        compteur += 1
+                    except Exception as e:
+                        erreurs.append(f"Erreur pour {fichier.name}: {str(e)}")
 
                 if not any(dossier.iterdir()):
                     dossier.rmdir()
 
         return compteur, erreurs
 
+    @contextmanager
+    def _suivre_manifeste(self) -> Iterator[Manifeste]:
+        """Tient le manifeste des empreintes à jour pendant une opération.
+
+        Branché sur les écouteurs : une entrée suit son fichier d'un dossier
+        mensuel à l'autre, et disparaît quand le fichier quitte les dossiers
+        mensuels ou est supprimé. Le scrub ne signale donc pas comme manquants
+        les fichiers réinitialisés ou réorganisés.
+        """
+        manifeste = Manifeste(self.dossier_racine)
+        if not manifeste.fichiers:
+            yield manifeste
+            return
+
+        def suivre(changement: ChangementFichier) -> None:
+            if changement.action == "copie":
+                return
+            destination = changement.destination
+            mensuel = (
+                changement.action == "deplace"
+                and destination.parent.parent == self.dossier_racine
+                and est_dossier_mensuel(destination.parent.name)
+            )
+            manifeste.deplacer(changement.source, destination if mensuel else None)
+
+        self.ecouteurs.append(suivre)
+        try:
+            yield manifeste
+        finally:
+            self.ecouteurs.remove(suivre)
+            manifeste.sauvegarder()
+
+    def _supprimer_copie(
+        self, copie: Path, original: Path, manifeste: Manifeste
+    ) -> None:
+        """Supprime une copie vérifiée dont l'original est resté à la source.
+
+        Raises:
+            FileExistsError: Si la copie n'est pas au manifeste ou si l'original
+                ne correspond plus à l'empreinte vérifiée (rien n'est supprimé)
+        """
+        entree = manifeste.fichiers.get(manifeste.cle(copie))
+        if entree is None or entree["empreinte"] != hacher_fichier(
+            original, self.copieur.ordonnanceur, self.copieur.priorite
+        ):
+            raise FileExistsError(
+                f"Le fichier {original} existe déjà et ne correspond pas à une "
+                f"copie vérifiée"
+            )
+        copie.unlink()
+
     def calculer_taille_fichiers_organises(self, repartition: dict) -> float:
         """Calcule la taille totale des fichiers qui seront organisés en GB."""
         taille_totale = 0
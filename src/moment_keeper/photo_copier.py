@@ -1,18 +1,102 @@
 """Module pour les opérations de copie et déplacement de fichiers."""
 
+import os
 import shutil
+import struct
+import sys
 from pathlib import Path
+from typing import Optional
+
+from .checksums import liberer_cache_page, nouveau_hacheur
+from .config import IO_THROTTLE
+from .io_scheduler import PRIORITE_NORMALE, IOScheduler
+
+# Ioctl FIEMAP (Linux) : renvoie la position physique des extents d'un fichier
+FS_IOC_FIEMAP = 0xC020660B
+_FIEMAP_ENTETE = struct.Struct("=QQLLLL")
+_FIEMAP_EXTENT = struct.Struct("=QQQQQLLLL")
+
+
+def _premier_extent_physique(chemin: Path) -> Optional[int]:
+    """Retourne l'offset physique du premier extent via FIEMAP, si disponible."""
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        import fcntl
+
+        # En-tête demandant un seul extent sur toute la longueur du fichier
+        tampon = bytearray(
+            _FIEMAP_ENTETE.pack(0, 0xFFFFFFFFFFFFFFFF, 0, 0, 1, 0)
+            + bytes(_FIEMAP_EXTENT.size)
+        )
+        with open(chemin, "rb") as f:
+            fcntl.ioctl(f.fileno(), FS_IOC_FIEMAP, tampon)
+
+        extents_mappes = _FIEMAP_ENTETE.unpack_from(tampon)[3]
+        if extents_mappes == 0:
+            return None
+        return _FIEMAP_EXTENT.unpack_from(tampon, _FIEMAP_ENTETE.size)[1]
+    except (OSError, ImportError):
+        return None
+
+
+def cle_localite(chemin: Path, inode: Optional[int] = None) -> tuple[int, int, int]:
+    """Retourne une clé de tri reflétant l'emplacement du fichier sur le disque.
+
+    L'offset physique (FIEMAP) est utilisé quand le système le fournit, sinon
+    le numéro d'inode, qui suit en général l'ordre d'allocation. Le premier
+    élément sépare les deux cas : offsets et inodes ne sont jamais comparés,
+    les fichiers sans offset passent après ceux qui en ont un.
+
+    Returns:
+        (0, offset physique, inode) ou (1, inode, inode)
+    """
+    if inode is None:
+        try:
+            inode = os.stat(chemin).st_ino
+        except OSError:
+            return (1, 0, 0)
+
+    physique = _premier_extent_physique(chemin)
+    if physique is None:
+        return (1, inode, inode)
+    return (0, physique, inode)
 
 
 class PhotoCopier:
     """Gestionnaire des opérations sur les fichiers photo."""
 
-    def deplacer_fichier(self, source: Path, destination_dir: Path) -> Path:
+    def __init__(
+        self,
+        ordonnanceur: Optional[IOScheduler] = None,
+        priorite: int = PRIORITE_NORMALE,
+    ):
+        """Initialise le copieur.
+
+        Args:
+            ordonnanceur: Ordonnanceur limitant le débit (illimité par défaut)
+            priorite: Priorité des opérations de ce copieur
+        """
+        self.ordonnanceur = ordonnanceur if ordonnanceur is not None else IOScheduler()
+        self.priorite = priorite
+        self._volumes: dict[Path, int] = {}
+
+    def _volume(self, dossier: Path) -> int:
+        """Retourne l'identifiant du volume d'un dossier (mis en cache)."""
+        if dossier not in self._volumes:
+            self._volumes[dossier] = dossier.stat().st_dev
+        return self._volumes[dossier]
+
+    def deplacer_fichier(
+        self, source: Path, destination_dir: Path, creer_dossier: bool = True
+    ) -> Path:
         """Déplace un fichier vers un dossier de destination."""
         if not source.exists():
             raise FileNotFoundError(f"Le fichier source {source} n'existe pas")
 
-        if not destination_dir.exists():
+        # Le plan d'organisation crée les dossiers d'avance (creer_dossier=False)
+        if creer_dossier and not destination_dir.exists():
             destination_dir.mkdir(parents=True, exist_ok=True)
 
         destination = destination_dir / source.name
@@ -20,15 +104,26 @@ class PhotoCopier:
         if destination.exists():
             raise FileExistsError(f"Le fichier {destination} existe déjà")
 
-        shutil.move(str(source), str(destination))
+        if self._volume(source.parent) == self._volume(destination_dir):
+            # Simple renommage : aucune donnée transférée
+            self.ordonnanceur.acquerir(operations=1, priorite=self.priorite)
+            shutil.move(str(source), str(destination))
+            self.ordonnanceur.enregistrer(operations=1)
+        else:
+            # Changement de volume : copie limitée puis suppression de la source
+            self._copier_contenu(source, destination)
+            source.unlink()
         return destination
 
-    def copier_fichier(self, source: Path, destination_dir: Path) -> Path:
+    def copier_fichier(
+        self, source: Path, destination_dir: Path, creer_dossier: bool = True
+    ) -> Path:
         """Copie un fichier vers un dossier de destination."""
         if not source.exists():
             raise FileNotFoundError(f"Le fichier source {source} n'existe pas")
 
-        if not destination_dir.exists():
+        # Le plan d'organisation crée les dossiers d'avance (creer_dossier=False)
+        if creer_dossier and not destination_dir.exists():
             destination_dir.mkdir(parents=True, exist_ok=True)
 
         destination = destination_dir / source.name
@@ -36,5 +131,68 @@ class PhotoCopier:
         if destination.exists():
             raise FileExistsError(f"Le fichier {destination} existe déjà")
 
-        shutil.copy2(str(source), str(destination))
+        self._copier_contenu(source, destination)
         return destination
+
+    def copier_avec_empreinte(
+        self, source: Path, destination_dir: Path, creer_dossier: bool = True
+    ) -> tuple[Path, str]:
+        """Copie un fichier en calculant son empreinte pendant la lecture.
+
+        La source n'est lue qu'une seule fois : l'empreinte obtenue sert ensuite
+        de référence pour vérifier la copie.
+
+        Returns:
+            Chemin de la copie et empreinte du contenu source
+        """
+        if not source.exists():
+            raise FileNotFoundError(f"Le fichier source {source} n'existe pas")
+
+        if creer_dossier and not destination_dir.exists():
+            destination_dir.mkdir(parents=True, exist_ok=True)
+
+        destination = destination_dir / source.name
+
+        if destination.exists():
+            raise FileExistsError(f"Le fichier {destination} existe déjà")
+
+        hacheur = nouveau_hacheur()
+        self._copier_contenu(source, destination, hacheur)
+        return destination, hacheur.hexdigest()
+
+    def _copier_contenu(self, source: Path, destination: Path, hacheur=None) -> None:
+        """Copie le contenu et les métadonnées en respectant l'ordonnanceur."""
+        if hacheur is None and not self.ordonnanceur.est_limite:
+            try:
+                shutil.copy2(str(source), str(destination))
+            except BaseException:
+                destination.unlink(missing_ok=True)
+                raise
+            self.ordonnanceur.enregistrer(
+                octets=destination.stat().st_size, operations=1
+            )
+            return
+
+        taille_bloc = IO_THROTTLE["taille_bloc"]
+        self.ordonnanceur.acquerir(operations=1, priorite=self.priorite)
+        try:
+            with open(source, "rb") as f_source, open(destination, "wb") as f_dest:
+                while bloc := f_source.read(taille_bloc):
+                    self.ordonnanceur.acquerir(octets=len(bloc), priorite=self.priorite)
+                    if hacheur is not None:
+                        hacheur.update(bloc)
+                    f_dest.write(bloc)
+                    self.ordonnanceur.enregistrer(octets=len(bloc))
+
+                if hacheur is not None:
+                    # Écrire sur le disque puis vider le cache pour que la
+                    # vérification relise le support et non la mémoire
+                    f_dest.flush()
+                    os.fsync(f_dest.fileno())
+                    liberer_cache_page(f_dest.fileno())
+            shutil.copystat(str(source), str(destination))
+        except BaseException:
+            # Ne jamais laisser une copie partielle dans le dossier cible
+            destination.unlink(missing_ok=True)
+            raise
+        self.ordonnanceur.enregistrer(operations=1)
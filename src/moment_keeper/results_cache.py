@@ -0,0 +1,116 @@
+"""Cache borné des résultats d'analyse, partagé entre les reruns Streamlit."""
+
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+import pandas as pd
+
+
+def taille_estimee(valeur: Any) -> int:
+    """Estime la mémoire occupée par un résultat, en octets.
+
+    Les DataFrames sont mesurés directement ; les autres résultats (métriques,
+    insights, figures plotly) par la taille de leur sérialisation.
+    """
+    if isinstance(valeur, pd.DataFrame):
+        return int(valeur.memory_usage(deep=True).sum())
+    try:
+        return len(pickle.dumps(valeur, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return sys.getsizeof(valeur)
+
+
+class CacheResultats:
+    """Cache LRU borné en octets, avec compteurs de succès, défauts et évictions.
+
+    Les clés sont des tuples commençant par l'identité du projet (dossier
+    racine, sous-dossier, date de naissance, type de fichiers), suivie de la
+    langue, de l'empreinte des dossiers et du nom du résultat : un changement
+    de la bibliothèque produit donc de nouvelles clés, et `invalider` libère
+    les anciennes entrées d'un projet.
+    """
+
+    def __init__(self, budget_octets: int):
+        """Initialise le cache.
+
+        Args:
+            budget_octets: Mémoire maximale occupée par les résultats conservés
+        """
+        self.budget_octets = budget_octets
+        self.taille = 0
+        self.succes = 0
+        self.defauts = 0
+        self.evictions = 0
+        self._entrees: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def obtenir(self, cle: Optional[Hashable], calcul: Callable[[], Any]) -> Any:
+        """Retourne le résultat en cache, ou le calcule et le conserve.
+
+        Une clé None désactive le cache pour cet appel (données provisoires).
+        """
+        if cle is None:
+            return calcul()
+
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None:
+                self._entrees.move_to_end(cle)
+                self.succes += 1
+                return entree[0]
+            self.defauts += 1
+
+        # Calcul hors verrou : les autres sessions ne sont pas bloquées
+        valeur = calcul()
+        self.stocker(cle, valeur)
+        return valeur
+
+    def stocker(self, cle: Hashable, valeur: Any) -> None:
+        """Conserve un résultat en évinçant les moins récemment utilisés."""
+        taille = taille_estimee(valeur)
+        if taille > self.budget_octets:
+            return
+
+        with self._verrou:
+            ancienne = self._entrees.pop(cle, None)
+            if ancienne is not None:
+                self.taille -= ancienne[1]
+            self._entrees[cle] = (valeur, taille)
+            self.taille += taille
+
+            while self.taille > self.budget_octets:
+                _, (_, taille_evincee) = self._entrees.popitem(last=False)
+                self.taille -= taille_evincee
+                self.evictions += 1
+
+    def invalider(self, prefixe: tuple = ()) -> int:
+        """Supprime les entrées dont la clé commence par `prefixe` (toutes par défaut).
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        with self._verrou:
+            cles = [
+                cle
+                for cle in self._entrees
+                if isinstance(cle, tuple) and cle[: len(prefixe)] == prefixe
+            ]
+            for cle in cles:
+                self.taille -= self._entrees.pop(cle)[1]
+        return len(cles)
+
+    def statistiques(self) -> dict[str, int]:
+        """Retourne les compteurs du cache."""
+        with self._verrou:
+            return {
+                "entrees": len(self._entrees),
+                "taille": self.taille,
+                "budget": self.budget_octets,
+                "succes": self.succes,
+                "defauts": self.defauts,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,120 @@
+"""Vérification incrémentale de l'intégrité des dossiers mensuels (scrub)."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from .checksums import Manifeste, hacher_fichier
+from .config import SCRUB_CONFIG
+from .io_scheduler import PRIORITE_ARRIERE_PLAN, IOScheduler
+from .organizer import est_dossier_mensuel
+
+
+@dataclass
+class RapportScrub:
+    """Résultat d'une passe de vérification."""
+
+    verifies: int = 0
+    nouveaux: int = 0
+    modifies: int = 0
+    octets_lus: int = 0
+    corrompus: list[str] = field(default_factory=list)
+    manquants: list[str] = field(default_factory=list)
+    restants: int = 0  # fichiers non vérifiés faute de budget
+
+
+def lister_fichiers_organises(dossier_racine: Path) -> dict[str, Path]:
+    """Liste les fichiers des dossiers mensuels, indexés par clé de manifeste."""
+    fichiers = {}
+    for dossier in Path(dossier_racine).iterdir():
+        if dossier.is_dir() and est_dossier_mensuel(dossier.name):
+            for fichier in dossier.iterdir():
+                if fichier.is_file():
+                    fichiers[f"{dossier.name}/{fichier.name}"] = fichier
+    return fichiers
+
+
+def scrub(
+    dossier_racine: Path,
+    budget_octets: Optional[int] = None,
+    ordonnanceur: Optional[IOScheduler] = None,
+    progression: Optional[Callable[[int, int], None]] = None,
+) -> RapportScrub:
+    """Vérifie une tranche de la bibliothèque, les fichiers les plus anciens d'abord.
+
+    Chaque exécution relit au plus `budget_octets` octets, au débit autorisé par
+    l'ordonnanceur. Les fichiers jamais vérifiés passent en premier, puis ceux
+    dont la dernière vérification est la plus ancienne : des exécutions
+    successives couvrent donc toute la bibliothèque et reprennent naturellement
+    là où la précédente s'est arrêtée. Le manifeste est sauvegardé régulièrement.
+
+    Args:
+        dossier_racine: Dossier principal contenant les dossiers mensuels
+        budget_octets: Volume maximal à relire pendant cette exécution
+        ordonnanceur: Ordonnanceur limitant le débit de lecture
+        progression: Rappel optionnel appelé avec (octets lus, budget)
+
+    Returns:
+        Rapport des vérifications, corruptions et fichiers manquants
+    """
+    if budget_octets is None:
+        budget_octets = SCRUB_CONFIG["budget_octets"]
+    if ordonnanceur is None:
+        ordonnanceur = IOScheduler(SCRUB_CONFIG["octets_par_seconde"])
+
+    rapport = RapportScrub()
+    manifeste = Manifeste(dossier_racine)
+    fichiers = lister_fichiers_organises(dossier_racine)
+
+    # Les entrées dont le fichier a disparu sont signalées puis retirées
+    for cle in list(manifeste.fichiers):
+        if cle not in fichiers:
+            rapport.manquants.append(cle)
+            del manifeste.fichiers[cle]
+
+    # Jamais vérifiés d'abord ("" < date ISO), puis les plus anciennes vérifications
+    file_attente = sorted(
+        fichiers,
+        key=lambda cle: manifeste.fichiers.get(cle, {}).get("verifie_le", ""),
+    )
+
+    for i, cle in enumerate(file_attente):
+        if rapport.octets_lus >= budget_octets:
+            rapport.restants = len(file_attente) - i
+            break
+
+        chemin = fichiers[cle]
+        try:
+            stat = chemin.stat()
+            empreinte = hacher_fichier(chemin, ordonnanceur, PRIORITE_ARRIERE_PLAN)
+        except OSError as e:
+            rapport.corrompus.append(f"{cle}: lecture impossible ({e})")
+            continue
+
+        rapport.octets_lus += stat.st_size
+        entree = manifeste.fichiers.get(cle)
+
+        if entree is None:
+            rapport.nouveaux += 1
+            manifeste.enregistrer(chemin, empreinte)
+        elif entree.get("mtime_ns") not in (None, stat.st_mtime_ns):
+            # Fichier modifié volontairement : nouvelle empreinte de référence
+            rapport.modifies += 1
+            manifeste.enregistrer(chemin, empreinte)
+        elif empreinte != entree["empreinte"]:
+            # Même fichier, contenu différent : corruption silencieuse
+            rapport.corrompus.append(cle)
+            entree["corrompu_le"] = datetime.now().isoformat(timespec="seconds")
+            entree["verifie_le"] = entree["corrompu_le"]
+        else:
+            rapport.verifies += 1
+            entree["verifie_le"] = datetime.now().isoformat(timespec="seconds")
+
+        if (i + 1) % SCRUB_CONFIG["sauvegarde_tous_les"] == 0:
+            manifeste.sauvegarder()
+        if progression:
+            progression(rapport.octets_lus, budget_octets)
+
+    manifeste.sauvegarder()
+    return rapport
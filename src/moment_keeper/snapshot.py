@@ -0,0 +1,188 @@
+"""Instantané colonnaire (Feather/Arrow) du DataFrame d'analyse.
+
+Au démarrage, l'onglet Analytics lit l'instantané en mémoire mappée au lieu de
+reparcourir toute la bibliothèque. Une empreinte peu coûteuse (date de
+modification de la racine et de chaque dossier) indique s'il est à jour ; sinon
+il est affiché tel quel pendant qu'un thread le reconstruit en arrière-plan.
+
+pyarrow est optionnel : sans lui, les données sont simplement recalculées.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .analytics import SCHEMA_DONNEES_PHOTOS, extract_photo_data
+from .config import SNAPSHOT_CONFIG
+from .organizer import OrganisateurPhotos
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    pa = None
+    feather = None
+
+CLE_EMPREINTE = b"moment_keeper.empreinte"
+
+# Rafraîchissements en cours, par fichier d'instantané
+_rafraichissements: dict[Path, threading.Thread] = {}
+_verrou_rafraichissements = threading.Lock()
+
+
+def snapshots_disponibles() -> bool:
+    """Indique si pyarrow est installé."""
+    return feather is not None
+
+
+def empreinte_dossiers(dossier_racine: Path) -> str:
+    """Calcule l'empreinte de la structure du projet sans lister les fichiers.
+
+    La date de modification d'un dossier change dès qu'un fichier y est ajouté,
+    supprimé ou renommé : un stat par dossier suffit donc à détecter les
+    changements qui affectent l'analyse (qui ne dépend que des noms).
+    """
+    hacheur = hashlib.sha1()
+    racine = Path(dossier_racine)
+    hacheur.update(f"{racine.stat().st_mtime_ns}".encode())
+
+    for entree in sorted(os.scandir(racine), key=lambda e: e.name):
+        if entree.is_dir():
+            hacheur.update(f"{entree.name}:{entree.stat().st_mtime_ns};".encode())
+
+    return hacheur.hexdigest()
+
+
+def chemin_snapshot(organiseur: OrganisateurPhotos) -> Path:
+    """Retourne le fichier d'instantané d'un projet.
+
+    Le nom dépend de tout ce qui change le contenu du DataFrame : dossier
+    racine, date de naissance et type de fichiers analysés.
+    """
+    cle = (
+        f"{organiseur.dossier_racine.resolve()}|"
+        f"{organiseur.date_naissance.isoformat()}|{organiseur.type_fichiers}"
+    )
+    nom = hashlib.sha1(cle.encode("utf-8")).hexdigest()[:16]
+    project_root = Path(__file__).parent.parent.parent
+    return (
+        project_root
+        / "data"
+        / "user-config"
+        / SNAPSHOT_CONFIG["sous_dossier"]
+        / f"{nom}.feather"
+    )
+
+
+def lire_snapshot(chemin: Path) -> Optional[tuple[pd.DataFrame, str]]:
+    """Lit un instantané en mémoire mappée.
+
+    Returns:
+        (DataFrame, empreinte enregistrée), ou None si illisible ou absent
+    """
+    if feather is None or not chemin.exists():
+        return None
+
+    try:
+        table = feather.read_table(chemin, memory_map=True)
+        metadonnees = table.schema.metadata or {}
+        empreinte = metadonnees.get(CLE_EMPREINTE, b"").decode()
+        return table.to_pandas().astype(SCHEMA_DONNEES_PHOTOS), empreinte
+    except (OSError, ValueError, pa.ArrowException) as e:
+        print(f"Erreur lors de la lecture de l'instantané: {e}")
+        return None
+
+
+def ecrire_snapshot(chemin: Path, df: pd.DataFrame, empreinte: str) -> None:
+    """Écrit un instantané de façon atomique (fichier temporaire + remplacement)."""
+    if feather is None:
+        return
+
+    chemin.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), CLE_EMPREINTE: empreinte.encode()}
+    )
+    temporaire = chemin.with_suffix(".tmp")
+    # Non compressé : la lecture en mémoire mappée évite alors toute copie
+    feather.write_feather(table, temporaire, compression=SNAPSHOT_CONFIG["compression"])
+    os.replace(temporaire, chemin)
+
+
+def enregistrer_snapshot(
+    organiseur: OrganisateurPhotos, df: pd.DataFrame, empreinte: Optional[str] = None
+) -> None:
+    """Enregistre un DataFrame tenu à jour sans parcours (ex: état incrémental).
+
+    Args:
+        empreinte: Empreinte des dossiers que reflète `df` (celle du moment
+            par défaut) ; elle ne doit pas être plus récente que les données
+    """
+    try:
+        ecrire_snapshot(
+            chemin_snapshot(organiseur),
+            df,
+            empreinte or empreinte_dossiers(organiseur.dossier_racine),
+        )
+    except (OSError, ValueError) as e:
+        print(f"Erreur lors de l'écriture de l'instantané: {e}")
+
+
+def _reconstruire(organiseur: OrganisateurPhotos, chemin: Path) -> pd.DataFrame:
+    """Reparcourt la bibliothèque et enregistre un nouvel instantané."""
+    # Empreinte prise avant le parcours : un changement pendant celui-ci
+    # sera détecté au prochain chargement
+    empreinte = empreinte_dossiers(organiseur.dossier_racine)
+    df = extract_photo_data(organiseur)
+    try:
+        ecrire_snapshot(chemin, df, empreinte)
+    except (OSError, ValueError) as e:
+        print(f"Erreur lors de l'écriture de l'instantané: {e}")
+    return df
+
+
+def rafraichir_en_arriere_plan(organiseur: OrganisateurPhotos) -> None:
+    """Lance la reconstruction de l'instantané dans un thread (une seule à la fois)."""
+    chemin = chemin_snapshot(organiseur)
+    with _verrou_rafraichissements:
+        thread = _rafraichissements.get(chemin)
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(
+                target=_reconstruire,
+                args=(organiseur, chemin),
+                name=f"snapshot-{chemin.stem}",
+                daemon=True,
+            )
+            _rafraichissements[chemin] = thread
+            thread.start()
+
+
+def charger_donnees_photos(organiseur: OrganisateurPhotos) -> tuple[pd.DataFrame, bool]:
+    """Charge le DataFrame d'analyse, depuis l'instantané si possible.
+
+    - Instantané à jour : lu directement, sans parcours de la bibliothèque.
+    - Instantané périmé : renvoyé tel quel et reconstruit en arrière-plan.
+    - Pas d'instantané (ou pas de pyarrow) : calcul complet immédiat.
+
+    Returns:
+        (DataFrame, à_jour) où à_jour est False si les données affichées
+        proviennent d'un instantané en cours de rafraîchissement
+    """
+    if not snapshots_disponibles():
+        return extract_photo_data(organiseur), True
+
+    chemin = chemin_snapshot(organiseur)
+    lu = lire_snapshot(chemin)
+    if lu is None:
+        return _reconstruire(organiseur, chemin), True
+
+    df, empreinte = lu
+    if empreinte == empreinte_dossiers(organiseur.dossier_racine):
+        return df, True
+
+    rafraichir_en_arriere_plan(organiseur)
+    return df, False
@@ -172,27 +172,29 @@ def get_css_styles() -> str:
     background: linear-gradient(180deg, {COLORS['secondary']} 0%, {COLORS['primary']} 100%);
 }}
 
-/* Onglets personnalisés */
-.stTabs {{
+/* Navigation entre les vues (boutons radio présentés comme des onglets) */
+.st-key-vue_active {{
     margin-top: -0.5rem;
 }}
 
-.stTabs [data-baseweb="tab-list"] {{
+.st-key-vue_active [role="radiogroup"] {{
     gap: 8px;
     background: rgba(255,255,255,0.1);
     border-radius: 15px;
     padding: 0.5rem;
     width: 100%;
     display: flex;
+    flex-wrap: nowrap;
 }}
 
-.stTabs [data-baseweb="tab"] {{
+.st-key-vue_active [role="radiogroup"] label {{
     height: 50px;
+    margin: 0;
+    padding: 0 0.5rem;
     background: rgba(255,255,255,0.7);
     border-radius: 10px;
     color: {COLORS['text_dark']};
     font-weight: 500;
-    border: none;
     transition: all 0.3s ease;
     flex: 1;
     display: flex;
@@ -201,7 +203,12 @@ def get_css_styles() -> str:
     min-width: 0;
 }}
 
-.stTabs [aria-selected="true"] {{
+/* Masquer la pastille du bouton radio */
+.st-key-vue_active [role="radiogroup"] label > div:first-child {{
+    display: none;
+}}
+
+.st-key-vue_active [role="radiogroup"] label:has(input:checked) {{
     background: linear-gradient(135deg, {COLORS['accent']} 0%, {COLORS['primary']} 100%);
     color: {COLORS['text_dark']};
     font-weight: 600;
@@ -385,6 +392,15 @@ def get_css_styles() -> str:
     cursor: pointer;
 }}
 
+/* Emplacement d'une image en cours de génération */
+.gallery-image-placeholder {{
+    width: 100%;
+    aspect-ratio: 1/1;
+    border-radius: 10px;
+    background: {COLORS['secondary']};
+    opacity: 0.6;
+}}
+
 /* Container pour l'image de la galerie */
 .gallery-image-container {{
     position: relative;
@@ -392,5 +408,27 @@ def get_css_styles() -> str:
     overflow: hidden;
     border-radius: 10px;
 }}
+
+/* Grille de la galerie : une page entière dans un seul bloc HTML */
+.gallery-grid {{
+    display: grid;
+    grid-template-columns: repeat(3, minmax(0, 1fr));
+    gap: 1rem;
+}}
+
+.gallery-cell {{
+    margin: 0;
+    min-width: 0;
+}}
+
+.gallery-cell .photo-caption {{
+    margin-bottom: 0.5rem;
+}}
+
+@media (max-width: 640px) {{
+    .gallery-grid {{
+        grid-template-columns: repeat(2, minmax(0, 1fr));
+    }}
+}}
 </style>
 """
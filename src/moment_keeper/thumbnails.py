@@ -0,0 +1,525 @@
+"""Magasin de vignettes JPEG sur disque pour la galerie.
+
+Chaque vignette est identifiée par le contenu de sa clé (chemin de l'original,
+taille, date de modification et taille cible) : un original modifié produit
+une nouvelle clé, et l'ancienne vignette finit évincée. Les vignettes sont
+conservées sous static/thumbnails, dans la limite d'un budget en octets ; les
+moins récemment lues sont supprimées en premier.
+
+Ce dossier est servi par Streamlit (`server.enableStaticServing`) : la galerie
+référence chaque vignette par son URL plutôt que d'intégrer le JPEG en base64.
+Le nom changeant avec le contenu, le navigateur peut garder sa copie d'un
+rerun ou d'une session à l'autre.
+"""
+
+import hashlib
+import heapq
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+from PIL import ExifTags, Image
+
+from .config import THUMBNAIL_CONFIG
+from .io_scheduler import PRIORITE_INTERACTIVE, PRIORITE_NORMALE, IOScheduler
+
+
+def dossier_vignettes() -> Path:
+    """Retourne le dossier des vignettes (dans static/, servi par Streamlit)."""
+    project_root = Path(__file__).parent.parent.parent
+    return project_root / "static" / THUMBNAIL_CONFIG["sous_dossier"]
+
+
+def url_vignette(fichier: Path) -> str:
+    """Retourne l'URL relative d'une vignette servie par Streamlit."""
+    return f"app/static/{THUMBNAIL_CONFIG['sous_dossier']}/{fichier.name}"
+
+
+def taille_variante(taille: int) -> int:
+    """Retourne la plus petite variante configurée couvrant `taille` pixels."""
+    for variante in sorted(THUMBNAIL_CONFIG["tailles"]):
+        if variante >= taille:
+            return variante
+    return max(THUMBNAIL_CONFIG["tailles"])
+
+
+# Transformation à appliquer pour chaque valeur de l'orientation EXIF
+TRANSPOSITIONS_EXIF = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+ORIENTATION_EXIF = 0x0112
+
+# Position et longueur de la vignette JPEG intégrée (IFD1)
+VIGNETTE_EXIF_DEBUT = 0x0201
+VIGNETTE_EXIF_LONGUEUR = 0x0202
+
+# Attente maximale d'une vignette confiée au pool de préchargement, en secondes
+DELAI_ATTENTE = 60
+
+# Délai minimal entre deux mises à jour de la date d'un fichier de vignette :
+# Last-Modified et l'ETag servis au navigateur en dépendent
+DELAI_TOUCHER_NS = 24 * 3600 * 10**9
+
+
+def taille_reduite(taille_image: tuple[int, int], taille: int) -> tuple[int, int]:
+    """Dimensions d'une image dont le côté court est ramené à `taille` pixels."""
+    largeur, hauteur = taille_image
+    echelle = min(1.0, taille / min(largeur, hauteur))
+    return max(1, round(largeur * echelle)), max(1, round(hauteur * echelle))
+
+
+def encoder_vignette(image: Image.Image) -> bytes:
+    """Encode une vignette en JPEG."""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    tampon = BytesIO()
+    image.save(tampon, format="JPEG", quality=THUMBNAIL_CONFIG["qualite"])
+    return tampon.getvalue()
+
+
+def extraire_vignette_exif(chemin: Path) -> Optional[Image.Image]:
+    """Retourne la vignette JPEG intégrée à l'EXIF (IFD1), orientée, ou None.
+
+    Seuls l'en-tête et le segment EXIF sont lus : l'image n'est pas décodée.
+    Une vignette aux proportions différentes de l'image (bandes noires ajoutées
+    par certains appareils) est ignorée, la galerie la recadrerait mal.
+    """
+    try:
+        with Image.open(chemin) as image:
+            if image.format != "JPEG" or "exif" not in image.info:
+                return None
+            exif = image.getexif()
+            ifd1 = exif.get_ifd(ExifTags.IFD.IFD1)
+            debut = ifd1.get(VIGNETTE_EXIF_DEBUT)
+            longueur = ifd1.get(VIGNETTE_EXIF_LONGUEUR)
+            if not debut or not longueur:
+                return None
+            # Les positions sont relatives à l'en-tête TIFF, après "Exif\0\0"
+            brut = image.info["exif"]
+            tiff = brut[6:] if brut.startswith(b"Exif\x00\x00") else brut
+            donnees = tiff[debut : debut + longueur]
+            orientation = exif.get(ORIENTATION_EXIF, 1)
+            proportions = image.width / image.height
+
+        vignette = Image.open(BytesIO(donnees))
+        vignette.load()
+    except (OSError, ValueError, SyntaxError):
+        return None
+
+    if abs(vignette.width / vignette.height - proportions) > 0.02 * proportions:
+        return None
+    if orientation in TRANSPOSITIONS_EXIF:
+        vignette = vignette.transpose(TRANSPOSITIONS_EXIF[orientation])
+    return vignette
+
+
+def vignette_exif(chemin: Path, taille: int) -> Optional[bytes]:
+    """Vignette JPEG tirée de l'EXIF, ou None si absente ou trop petite."""
+    apercu = extraire_vignette_exif(chemin)
+    if apercu is None or min(apercu.size) < taille:
+        return None
+    cible = taille_reduite(apercu.size, taille)
+    if apercu.size != cible:
+        apercu = apercu.resize(cible, Image.Resampling.BICUBIC)
+    return encoder_vignette(apercu)
+
+
+def creer_vignette(chemin: Path, taille: int) -> bytes:
+    """Crée la vignette d'une image, orientée, au côté court de `taille` pixels.
+
+    La vignette intégrée à l'EXIF est utilisée si elle est assez grande ;
+    sinon l'image est décodée à résolution réduite. L'orientation EXIF est lue
+    dans l'en-tête avant tout décodage. Pour un JPEG, `draft` demande ensuite
+    au décodeur une mise à l'échelle DCT (1/2, 1/4 ou 1/8) qui reste au-dessus
+    de la taille voulue : une photo de 20 mégapixels n'est jamais décodée en
+    entier. Jamais d'agrandissement : la galerie recadre les images en carré.
+
+    Returns:
+        Vignette encodée en JPEG
+    """
+    donnees = vignette_exif(chemin, taille)
+    if donnees is not None:
+        return donnees
+
+    with Image.open(chemin) as image:
+        orientation = image.getexif().get(ORIENTATION_EXIF, 1)
+        cible = taille_reduite(image.size, taille)
+
+        if image.format == "JPEG":
+            image.draft("RGB", cible)
+        vignette = image.convert("RGB") if image.mode != "RGB" else image
+        if vignette.size != cible:
+            vignette = vignette.resize(
+                cible, Image.Resampling.BICUBIC, reducing_gap=2.0
+            )
+        if orientation in TRANSPOSITIONS_EXIF:
+            vignette = vignette.transpose(TRANSPOSITIONS_EXIF[orientation])
+        return encoder_vignette(vignette)
+
+
+def soumettre_lecture(
+    ordonnanceur: Optional[IOScheduler], chemin: Path, priorite: int
+) -> None:
+    """Soumet la lecture d'un original à un ordonnanceur, s'il y en a un.
+
+    La taille entière du fichier est comptée, même quand seule la vignette EXIF
+    est lue : une borne haute qui ne fait qu'avantager les copies.
+    """
+    if ordonnanceur is None:
+        return
+    octets = os.stat(chemin).st_size
+    ordonnanceur.acquerir(octets=octets, operations=1, priorite=priorite)
+    ordonnanceur.enregistrer(octets=octets, operations=1)
+
+
+class MagasinVignettes:
+    """Vignettes JPEG persistantes, avec éviction LRU bornée en octets.
+
+    L'ordre d'utilisation est porté par la date de modification des fichiers :
+    il survit donc aux redémarrages. Cette date n'est rafraîchie qu'une fois
+    par jour au plus, pour que le navigateur garde sa copie en cache ; entre
+    deux, l'ordre exact n'est suivi qu'en mémoire.
+    """
+
+    def __init__(
+        self,
+        dossier: Optional[Path] = None,
+        budget_octets: Optional[int] = None,
+    ):
+        """Initialise le magasin et indexe les vignettes déjà présentes.
+
+        Args:
+            dossier: Dossier des vignettes (static/thumbnails par défaut)
+            budget_octets: Taille maximale occupée sur disque
+        """
+        self.dossier = Path(dossier) if dossier else dossier_vignettes()
+        self.budget_octets = budget_octets or THUMBNAIL_CONFIG["budget_octets"]
+        self.taille = 0
+        self.succes = 0
+        self.defauts = 0
+        self.evictions = 0
+        self._verrou = threading.Lock()
+        # nom de fichier -> (date de dernière utilisation, taille)
+        self._index: dict[str, tuple[int, int]] = {}
+
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        for entree in os.scandir(self.dossier):
+            if entree.is_file() and entree.name.endswith(".jpg"):
+                infos = entree.stat()
+                self._index[entree.name] = (infos.st_mtime_ns, infos.st_size)
+                self.taille += infos.st_size
+
+    @staticmethod
+    def cle(chemin: Path, taille: int) -> str:
+        """Nom de la vignette : empreinte de l'original et de la taille cible."""
+        infos = os.stat(chemin)
+        identite = (
+            f"{Path(chemin).resolve()}|{infos.st_size}|{infos.st_mtime_ns}|{taille}"
+        )
+        return hashlib.sha1(identite.encode("utf-8")).hexdigest() + ".jpg"
+
+    def fichier_vignette(
+        self, chemin: Path, taille: int, ordonnanceur: Optional[IOScheduler] = None
+    ) -> Path:
+        """Retourne le fichier de la vignette, générée si elle n'existe pas.
+
+        La lecture de l'original est soumise à l'ordonnanceur de la session
+        qui demande la vignette, s'il y en a un.
+        """
+        taille = taille_variante(taille)
+        nom = self.cle(chemin, taille)
+        fichier = self.dossier / nom
+
+        with self._verrou:
+            present = nom in self._index
+        if present and fichier.exists():
+            utilisation = self._toucher(fichier)
+            with self._verrou:
+                self.succes += 1
+                if nom in self._index:
+                    self._index[nom] = (utilisation, self._index[nom][1])
+            return fichier
+
+        # Génération hors verrou : les autres sessions ne sont pas bloquées
+        soumettre_lecture(ordonnanceur, chemin, PRIORITE_INTERACTIVE)
+        self.stocker(nom, creer_vignette(chemin, taille))
+        return fichier
+
+    def contient(self, chemin: Path, taille: int) -> bool:
+        """Indique si la vignette est déjà disponible (sans la générer)."""
+        nom = self.cle(chemin, taille_variante(taille))
+        with self._verrou:
+            return nom in self._index
+
+    def fichier_apercu(
+        self, chemin: Path, ordonnanceur: Optional[IOScheduler] = None
+    ) -> Optional[Path]:
+        """Retourne un aperçu tiré de la vignette EXIF, sans décoder l'image.
+
+        La vignette intégrée (environ 160x120) est conservée telle quelle avec
+        la plus petite variante.
+
+        Returns:
+            Fichier de l'aperçu JPEG, ou None si l'image n'a pas de vignette
+            intégrée exploitable (il faut alors générer une vraie vignette)
+        """
+        taille = taille_variante(THUMBNAIL_CONFIG["taille_apercu"])
+        if self.contient(chemin, taille):
+            return self.fichier_vignette(chemin, taille)
+
+        soumettre_lecture(ordonnanceur, chemin, PRIORITE_INTERACTIVE)
+        vignette = extraire_vignette_exif(chemin)
+        if vignette is None:
+            return None
+        nom = self.cle(chemin, taille)
+        self.stocker(nom, encoder_vignette(vignette))
+        return self.dossier / nom
+
+    def obtenir(self, chemin: Path, taille: int) -> bytes:
+        """Retourne la vignette JPEG d'une image."""
+        return self.fichier_vignette(chemin, taille).read_bytes()
+
+    def stocker(self, nom: str, donnees: bytes) -> None:
+        """Écrit une vignette (de façon atomique) puis applique le budget.
+
+        Chaque vignette stockée compte comme un défaut : elle a dû être générée,
+        ici ou dans le pool de préchargement.
+        """
+        fichier = self.dossier / nom
+        temporaire = fichier.with_suffix(f".{threading.get_ident()}.tmp")
+        temporaire.write_bytes(donnees)
+        os.replace(temporaire, fichier)
+
+        with self._verrou:
+            ancienne = self._index.get(nom)
+            if ancienne is not None:
+                self.taille -= ancienne[1]
+            self._index[nom] = (fichier.stat().st_mtime_ns, len(donnees))
+            self.taille += len(donnees)
+            self.defauts += 1
+            self._evincer(garder=nom)
+
+    def _evincer(self, garder: str) -> None:
+        """Supprime les vignettes les moins récemment utilisées (verrou tenu).
+
+        L'éviction descend sous 90 % du budget pour ne pas retrier l'index à
+        chaque nouvelle vignette.
+        """
+        if self.taille <= self.budget_octets:
+            return
+        cible = int(self.budget_octets * 0.9)
+        for nom, (_, taille) in sorted(self._index.items(), key=lambda e: e[1][0]):
+            if self.taille <= cible:
+                break
+            if nom == garder:
+                continue
+            try:
+                (self.dossier / nom).unlink()
+            except FileNotFoundError:
+                pass
+            del self._index[nom]
+            self.taille -= taille
+            self.evictions += 1
+
+    @staticmethod
+    def _toucher(fichier: Path) -> int:
+        """Marque une vignette comme utilisée ; retourne la date d'utilisation.
+
+        Le fichier n'est modifié que si sa date a plus de DELAI_TOUCHER_NS.
+        """
+        maintenant = time.time_ns()
+        try:
+            if maintenant - fichier.stat().st_mtime_ns >= DELAI_TOUCHER_NS:
+                os.utime(fichier)
+        except FileNotFoundError:
+            return 0
+        return maintenant
+
+    def statistiques(self) -> dict[str, int]:
+        """Retourne les compteurs du magasin."""
+        with self._verrou:
+            return {
+                "vignettes": len(self._index),
+                "taille": self.taille,
+                "budget": self.budget_octets,
+                "succes": self.succes,
+                "defauts": self.defauts,
+                "evictions": self.evictions,
+            }
+
+
+class PrechargeurVignettes:
+    """Génère les vignettes à l'avance dans un pool de processus.
+
+    Le décodage JPEG occupe alors tous les cœurs au lieu du seul thread du
+    script. Les demandes sont servies par priorité (page affichée, puis page
+    suivante), puis de la plus récente à la plus ancienne : une nouvelle page
+    passe devant les préchargements de la précédente.
+    Seules `2 * workers` tâches sont confiées au pool à la fois pour que cet
+    ordre reste respecté. Les vignettes produites vont dans le magasin.
+    """
+
+    def __init__(self, magasin: MagasinVignettes, workers: Optional[int] = None):
+        """Initialise le préchargeur (le pool est créé à la première demande).
+
+        Args:
+            magasin: Magasin où ranger les vignettes générées
+            workers: Nombre de processus (un par cœur par défaut)
+        """
+        self.magasin = magasin
+        self.workers = (
+            workers or THUMBNAIL_CONFIG["workers_prechargement"] or os.cpu_count() or 1
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # (priorité, -génération, ordre, nom, chemin, taille, ordonnanceur)
+        self._file: list[tuple] = []
+        # nom de vignette -> résultat attendu (chemin du fichier de vignette)
+        self._attentes: dict[str, Future] = {}
+        self._soumis: set[str] = set()
+        self._generation = 0
+        self._ordre = itertools.count()
+        self._condition = threading.Condition()
+        self._alimentation: Optional[threading.Thread] = None
+
+    def demander(
+        self,
+        chemins: Iterable[Path],
+        taille: int,
+        priorite: int = PRIORITE_NORMALE,
+        ordonnanceur: Optional[IOScheduler] = None,
+    ) -> None:
+        """Met en file la génération des vignettes absentes du magasin.
+
+        La lecture des originaux est soumise à l'ordonnanceur de la session
+        demandeuse, à la priorité de la demande.
+        """
+        taille = taille_variante(taille)
+        a_generer = []
+        for chemin in chemins:
+            try:
+                nom = self.magasin.cle(chemin, taille)
+            except OSError:
+                continue
+            if not self.magasin.contient(chemin, taille):
+                a_generer.append((nom, chemin))
+        if not a_generer:
+            return
+
+        with self._condition:
+            self._generation += 1
+            for nom, chemin in a_generer:
+                self._attentes.setdefault(nom, Future())
+                # Une demande déjà en file est simplement reclassée
+                heapq.heappush(
+                    self._file,
+                    (
+                        priorite,
+                        -self._generation,
+                        next(self._ordre),
+                        nom,
+                        chemin,
+                        taille,
+                        ordonnanceur,
+                    ),
+                )
+            self._demarrer()
+            self._condition.notify()
+
+    def fichier_vignette(
+        self, chemin: Path, taille: int, ordonnanceur: Optional[IOScheduler] = None
+    ) -> Path:
+        """Retourne le fichier de la vignette, en attendant le pool si besoin.
+
+        Une vignette non demandée (ou dont la génération a échoué dans le
+        pool) est générée directement.
+        """
+        taille = taille_variante(taille)
+        nom = self.magasin.cle(chemin, taille)
+        with self._condition:
+            attente = self._attentes.get(nom)
+        if attente is not None:
+            try:
+                return attente.result(timeout=DELAI_ATTENTE)
+            except Exception:
+                pass
+        return self.magasin.fichier_vignette(chemin, taille, ordonnanceur)
+
+    def obtenir(self, chemin: Path, taille: int) -> bytes:
+        """Retourne la vignette JPEG, en attendant le pool si besoin."""
+        return self.fichier_vignette(chemin, taille).read_bytes()
+
+    def _demarrer(self) -> None:
+        """Crée le pool et le thread d'alimentation (condition tenue)."""
+        if self._pool is None:
+            # spawn : pas de fork d'un processus serveur multi-threadé
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        if self._alimentation is None or not self._alimentation.is_alive():
+            self._alimentation = threading.Thread(
+                target=self._alimenter, name="prechargement-vignettes", daemon=True
+            )
+            self._alimentation.start()
+
+    def _alimenter(self) -> None:
+        """Confie au pool les demandes les plus prioritaires, au fil de l'eau."""
+        while True:
+            with self._condition:
+                while not self._file or len(self._soumis) >= 2 * self.workers:
+                    self._condition.wait()
+                priorite, _, _, nom, chemin, taille, ordonnanceur = heapq.heappop(
+                    self._file
+                )
+                attente = self._attentes.get(nom)
+                if attente is None or attente.done() or nom in self._soumis:
+                    continue
+                self._soumis.add(nom)
+
+            try:
+                # Les lectures du pool cèdent la place selon leur priorité
+                soumettre_lecture(ordonnanceur, chemin, priorite)
+                tache = self._pool.submit(creer_vignette, chemin, taille)
+            except (OSError, RuntimeError) as e:  # original absent, pool cassé
+                self._terminer(nom, erreur=e)
+                continue
+            tache.add_done_callback(
+                lambda tache, nom=nom: self._terminer(nom, tache=tache)
+            )
+
+    def _terminer(
+        self,
+        nom: str,
+        tache: Optional[Future] = None,
+        erreur: Optional[BaseException] = None,
+    ) -> None:
+        """Range une vignette générée et libère sa place dans le pool."""
+        if erreur is None:
+            try:
+                self.magasin.stocker(nom, tache.result())
+            except Exception as e:
+                erreur = e
+
+        with self._condition:
+            attente = self._attentes.pop(nom, None)
+            self._soumis.discard(nom)
+            self._condition.notify()
+        if attente is None:
+            return
+        if erreur is None:
+            attente.set_result(self.magasin.dossier / nom)
+        else:
+            attente.set_exception(erreur)
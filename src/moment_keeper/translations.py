@@ -23,7 +23,7 @@ TRANSLATIONS = {
         "videos": "🎬 Vidéos",
         "no_type_selected": "⚠️ Veuillez sélectionner au moins un type de fichier",
         "reset_button": "🔄 Réinitialiser",
-        "reset_help": "Remet tous les fichiers dans le dossier source",
+        "reset_help": "Remet tous les fichiers dans le dossier source ; les copies vérifiées dont l'original y est resté sont supprimées",
         # Tabs
         "tab_home": "🏠 Accueil",
         "tab_simulation": "🔍 Simulation",
@@ -65,7 +65,7 @@ TRANSLATIONS = {
         "gallery_title": "🖼️ <strong>Galerie</strong><br>Explorez vos souvenirs de 🦖 par mois !",
         "select_month": "📅 Sélectionner le mois",
         "all_months": "Tous les mois",
-        "photos_to_show": "📸 Nombre de photos à afficher",
+        "photos_per_page": "📸 Photos par page",
         "refresh_gallery": "🔄 Nouvelles photos",
         "no_photos_month": "Aucune photo trouvée pour ce mois",
         "photos_found": "{count} photos trouvées",
@@ -189,6 +189,25 @@ TRANSLATIONS = {
         "folder_selection_timeout": "Le sélecteur de dossier ne répond pas",
         "folder_selection_cancelled": "Sélection annulée",
         "folder_selection_tip": "Vous pouvez taper directement le chemin du dossier dans le champ texte",
+        # Organisation - mode économe
+        "eco_mode": "🐢 Mode économe (NAS partagé)",
+        "eco_mode_help": "Limite le débit et le nombre d'opérations par seconde pour ne pas saturer le réseau pendant la journée",
+        "eco_mode_bandwidth": "Débit max (Mo/s)",
+        "eco_mode_iops": "Opérations max par seconde",
+        "organize_progress": "🦖 {done}/{total} fichiers • {speed:.1f} Mo/s • {ops:.0f} op/s",
+        # Organisation - copie vérifiée
+        "copy_mode": "📋 Copier (conserver les originaux)",
+        "copy_mode_help": "Copie les fichiers au lieu de les déplacer (ex: depuis une carte mémoire), vérifie chaque copie par empreinte et l'enregistre dans le manifeste",
+        # Instantané des données d'analyse
+        "snapshot_refreshing": "🔄 Données issues du dernier instantané, mise à jour en arrière-plan… Rechargez la page pour voir les changements récents.",
+        # Navigation
+        "navigation": "Navigation",
+        # Galerie - cache des vignettes
+        "thumbnail_cache_stats": "🗃️ Cache des vignettes : {count} vignettes, {size:.1f} / {budget:.0f} Mo · {hits} succès, {misses} défauts, {evictions} évictions",
+        # Galerie - pagination
+        "previous_page": "◀ Précédente",
+        "next_page": "Suivante ▶",
+        "gallery_page": "Page {page}",
     },
     "en": {
         # App principale
@@ -212,7 +231,7 @@ TRANSLATIONS = {
         "videos": "🎬 Videos",
         "no_type_selected": "⚠️ Please select at least one file type",
         "reset_button": "🔄 Reset",
-        "reset_help": "Puts all files back in the source folder",
+        "reset_help": "Puts all files back in the source folder; verified copies whose original is still there are deleted",
         # Tabs
         "tab_home": "🏠 Home",
         "tab_simulation": "🔍 Simulation",
@@ -254,7 +273,7 @@ TRANSLATIONS = {
         "gallery_title": "🖼️ <strong>Gallery</strong><br>Explore your 🦖 memories by month!",
         "select_month": "📅 Select month",
         "all_months": "All months",
-        "photos_to_show": "📸 Number of photos to display",
+        "photos_per_page": "📸 Photos per page",
         "refresh_gallery": "🔄 New photos",
         "no_photos_month": "No photos found for this month",
         "photos_found": "{count} photos found",
@@ -378,6 +397,25 @@ TRANSLATIONS = {
         "folder_selection_timeout": "Folder selector not responding",
         "folder_selection_cancelled": "Selection cancelled",
         "folder_selection_tip": "You can type the folder path directly in the text field",
+        # Organization - eco mode
+        "eco_mode": "🐢 Eco mode (shared NAS)",
+        "eco_mode_help": "Limits bandwidth and operations per second so the network is not saturated during the day",
+        "eco_mode_bandwidth": "Max bandwidth (MB/s)",
+        "eco_mode_iops": "Max operations per second",
+        "organize_progress": "🦖 {done}/{total} files • {speed:.1f} MB/s • {ops:.0f} op/s",
+        # Organization - verified copy
+        "copy_mode": "📋 Copy (keep the originals)",
+        "copy_mode_help": "Copies files instead of moving them (e.g. from a memory card), verifies each copy by checksum and records it in the manifest",
+        # Analytics data snapshot
+        "snapshot_refreshing": "🔄 Showing the last snapshot while it refreshes in the background… Reload the page to see recent changes.",
+        # Navigation
+        "navigation": "Navigation",
+        # Gallery - thumbnail cache
+        "thumbnail_cache_stats": "🗃️ Thumbnail cache: {count} thumbnails, {size:.1f} / {budget:.0f} MB · {hits} hits, {misses} misses, {evictions} evictions",
+        # Gallery - pagination
+        "previous_page": "◀ Previous",
+        "next_page": "Next ▶",
+        "gallery_page": "Page {page}",
     },
 }
 
@@ -0,0 +1,56 @@
+"""L'état analytique incrémental doit rester identique à un recalcul complet."""
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.moment_keeper.analytics import EtatAnalytique
+from src.moment_keeper.organizer import OrganisateurPhotos
+
+BIRTH_DATE = datetime(2023, 1, 15)
+
+
+def create_test_files(photos_dir: Path, count: int) -> None:
+    """Crée des photos, vidéos et fichiers ignorés (sans date, avant naissance)."""
+    photos_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(42)
+    for i in range(count):
+        date = BIRTH_DATE + timedelta(days=rng.randrange(-30, 700))
+        tirage = rng.random()
+        if tirage < 0.05:
+            nom = f"IMG_{i:06d}.jpg"
+        elif tirage < 0.25:
+            nom = f"{date:%Y%m%d}_video_{i:06d}.mp4"
+        else:
+            nom = f"{date:%Y%m%d}_photo_{i:06d}.jpg"
+        (photos_dir / nom).write_bytes(b"x" * rng.randrange(10, 200))
+
+
+def test_etat_incremental_coherent(tmp_path):
+    """Organisation, réinitialisation et copie gardent l'état cohérent."""
+    create_test_files(tmp_path / "photos", 500)
+    organiseur = OrganisateurPhotos(tmp_path, "photos", BIRTH_DATE)
+    etat = EtatAnalytique(organiseur)
+    organiseur.ecouteurs.append(etat.recevoir)
+    attendus = len(organiseur.planifier().deplacements)
+    assert attendus > 0
+
+    etapes = [
+        (organiseur.organiser, False),
+        (organiseur.reinitialiser, True),
+        (organiseur.organiser_par_copie, False),
+        (organiseur.reinitialiser, True),
+    ]
+    for etape, est_reinitialisation in etapes:
+        compteur, erreurs = etape()
+        assert erreurs == []
+        assert compteur == attendus
+
+        dossiers = [d.name for d in tmp_path.iterdir() if d.is_dir()]
+        if est_reinitialisation:
+            assert dossiers == ["photos"]
+        else:
+            assert len(dossiers) > 1
+
+        etat.appliquer()
+        assert etat.verifier_coherence() == []
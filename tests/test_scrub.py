@@ -0,0 +1,42 @@
+"""Le manifeste suit l'organisateur : le scrub ne signale aucun faux manquant."""
+
+from src.moment_keeper.checksums import Manifeste
+from src.moment_keeper.organizer import OrganisateurPhotos
+from src.moment_keeper.scrub import scrub
+
+from .test_incremental_analytics import BIRTH_DATE, create_test_files
+
+
+def test_scrub_apres_copie_et_reinitialisation(tmp_path):
+    """Organisation, copie, scrub, réinitialisation puis scrub sans manquant."""
+    create_test_files(tmp_path / "photos", 200)
+    organiseur = OrganisateurPhotos(tmp_path, "photos", BIRTH_DATE)
+
+    assert organiseur.organiser()[1] == []
+    assert organiseur.reinitialiser()[1] == []
+    copies, erreurs = organiseur.organiser_par_copie()
+    assert erreurs == []
+
+    rapport = scrub(tmp_path)
+    assert rapport.manquants == [] and rapport.corrompus == []
+    assert rapport.verifies == copies and rapport.nouveaux == 0
+
+    assert organiseur.reinitialiser()[1] == []
+    assert Manifeste(tmp_path).fichiers == {}
+    rapport = scrub(tmp_path)
+    assert rapport.manquants == [] and rapport.verifies == 0
+
+
+def test_scrub_apres_reorganisation(tmp_path):
+    """Les entrées suivent les fichiers déplacés puis disparaissent au reset."""
+    create_test_files(tmp_path / "photos", 200)
+    organiseur = OrganisateurPhotos(tmp_path, "photos", BIRTH_DATE)
+
+    deplaces, _ = organiseur.organiser()
+    assert scrub(tmp_path).nouveaux == deplaces
+    assert organiseur.reinitialiser()[1] == []
+    assert Manifeste(tmp_path).fichiers == {}
+
+    organiseur.organiser()
+    rapport = scrub(tmp_path)
+    assert rapport.manquants == [] and rapport.nouveaux == deplaces